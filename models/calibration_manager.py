@@ -0,0 +1,316 @@
+# =============================================================================
+# calibration_manager.py
+#
+# created  19 October 2026 Lungsi
+#
+# This py-file contains the parameter sensitivity and calibration driver of
+# PC2015Masoli. The conductance densities in pc_param (PC_param.py) are
+# treated as a parameter vector which is set in the live cell with
+# PurkinjeCell.set_pc_param, so no file is edited and no cell is rebuilt.
+# Candidates are evaluated in parallel by warm worker processes (see
+# sweep_manager) and a candidate failing a cheap check in the first
+# screen["time"] ms (silent or in depolarization block) is rejected
+# without simulating the rest of the protocol.
+#
+# from models import calibration_manager
+#
+# and individual calibration_manager initiated by:
+#
+# 1. calibration_manager.get_parameter_vector ( names=None )
+#    note: Returns (names, values) of pc_param. By default all the
+#          conductances, that is, every key but "eleak".
+#
+# 2. calibration_manager.local_sensitivity ( names=None,
+#                                   protocol_name="02_spontaneous_fire",
+#                                   step=0.05 )
+#    note: Central finite differences; every parameter is scaled by
+#          (1 +/- step) one at a time. Returns the relative sensitivity
+#          d(log feature)/d(log parameter) for each parameter and feature;
+#          for a feature whose baseline is 0 (say, no spikes) the absolute
+#          sensitivity d(feature)/d(log parameter) instead ("absolute").
+#          If the baseline itself is rejected ("baseline_rejected") the
+#          features and sensitivities are NaN.
+#
+# 3. calibration_manager.calibrate ( targets={"rate": (40.0, 5.0)},
+#                                    names=["Nav1.6Soma", "Kv3.4Soma"],
+#                                    bounds=(0.5, 2.0) )
+#    note: Population-based (differential evolution) search of the
+#          scaling factors of names within bounds (relative to pc_param)
+#          minimising sum( ((feature - mean) / sd)**2 ) over targets.
+#          Returns the best parameters, its cost and the store of every
+#          evaluated candidate.
+#
+# The features are computed by feature_function(time, responses,
+# cell_regions) returning a dictionary; firing_features by default.
+#
+# Runs may also end early with stop_criteria (see simulation_manager), for
+# eg. stop_criteria=[stop_on_periodic_firing()] once the firing settles.
+# Features are then computed on the truncated run and the store column
+# "truncated" (if any) holds 1.0 for those candidates.
+#
+# =============================================================================
+
+import copy
+
+from neuron import h
+import numpy as np
+
+from .cells.PC2015Masoli_model import PurkinjeCell
+from .cells.PC2015Masoli.PC_param import pc_param
+from .protocol_manager import load_protocol
+from .protocol_manager import apply_protocol
+from .feature_manager import detect_spikes
+from .simulation_manager import StopMonitor
+from .simulation_manager import continue_with_stop_criteria
+from .simulation_manager import get_recordings
+from .simulation_manager import get_recorded_time
+from .simulation_manager import vector_as_numpy
+from .sweep_manager import SweepResultStore
+from .sweep_manager import make_sweep_pool
+from .sweep_manager import run_parallel_sweep
+
+
+# cheap checks in the first screen["time"] ms of a run
+default_screen = { "time": 200.0,          # ms
+                   "threshold": 0.0,       # mV, spike threshold at soma
+                   "block_window": 50.0,   # ms
+                   "block_voltage": -40.0 }# mV
+
+
+def get_parameter_vector(names=None):
+    """
+    Use case: names, values = get_parameter_vector()
+    """
+    if names is None:
+        names = sorted( [ key for key in pc_param if key != "eleak" ] )
+    return list(names), np.array([ pc_param[key] for key in names ], dtype=float)
+
+
+def firing_features(time, responses, cell_regions):
+    """
+    Use case: firing_features( time, {"vm_soma": vm}, {"vm_soma": 0.0} )
+    Returns the firing "rate" (Hz) and "isi_cv" at vm_soma.
+    """
+    spikes = detect_spikes( time, responses["vm_soma"],
+                            cell_regions.get("vm_soma", 0.0) )[2]
+    isi = np.diff(spikes)
+    return { "rate": 1000.0 * len(spikes) / (time[-1] - time[0]),
+             "isi_cv": np.std(isi) / np.mean(isi) if len(isi) > 1 else np.nan }
+
+
+def screen_response(time, vm, screen):
+    """
+    Use case: screen_response( time, vm, default_screen )
+    Returns "silent", "depolarization_block" or None (passed).
+    """
+    spikes = detect_spikes(time, vm, screen["threshold"])[2]
+    if len(spikes) == 0:
+        if np.mean( vm[time >= time[-1] - screen["block_window"]] ) > screen["block_voltage"]:
+            return "depolarization_block"
+        return "silent"
+    if spikes[-1] < time[-1] - screen["block_window"]:
+        if np.mean( vm[time >= time[-1] - screen["block_window"]] ) > screen["block_voltage"]:
+            return "depolarization_block"
+    return None
+
+
+def run_screened_protocol(model, protocol, screen=None, stop_criteria=None):
+    """
+    Use case: time, responses, rejected = run_screened_protocol( pc, protocol )
+    where rejected is the reason (see screen_response) or None. time and
+    responses are views of the recordings, valid until the next run.
+    With stop_criteria the run past the screen may end early; the reason
+    is then in model.predictions["truncated"] (False otherwise).
+    The capabilities of the protocol are left applied (model.undo).
+    """
+    stimuli = apply_protocol(model, protocol)
+    monitor = None
+    if stop_criteria is not None:
+        monitor = StopMonitor( h, model.cell.soma, model.cell.vm_soma,
+                               stop_criteria,
+                               threshold=model.cell_regions.get("vm_soma", 0.0) )
+    try:
+        h.stdinit()
+        rejected = None
+        if screen is not None and screen["time"] < h.tstop:
+            h.continuerun(screen["time"])
+            rejected = screen_response( get_recorded_time(model),
+                                        vector_as_numpy(model.cell.vm_soma),
+                                        screen )
+        model.predictions["truncated"] = False
+        if rejected is None:
+            if monitor is None:
+                h.continuerun(h.tstop)
+            elif continue_with_stop_criteria(h, monitor, h.tstop) is not None:
+                model.predictions["truncated"] = {"reason": monitor.reason,
+                                                  "t_stop": h.t}
+    finally:
+        if monitor is not None:
+            monitor.close()
+    time, responses = get_recordings(model)
+    del stimuli
+    return time, responses, rejected
+
+
+def evaluate_job(model, store, job_index, job):
+    """
+    job_function of sweep_manager.run_parallel_sweep; job is the dictionary
+    {"parameters": {...}, "protocol": {...}, "screen": {...},
+     "feature_function": firing_features, "stop_criteria": None}
+    """
+    model.set_pc_param(pc_param)            # back to the published values
+    model.set_pc_param(job["parameters"])
+    depth = len(model.transactions)
+    try:
+        time, responses, rejected = run_screened_protocol( model, job["protocol"],
+                                                           job["screen"],
+                                                           job.get("stop_criteria") )
+    finally:
+        # the capabilities (knockouts) of the protocol, for the next job
+        model.undo( len(model.transactions) - depth )
+    values = {"rejected": 0.0 if rejected is None else 1.0}
+    if "truncated" in store.columns:
+        values["truncated"] = 1.0 if model.predictions["truncated"] else 0.0
+    if rejected is None:
+        features = job["feature_function"](time, responses, model.cell_regions)
+        for name in store.columns:
+            if name in features:
+                values[name] = features[name]
+    store.write(job_index, values)
+
+
+def _make_jobs(names, vectors, protocol, screen, feature_function,
+               stop_criteria=None):
+    return [ { "parameters": dict( zip(names, vector) ),
+               "protocol": protocol,
+               "screen": screen,
+               "feature_function": feature_function,
+               "stop_criteria": stop_criteria }
+             for vector in vectors ]
+
+
+def local_sensitivity( names=None, protocol_name="02_spontaneous_fire",
+                       step=0.05, feature_function=firing_features,
+                       feature_names=("rate", "isi_cv"),
+                       screen=default_screen, stop_criteria=None,
+                       processes=None ):
+    """
+    Use case: local_sensitivity( names=["Nav1.6Soma", "Kv3.4Soma"],
+                                 protocol_name="02_spontaneous_fire" )
+    Returns {"names": [...], "feature_names": [...], "baseline": array,
+             "sensitivity": array (len(names), len(feature_names)),
+             "absolute": array (len(feature_names),), True where the
+             baseline is 0 and the sensitivity is not divided by it,
+             "baseline_rejected": True/False,
+             "rejected": array (2*len(names),)}
+    """
+    names, values = get_parameter_vector(names)
+    protocol = load_protocol( model_scale="cells", model_name="PC2015Masoli",
+                              protocol_name=protocol_name )
+    # baseline, then (+step, -step) for each parameter
+    vectors = [values]
+    for i in range(len(names)):
+        for sign in (1.0, -1.0):
+            vector = values.copy()
+            vector[i] *= (1.0 + sign * step)
+            vectors.append(vector)
+    feature_names = list(feature_names)
+    store = SweepResultStore.create( n_jobs=len(vectors),
+                                     columns=feature_names + ["rejected",
+                                                              "truncated"] )
+    run_parallel_sweep( evaluate_job,
+                        _make_jobs(names, vectors, protocol, screen,
+                                   feature_function, stop_criteria),
+                        store, model_factory=PurkinjeCell, processes=processes )
+    features = np.column_stack([ store.column(name) for name in feature_names ])
+    baseline = features[0]
+    plus = features[1::2]
+    minus = features[2::2]
+    absolute = baseline == 0
+    sensitivity = (plus - minus) / (2.0 * step)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sensitivity = np.where( absolute, sensitivity, sensitivity / baseline )
+    result = { "names": names, "feature_names": feature_names,
+               "baseline": baseline.copy(), "sensitivity": sensitivity,
+               "absolute": absolute,
+               "baseline_rejected": bool(store.column("rejected")[0]),
+               "rejected": np.array(store.column("rejected")[1:]) }
+    store.unlink()
+    return result
+
+
+def compute_cost(features, feature_names, targets):
+    """
+    Use case: compute_cost( features, ["rate"], {"rate": (40.0, 5.0)} )
+    where features is (n_candidates, len(feature_names)). NaN => inf
+    """
+    cost = np.zeros(len(features))
+    for name, (mean, sd) in targets.items():
+        cost += ( (features[:, feature_names.index(name)] - mean) / sd )**2
+    cost[np.isnan(cost)] = np.inf
+    return cost
+
+
+def calibrate( targets, names=None, bounds=(0.5, 2.0),
+               protocol_name="02_spontaneous_fire", population_size=16,
+               generations=20, mutation=0.5, crossover=0.9, seed=None,
+               feature_function=firing_features, screen=default_screen,
+               stop_criteria=None, processes=None ):
+    """
+    Use case: best_parameters, best_cost, store = \\
+                  calibrate( {"rate": (40.0, 5.0), "isi_cv": (0.05, 0.02)},
+                             names=["Nav1.6Soma", "Kv3.4Soma", "Kca1.1Soma"] )
+    Rejected candidates (see default_screen) have infinite cost.
+    store.column(...) holds every candidate, generation after generation;
+    store.unlink() when done.
+    """
+    rng = np.random.RandomState(seed)
+    names, values = get_parameter_vector(names)
+    protocol = load_protocol( model_scale="cells", model_name="PC2015Masoli",
+                              protocol_name=protocol_name )
+    feature_names = list(targets)
+    n = len(names)
+    lower, upper = np.log(bounds[0]), np.log(bounds[1])
+    store = SweepResultStore.create( n_jobs=population_size * (generations + 1),
+                                     columns=feature_names + ["rejected",
+                                                              "truncated"] )
+    pool = make_sweep_pool( store, model_factory=PurkinjeCell,
+                            processes=processes )
+
+    def evaluate(log_factors, first_job_index):
+        vectors = values * np.exp(log_factors)
+        run_parallel_sweep( evaluate_job,
+                            _make_jobs(names, vectors, protocol, screen,
+                                       feature_function, stop_criteria),
+                            store, pool=pool, first_job_index=first_job_index )
+        rows = slice(first_job_index, first_job_index + len(vectors))
+        features = np.column_stack([ store.column(name)[rows]
+                                     for name in feature_names ])
+        return compute_cost(features, feature_names, targets)
+
+    try:
+        # differential evolution (rand/1/bin) on the log of the factors
+        population = rng.uniform(lower, upper, (population_size, n))
+        cost = evaluate(population, 0)
+        for generation in range(1, generations + 1):
+            donors = np.array([ rng.choice( np.delete(np.arange(population_size), i),
+                                            3, replace=False )
+                                for i in range(population_size) ])
+            mutant = ( population[donors[:, 0]]
+                       + mutation * (population[donors[:, 1]] - population[donors[:, 2]]) )
+            cross = rng.uniform(size=(population_size, n)) < crossover
+            cross[np.arange(population_size), rng.randint(n, size=population_size)] = True
+            trial = np.clip( np.where(cross, mutant, population), lower, upper )
+            trial_cost = evaluate(trial, generation * population_size)
+            improved = trial_cost <= cost
+            population[improved] = trial[improved]
+            cost[improved] = trial_cost[improved]
+            print ("generation %d: best cost %s" % (generation, cost.min()))
+    finally:
+        pool.close()
+        pool.join()
+    best = np.argmin(cost)
+    best_parameters = dict( zip(names, values * np.exp(population[best])) )
+    return best_parameters, cost[best], store
+#
+#
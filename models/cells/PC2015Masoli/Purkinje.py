@@ -11,15 +11,91 @@ import os # add-on to the original Purkinje.py
 from PC_param import pc_param 
 
 
+# =======Add-on to original Purkinje.py=======
+# pc_param conductances of the dendrites, in the order of g in dend_hoc
+dend_conductances = ( 'eleak', 'Cav2.1Dend', 'Kca1.1Dend', 'Kv4.3Dend',
+                      'Kv1.1Dend', 'Kv1.5Dend', 'Kv3.3Dend', 'Cav3.3Dend',
+                      'HCNDend', 'Cav3.2Dend', 'Kca3.1Dend', 'Cav3.1Dend',
+                      'Kca2.2Dend', 'PC_KirDend', 'Nav1.6Dend' )
+
+# The loops over the dendrites of Purkinje.build_dendrites, the channels as
+# in the original Purkinje.py. $o1 is the SectionList of the dendrites,
+# m has one row per dendrite: x1 y1 z1 diam1 x2 y2 z2 diam2 and the
+# Nannuli Buffnull2 rf3 rf4 of cdp5; g the dend_conductances.
+dend_hoc = """
+proc pc_build_dendrites() { local i  localobj m, g
+    m = $o2
+    g = $o3
+    i = 0
+    forsec $o1 {
+        pt3dclear()
+        pt3dadd(m.x[i][0], m.x[i][1], m.x[i][2], m.x[i][3])
+        pt3dadd(m.x[i][4], m.x[i][5], m.x[i][6], m.x[i][7])
+        diam = m.x[i][3]
+        insert cdp5
+        Nannuli_cdp5 = m.x[i][8]
+        Buffnull2_cdp5 = m.x[i][9]
+        rf3_cdp5 = m.x[i][10]
+        rf4_cdp5 = m.x[i][11]
+        Ra = 122
+        insert Leak  e_Leak = g.x[0]
+        insert Cav2_1  pcabar_Cav2_1 = g.x[1]
+        insert Kca1_1  gbar_Kca1_1 = g.x[2]
+        insert Kv4_3  gkbar_Kv4_3 = g.x[3]
+        insert Kv1_1  gbar_Kv1_1 = g.x[4]
+        insert Kv1_5  gKur_Kv1_5 = g.x[5]
+        insert Kv3_3  gbar_Kv3_3 = g.x[6]
+        insert Cav3_3  pcabar_Cav3_3 = g.x[7]
+        insert HCN1  gbar_HCN1 = g.x[8]
+        eh = -34.4
+        TotalPump_cdp5 = 2e-8
+        if (diam >= 3.5 && diam <= 12) {
+            insert Cav3_2  gcabar_Cav3_2 = g.x[9]
+            insert Kca3_1  gkbar_Kca3_1 = g.x[10]
+            insert Cav3_1  pcabar_Cav3_1 = g.x[11]
+            insert Kca2_2  gkbar_Kca2_2 = g.x[12]
+            insert Kir2_3  gkbar_Kir2_3 = g.x[13]
+            if (diam >= 8 && diam <= 12) {
+                insert Nav1_6  gbar_Nav1_6 = g.x[14]
+                ena = 60
+            }
+        }
+        ek = -88
+        eca = 137.52625
+        cai = cai0_ca_ion
+        cao = cao0_ca_ion
+        ion_style("ca_ion", 1, 1, 0, 1, 0)
+        i += 1
+    }
+}
+
+// $o2 cm and $o3 gmax_Leak of each dendrite (-1: left as is), then
+// gmax_Leak is multiplied by $o4
+proc pc_set_dend_passive() { local i  localobj c, g, f
+    c = $o2
+    g = $o3
+    f = $o4
+    i = 0
+    forsec $o1 {
+        if (c.x[i] >= 0) cm = c.x[i]
+        if (g.x[i] >= 0) gmax_Leak = g.x[i]
+        gmax_Leak = gmax_Leak * f.x[i]
+        i += 1
+    }
+}
+"""
+
+
 class Purkinje:
-    def __init__(self):
+    def __init__(self, dir_path=None):
 
         # =======Add-on to original Purkinje.py=======
-        #cwd = os.getcwd() # this is the root
-        #path_to_files = cwd + os.sep + "models" + \
-        #              os.sep + "cells" + os.sep + \
-        #              "PC2015Masoli" + os.sep
-        #os.chdir(path_to_files) # change to path_to_files
+        # The data files (coordinate.csv, ...) are read from dir_path,
+        # by default the directory of this file, instead of the working
+        # directory; so no os.chdir is needed to build the cell.
+        if dir_path is None:
+            dir_path = os.path.dirname(os.path.abspath(__file__))
+        self.dir_path = dir_path
         # ==============End of the Add-on=============
 
 #Soma        
@@ -94,127 +170,9 @@ class Purkinje:
         self.soma.cao = h.cao0_ca_ion
         h.pop_section()
 	
-#Dend coordinate
-	self.sectioncoordinate = np.genfromtxt("coordinate.csv")
-
-	fh = open("PC_dendnames.dlist")
-        self.dendnames = [line[:-1] for line in fh.readlines()]
-	
-	self.dend = []
-	for i_idx,i in enumerate(self.sectioncoordinate):
-	    self.dend.append(h.Section(name=self.dendnames[i_idx]))
-	    self.dend[-1].push()
-	    h.pt3dclear()
-	    h.pt3dadd(i.item(1), i.item(2), i.item(3), i.item(4))
-	    h.pt3dadd(i.item(5), i.item(6), i.item(7), i.item(8))
-	    self.dend[-1].diam = i.item(4)
-
-	    self.dend[-1].insert('cdp5')
-	    self.dend[-1].Nannuli_cdp5 = 0.326 + (1.94 * (i.item(8))) + (0.289*(i.item(8))*(i.item(8))) - ((3.33e-2)*(i.item(8))*(i.item(8))*(i.item(8))) + ((1.55e-3)*(i.item(8))*(i.item(8))*(i.item(8))*(i.item(8))) - (2.55e-5*(i.item(8))*(i.item(8))*(i.item(8))*(i.item(8))*(i.item(8)))
-	    self.dend[-1].Buffnull2_cdp5 = 64.2 - 57.3* math.exp(-(i.item(8))/1.4)
-	    self.dend[-1].rf3_cdp5 = 0.162 - 0.106* math.exp(-(i.item(8))/2.29)
-	    if ((i.item(8))>=2):
-	      self.dend[-1].rf4_cdp5 = 0.000267 + 0.0167* math.exp(-(i.item(8))/0.722) + 0.0028* math.exp(-(i.item(8))/4)
-	    else:
-	      self.dend[-1].rf4_cdp5 = 0.003
-	    
-	    h.pop_section()
-
-#Connection between dend and soma  
-	self.dend[0].connect(self.soma,1,0)
-
-#Connection between each dend	
-	for c in np.genfromtxt("connections.csv"):
-	    self.dend[int(c[0])].connect(self.dend[int(c[2])],int(c[3]),int(c[1]))
-	   
-
-	self.subsets = np.genfromtxt("ModelViewParmSubset.txt", dtype = int)
-	self.ModelViewParmSubset = [[self.dend[int(i)] for i in self.subsets[np.where(self.subsets[...,1]==M),0][0]] for M in range(88) ]
-	for d in self.dend:
-	    
-	    d.Ra = 122
-	     
-	    d.insert('Leak')
-	    d.e_Leak = pc_param['eleak']
-   
-	    d.insert('Cav2_1') 
-	    d.pcabar_Cav2_1 = pc_param['Cav2.1Dend']
-	   
-	    d.insert('Kca1_1')
-	    d.gbar_Kca1_1 = pc_param['Kca1.1Dend']
-	    
-	    d.insert('Kv4_3')
-	    d.gkbar_Kv4_3 = pc_param['Kv4.3Dend']
+#Dend coordinate, topology and channels (see build_dendrites)
+	self.build_dendrites()
 
-	    d.insert('Kv1_1')
-	    d.gbar_Kv1_1 = pc_param['Kv1.1Dend']
-	    
-	    d.insert('Kv1_5')
-	    d.gKur_Kv1_5 = pc_param['Kv1.5Dend']
-	    
-	    d.insert('Kv3_3')
-	    d.gbar_Kv3_3 = pc_param['Kv3.3Dend']
-	    
-	    d.insert('Cav3_3')
-	    d.pcabar_Cav3_3 = pc_param['Cav3.3Dend']
-	    
-	    d.insert('HCN1')
-	    d.gbar_HCN1 = pc_param['HCNDend']
-	    d.eh = -34.4
-	        
-	    d.TotalPump_cdp5 = 2e-8
-	     
-	    if d.diam >= 3.5 and d.diam <= 12: 
-	      d.insert('Cav3_2')
-	      d.gcabar_Cav3_2 = pc_param['Cav3.2Dend']
-	    
-	      d.insert('Kca3_1') 
-	      d.gkbar_Kca3_1 = pc_param['Kca3.1Dend']
-	      
-	      d.insert('Cav3_1') 
-	      d.pcabar_Cav3_1 = pc_param['Cav3.1Dend']
-	      
-	      d.insert('Kca2_2') 
-	      d.gkbar_Kca2_2 = pc_param['Kca2.2Dend']
-	      
-	      d.insert('Kir2_3')
-	      d.gkbar_Kir2_3 = pc_param['PC_KirDend']
-	      
-	      if d.diam >=8 and d.diam <=12:
-		
-		d.insert('Nav1_6')
-		d.gbar_Nav1_6 = pc_param['Nav1.6Dend']
-		d.ena = 60
-		  
-	    d.ek = -88
-	    
-	    d.push()
-            d.eca = 137.52625
-            d.cai = h.cai0_ca_ion
-            d.cao = h.cao0_ca_ion
-            h.ion_style("ca_ion", 1, 1, 0, 1, 0)
-            h.pop_section()
-	      
-	self.subsets_cm = np.genfromtxt("ModelViewParmSubset_cm.txt")
-	for cm in self.subsets_cm:
-	    for d in self.ModelViewParmSubset[int(cm[0])]:
-		d.cm = cm[1] * 0.77/1.64
-
-	self.dend[138].cm = 8.58298 * 0.77/1.64
-
-	self.subsets_paraextra = np.genfromtxt("modelsubsetextra.txt", dtype=[('modelviewsubset','f8'),('channel','S5'),('channel2','S5'),('value','f8')])
-	for para in self.subsets_paraextra:
-	    for d in self.ModelViewParmSubset[int(para[0])]:
-		d.insert(para[1])
-		exec 'd.gmax_'+para[2]+' = '+str(para[3])
-	
-	listgmax = []
-	for d in self.ModelViewParmSubset[2]:
-	    d.gmax_Leak = d.gmax_Leak/2
-	    
-	self.dend[138].insert('Leak')
-	self.dend[138].gmax_Leak = 1.74451E-4 / 2
- 	
 #Axon AIS. First section after the soma
 	self.axonAIS = h.Section(name='axonAIS')
 	self.axonAIS.nseg = 1
@@ -529,6 +487,82 @@ class Purkinje:
 	self.vm_NOR3 = h.Vector()
 	self.vm_NOR3.record(self.axonNOR3(0.5)._ref_v)
 
-        # =======Add-on to original Purkinje.py=======
-        #os.chdir(cwd)      # reset to start directory
-        # ==============End of the Add-on=============
+
+
+    # =======Add-on to original Purkinje.py=======
+    # Same cell as the dendrite construction of the original Purkinje.py
+    # (see benchmark_dendrites.py) but with the loops over the ~1600
+    # dendrites run in hoc (pc_build_dendrites, pc_set_dend_passive) over
+    # one SectionList, instead of ~30 Python -> NEURON calls (push,
+    # pt3dadd, insert, every parameter) per dendrite. The values of each
+    # dendrite (coordinates, cdp5 parameters, cm, gmax_Leak) are computed
+    # in numpy and handed over at once as a Matrix/Vectors. What is left
+    # per dendrite in Python is the Section itself and its connect.
+    # ============================================
+    def build_dendrites(self):
+	if not h.name_declared("pc_build_dendrites"):
+	    h(dend_hoc)
+	self.sectioncoordinate = np.genfromtxt(os.path.join(self.dir_path, "coordinate.csv"))
+	connections = np.genfromtxt(os.path.join(self.dir_path, "connections.csv"))
+
+	fh = open(os.path.join(self.dir_path, "PC_dendnames.dlist"))
+	self.dendnames = [line[:-1] for line in fh.readlines()]
+	fh.close()
+
+	n = len(self.sectioncoordinate)
+	self.dend = [h.Section(name=self.dendnames[i]) for i in range(n)]
+	self.dendlist = h.SectionList(self.dend)
+
+	# cdp5 parameters from the (end) diameter of every dendrite, written
+	# as in the original so that the values are the same to the last bit
+	d = self.sectioncoordinate[:,8]
+	Nannuli = 0.326 + (1.94 * (d)) + (0.289*(d)*(d)) - ((3.33e-2)*(d)*(d)*(d)) + ((1.55e-3)*(d)*(d)*(d)*(d)) - (2.55e-5*(d)*(d)*(d)*(d)*(d))
+	Buffnull2 = 64.2 - 57.3* np.exp(-(d)/1.4)
+	rf3 = 0.162 - 0.106* np.exp(-(d)/2.29)
+	rf4 = np.where( d >= 2,
+	                0.000267 + 0.0167* np.exp(-(d)/0.722) + 0.0028* np.exp(-(d)/4),
+	                0.003 )
+	values = np.column_stack( [self.sectioncoordinate[:,1:9],
+	                           Nannuli, Buffnull2, rf3, rf4] )
+	matrix = h.Matrix(n, values.shape[1])
+	matrix.from_vector( h.Vector(values.T.ravel()) ) # column by column
+	conductances = h.Vector([ pc_param[name] for name in dend_conductances ])
+	h.pc_build_dendrites(self.dendlist, matrix, conductances)
+
+#Connection between dend and soma and between each dend
+	self.dend[0].connect(self.soma,1,0)
+	for child, child_x, parent, parent_x in connections.astype(int).tolist():
+	    self.dend[child].connect(self.dend[parent], parent_x, child_x)
+
+	self.subsets = np.genfromtxt(os.path.join(self.dir_path, "ModelViewParmSubset.txt"), dtype = int)
+	members = [[] for M in range(88)]
+	for i, M in self.subsets.tolist():
+	    members[M].append(i)
+	self.ModelViewParmSubset = [[self.dend[i] for i in group] for group in members]
+
+	# cm and gmax_Leak of every dendrite, -1 where the files set none
+	cm_values = np.full(n, -1.0)
+	self.subsets_cm = np.genfromtxt(os.path.join(self.dir_path, "ModelViewParmSubset_cm.txt"))
+	for M, cm in self.subsets_cm.tolist():
+	    cm_values[members[int(M)]] = cm * 0.77/1.64
+
+	leak_values = np.full(n, -1.0)
+	self.subsets_paraextra = np.genfromtxt(os.path.join(self.dir_path, "modelsubsetextra.txt"), dtype=[('modelviewsubset','f8'),('channel','S5'),('channel2','S5'),('value','f8')])
+	for para in self.subsets_paraextra:
+	    if para[1] == b'Leak' and para[2] == b'Leak':
+	        leak_values[members[int(para[0])]] = para[3]
+	    else: # other channels, none in modelsubsetextra.txt
+	        for d in self.ModelViewParmSubset[int(para[0])]:
+		    d.insert(para[1])
+		    setattr(d, 'gmax_' + str(para[2]), para[3])
+
+	leak_factors = np.ones(n)
+	for i in members[2]:
+	    leak_factors[i] = leak_factors[i] / 2
+	h.pc_set_dend_passive( self.dendlist, h.Vector(cm_values),
+	                       h.Vector(leak_values), h.Vector(leak_factors) )
+
+	self.dend[138].cm = 8.58298 * 0.77/1.64
+
+	self.dend[138].insert('Leak')
+	self.dend[138].gmax_Leak = 1.74451E-4 / 2
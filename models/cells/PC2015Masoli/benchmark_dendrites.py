@@ -0,0 +1,199 @@
+# =============================================================================
+# benchmark_dendrites.py
+#
+# created  19 October 2026 Lungsi
+#
+# Benchmark of the construction of the Purkinje cell template. The
+# dendrites (~1600 sections) are built either as in the original
+# Purkinje.py (LegacyPurkinje below: per section push/pt3dadd/pop_section,
+# an insert and a setattr per channel and an exec per subset parameter)
+# or by Purkinje.build_dendrites (the same loops run in hoc over one
+# SectionList). Run it, after the mod-files are compiled, from the root
+# of the package
+#   $ python -m models.cells.PC2015Masoli.benchmark_dendrites
+# It prints the mean build time of each and checks, section by section,
+# that both give the same cell.
+#
+# =============================================================================
+
+import os
+import sys
+import math
+
+from neuron import h
+import numpy as np
+
+from ...file_manager import get_model_lib_path
+from ...model_manager import load_model_library
+from ...model_manager import benchmark_cell_template
+from .PC_param import pc_param
+from .Purkinje import Purkinje
+
+
+class LegacyPurkinje(Purkinje):
+    '''
+    The Purkinje cell with the dendrite construction of the original
+    Purkinje.py, kept as is but for the paths of the data files.
+    '''
+    def build_dendrites(self):
+	self.sectioncoordinate = np.genfromtxt(os.path.join(self.dir_path, "coordinate.csv"))
+
+	fh = open(os.path.join(self.dir_path, "PC_dendnames.dlist"))
+        self.dendnames = [line[:-1] for line in fh.readlines()]
+	
+	self.dend = []
+	for i_idx,i in enumerate(self.sectioncoordinate):
+	    self.dend.append(h.Section(name=self.dendnames[i_idx]))
+	    self.dend[-1].push()
+	    h.pt3dclear()
+	    h.pt3dadd(i.item(1), i.item(2), i.item(3), i.item(4))
+	    h.pt3dadd(i.item(5), i.item(6), i.item(7), i.item(8))
+	    self.dend[-1].diam = i.item(4)
+
+	    self.dend[-1].insert('cdp5')
+	    self.dend[-1].Nannuli_cdp5 = 0.326 + (1.94 * (i.item(8))) + (0.289*(i.item(8))*(i.item(8))) - ((3.33e-2)*(i.item(8))*(i.item(8))*(i.item(8))) + ((1.55e-3)*(i.item(8))*(i.item(8))*(i.item(8))*(i.item(8))) - (2.55e-5*(i.item(8))*(i.item(8))*(i.item(8))*(i.item(8))*(i.item(8)))
+	    self.dend[-1].Buffnull2_cdp5 = 64.2 - 57.3* math.exp(-(i.item(8))/1.4)
+	    self.dend[-1].rf3_cdp5 = 0.162 - 0.106* math.exp(-(i.item(8))/2.29)
+	    if ((i.item(8))>=2):
+	      self.dend[-1].rf4_cdp5 = 0.000267 + 0.0167* math.exp(-(i.item(8))/0.722) + 0.0028* math.exp(-(i.item(8))/4)
+	    else:
+	      self.dend[-1].rf4_cdp5 = 0.003
+	    
+	    h.pop_section()
+
+#Connection between dend and soma  
+	self.dend[0].connect(self.soma,1,0)
+
+#Connection between each dend	
+	for c in np.genfromtxt(os.path.join(self.dir_path, "connections.csv")):
+	    self.dend[int(c[0])].connect(self.dend[int(c[2])],int(c[3]),int(c[1]))
+	   
+
+	self.subsets = np.genfromtxt(os.path.join(self.dir_path, "ModelViewParmSubset.txt"), dtype = int)
+	self.ModelViewParmSubset = [[self.dend[int(i)] for i in self.subsets[np.where(self.subsets[...,1]==M),0][0]] for M in range(88) ]
+	for d in self.dend:
+	    
+	    d.Ra = 122
+	     
+	    d.insert('Leak')
+	    d.e_Leak = pc_param['eleak']
+   
+	    d.insert('Cav2_1') 
+	    d.pcabar_Cav2_1 = pc_param['Cav2.1Dend']
+	   
+	    d.insert('Kca1_1')
+	    d.gbar_Kca1_1 = pc_param['Kca1.1Dend']
+	    
+	    d.insert('Kv4_3')
+	    d.gkbar_Kv4_3 = pc_param['Kv4.3Dend']
+
+	    d.insert('Kv1_1')
+	    d.gbar_Kv1_1 = pc_param['Kv1.1Dend']
+	    
+	    d.insert('Kv1_5')
+	    d.gKur_Kv1_5 = pc_param['Kv1.5Dend']
+	    
+	    d.insert('Kv3_3')
+	    d.gbar_Kv3_3 = pc_param['Kv3.3Dend']
+	    
+	    d.insert('Cav3_3')
+	    d.pcabar_Cav3_3 = pc_param['Cav3.3Dend']
+	    
+	    d.insert('HCN1')
+	    d.gbar_HCN1 = pc_param['HCNDend']
+	    d.eh = -34.4
+	        
+	    d.TotalPump_cdp5 = 2e-8
+	     
+	    if d.diam >= 3.5 and d.diam <= 12: 
+	      d.insert('Cav3_2')
+	      d.gcabar_Cav3_2 = pc_param['Cav3.2Dend']
+	    
+	      d.insert('Kca3_1') 
+	      d.gkbar_Kca3_1 = pc_param['Kca3.1Dend']
+	      
+	      d.insert('Cav3_1') 
+	      d.pcabar_Cav3_1 = pc_param['Cav3.1Dend']
+	      
+	      d.insert('Kca2_2') 
+	      d.gkbar_Kca2_2 = pc_param['Kca2.2Dend']
+	      
+	      d.insert('Kir2_3')
+	      d.gkbar_Kir2_3 = pc_param['PC_KirDend']
+	      
+	      if d.diam >=8 and d.diam <=12:
+		
+		d.insert('Nav1_6')
+		d.gbar_Nav1_6 = pc_param['Nav1.6Dend']
+		d.ena = 60
+		  
+	    d.ek = -88
+	    
+	    d.push()
+            d.eca = 137.52625
+            d.cai = h.cai0_ca_ion
+            d.cao = h.cao0_ca_ion
+            h.ion_style("ca_ion", 1, 1, 0, 1, 0)
+            h.pop_section()
+	      
+	self.subsets_cm = np.genfromtxt(os.path.join(self.dir_path, "ModelViewParmSubset_cm.txt"))
+	for cm in self.subsets_cm:
+	    for d in self.ModelViewParmSubset[int(cm[0])]:
+		d.cm = cm[1] * 0.77/1.64
+
+	self.dend[138].cm = 8.58298 * 0.77/1.64
+
+	self.subsets_paraextra = np.genfromtxt(os.path.join(self.dir_path, "modelsubsetextra.txt"), dtype=[('modelviewsubset','f8'),('channel','S5'),('channel2','S5'),('value','f8')])
+	for para in self.subsets_paraextra:
+	    for d in self.ModelViewParmSubset[int(para[0])]:
+		d.insert(para[1])
+		exec 'd.gmax_'+para[2]+' = '+str(para[3])
+	
+	listgmax = []
+	for d in self.ModelViewParmSubset[2]:
+	    d.gmax_Leak = d.gmax_Leak/2
+	    
+	self.dend[138].insert('Leak')
+	self.dend[138].gmax_Leak = 1.74451E-4 / 2
+
+
+def describe_sections(cell):
+    """
+    Use case: describe_sections( Purkinje() )
+    {section name: (3d points, psection without the names)} of the cell.
+    """
+    sections = {}
+    for sec in cell.soma.wholetree():
+        points = [ (h.x3d(i, sec=sec), h.y3d(i, sec=sec), h.z3d(i, sec=sec),
+                    h.diam3d(i, sec=sec)) for i in range(int(h.n3d(sec=sec))) ]
+        properties = sec.psection()
+        for name in ("name", "hoc_internal_name", "cell", "point_processes"):
+            properties.pop(name, None)
+        for name in ("parent", "trueparent"):
+            properties["morphology"][name] = str(properties["morphology"][name])
+        properties["segments"] = [ (seg.x, seg.diam, seg.cm, seg.area())
+                                   for seg in sec ]
+        sections[sec.name()] = (points, properties)
+    return sections
+
+
+def main():
+    n_builds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    model_mod_path, model_lib_path = get_model_lib_path( model_scale="cells",
+                                                         model_name="PC2015Masoli" )
+    load_model_library(model_lib_path)
+    dir_path = os.path.dirname(model_mod_path)
+    timings = benchmark_cell_template( dir_path, {"legacy": LegacyPurkinje,
+                                                  "hoc loops": Purkinje},
+                                       n_builds )
+    print ( "speed-up %.2f" % (timings["legacy"] / timings["hoc loops"]) )
+    legacy = describe_sections( LegacyPurkinje(dir_path=dir_path) )
+    cell = describe_sections( Purkinje(dir_path=dir_path) )
+    different = sorted( name for name in legacy if legacy[name] != cell.get(name) )
+    print ( "%d sections, %d different" % (len(legacy), len(different)) )
+
+
+if __name__ == "__main__":
+    main()
+#
+#
@@ -122,6 +122,8 @@ FUNCTION kelvinfkt( t (degC) )  (kelvin) {
 }
 
 FUNCTION taumfkt( v (mV) ) (ms) {
+    : tabulated (usetable_Cav2_1 = 0 computes every call)
+    TABLE FROM -100 TO 100 WITH 8000
     UNITSOFF
     if (v>=-40) {
         taumfkt = 0.2702 + 1.1622 * exp(-(v+26.798)*(v+26.798)/164.19)
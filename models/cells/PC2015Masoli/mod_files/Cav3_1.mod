@@ -125,6 +125,18 @@ INITIAL {
 }
 
 PROCEDURE evaluate_fct(v(mV)) { 
+	rates(v)
+	g = ghk(v, cai, cao, 2)
+}
+
+PROCEDURE rates(v(mV)) {
+	: tabulated (usetable_Cav3_1 = 0 computes every call), qt from
+	: celsius here since the table is checked before INITIAL
+	TABLE minf, hinf, taum, tauh
+	DEPEND celsius, q10, v0_m_inf, v0_h_inf, k_m_inf, k_h_inf,
+	       C_tau_m, A_tau_m, v0_tau_m1, v0_tau_m2, k_tau_m1, k_tau_m2,
+	       C_tau_h, A_tau_h, v0_tau_h1, k_tau_h1 FROM -100 TO 100 WITH 8000
+	qt = q10^((celsius-37 (degC))/10 (degC))
 
         minf = 1.0 / ( 1 + exp((v  - v0_m_inf)/k_m_inf) )
         hinf = 1.0 / ( 1 + exp((v - v0_h_inf)/k_h_inf) )
@@ -134,7 +146,6 @@ PROCEDURE evaluate_fct(v(mV)) {
 	taum = ( C_tau_m + A_tau_m / (exp((v - v0_tau_m1)/ k_tau_m1) + exp((v - v0_tau_m2)/k_tau_m2))) / qt
 	}
 	tauh = ( C_tau_h + A_tau_h / exp((v - v0_tau_h1)/k_tau_h1) ) / qt
-	g = ghk(v, cai, cao, 2)
 }
 
 FUNCTION kelvinfkt( t (degC) )  (kelvin) {
@@ -78,10 +78,27 @@ DERIVATIVE states {
 }
 
 PROCEDURE rate(v (mV)) {
+    : the range variable ratetau scales the tabulated tauh
+    trate(v)
+    tauh = ratetau*tauh
+}
+
+PROCEDURE trate(v (mV)) {
+    : tabulated (usetable_HCN1 = 0 computes every call); the half
+    : voltages and qt from the parameters here since the table is checked
+    : before INITIAL
+    TABLE hinf, tauh
+    DEPEND celsius, q10, ljp, v_inf_half_noljp, v_inf_k, v_tau_const,
+           v_tau_half1_noljp, v_tau_half2_noljp, v_tau_k1, v_tau_k2
+           FROM -100 TO 100 WITH 8000
+    qt = q10^((celsius-37 (degC))/10 (degC))
+    v_inf_half = (v_inf_half_noljp - ljp)
+    v_tau_half1 = (v_tau_half1_noljp - ljp)
+    v_tau_half2 = (v_tau_half2_noljp - ljp)
     : hinf=1/( 1+exp((90+v)/9.67) )
     : tauh=ratetau*1/(0.0018*( exp((v+68)/-22) + exp((v+68)/7.14) ))
     hinf = 1 / (1+exp( (v-v_inf_half) / v_inf_k) )
-    tauh = (ratetau / (v_tau_const * ( exp( (v-v_tau_half1) / v_tau_k1) + exp( (v-v_tau_half2) / v_tau_k2) )))/qt
+    tauh = (1 / (v_tau_const * ( exp( (v-v_tau_half1) / v_tau_k1) + exp( (v-v_tau_half2) / v_tau_k2) )))/qt
 }
 
 
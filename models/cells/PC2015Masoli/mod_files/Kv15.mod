@@ -103,16 +103,25 @@ FUNCTION ce(v(mV),i)(/ms) {   :  order m n u
 }
 
 
-PROCEDURE rates(v) {LOCAL a,b,c :
+PROCEDURE rates(v) {
+	: the range variables Tauact, ... scale the tabulated values
+		trates(v)
+		mtau = mtau*Tauact
+		ntau = ntau*Tauinactf
+		utau = 6800*Tauinacts
+}
+
+PROCEDURE trates(v) {LOCAL a,b,c :
+	: tabulated (usetable_Kv1_5 = 0 computes every call)
+	TABLE minf, mtau, ninf, ntau, uinf DEPEND celsius FROM -100 TO 100 WITH 8000
 	
 		a = alp(v,0)  b=bet(v,0) c = ce(v,0)
-		mtau = 1/(a + b)/3*Tauact
+		mtau = 1/(a + b)/3
 		minf = c
                a = alp(v,1)  b=bet(v,1) c = ce(v,1)
-		ntau = 1/(a + b)/3*Tauinactf
+		ntau = 1/(a + b)/3
 		ninf = c
 		c = ce(v,2)
 		uinf = c
-		utau = 6800*Tauinacts
 }
 UNITSON
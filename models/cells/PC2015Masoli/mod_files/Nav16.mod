@@ -162,6 +162,14 @@ CONSERVE C1 + C2 + C3 + C4 + C5 + O + B + I1 + I2 + I3 + I4 + I5 + I6 = 1
 
 PROCEDURE rates(v(mV) )
 {
+ : tabulated (usetable_Nav1_6 = 0 computes every call), qt from celsius
+ : here since the table is checked before INITIAL
+ TABLE alfac, btfac, f01, f02, f03, f04, f0O, fip, f11, f12, f13, f14, f1n,
+       fi1, fi2, fi3, fi4, fi5, fin, b01, b02, b03, b04, b0O, bip, b11, b12,
+       b13, b14, b1n, bi1, bi2, bi3, bi4, bi5, bin
+ DEPEND celsius, q10, Con, Coff, Oon, Ooff, alpha, beta, gamma, delta, epsilon,
+        zeta, x1, x2, x3, x4, x5, x6 FROM -100 TO 100 WITH 8000
+ qt = q10^((celsius-22 (degC))/10 (degC))
  alfac = (Oon/Con)^(1/4)
  btfac = (Ooff/Coff)^(1/4) 
  f01 = 4 * alpha * exp(v/x1) * qt
@@ -2,6 +2,7 @@
 # PC2015Masoli_model.py
 #
 # created  01 August 2017 Lungsi
+# modified 19 October 2026 Lungsi
 #
 # This py-file contains the class of the model.
 # The template of the model in the directory PC2015Masoli/
@@ -52,15 +53,87 @@ from ..file_manager import get_prediction_file as gpf
 from ..file_manager import get_model_lib_path as gmlp
 from ..file_manager import check_and_make_directory as cmdir
 from ..model_manager import check_and_compile_model as ccm
+from ..model_manager import load_model_library as lml
 from ..simulation_manager import check_capability_availability as cca
 from ..simulation_manager import discover_cores_activate_multisplit as dcam
 from ..simulation_manager import set_runtime_parameters as set_runtime
 from ..simulation_manager import initialize_and_run_NEURON_model as irNm
 from ..simulation_manager import save_predictions as sp
 from ..simulation_manager import clone_method
+from ..simulation_manager import StopMonitor
+from ..simulation_manager import continue_with_stop_criteria
 #from ..signal_processing_manager import convert_vm_to_spike_train_from_file as getspikes
 from ..signal_processing_manager import convert_voltage_response_to_spike_train as getspikes
+from ..morphology_manager import SectionIndex
+from ..feature_manager import features_from_predictions
+from ..transaction_manager import TransactionStack
+from ..recording_manager import SpatialRecorder
+from ..recording_manager import RegionRecorder
 from PC2015Masoli.Purkinje import Purkinje
+from PC2015Masoli.PC_param import pc_param
+
+
+# ===============Where each pc_param entry is in the cell=================
+# key => pc_param key; value => (attributes of Purkinje(), range variable)
+# The range variable is only set in the sections having its mechanism.
+#
+axon_with_leak = [ "axonAIS", "axonAISK", "axonNOR", "axonNOR2", "axonNOR3",
+                   "axoncoll", "axoncoll2" ]
+pc_param_locations = {
+    "eleak": ( ["soma", "dend"] + axon_with_leak, "e_Leak" ),
+    # soma
+    "LeakSoma": ( ["soma"], "gmax_Leak" ),
+    "Cav3.1Soma": ( ["soma"], "pcabar_Cav3_1" ),
+    "Cav2.1Soma": ( ["soma"], "pcabar_Cav2_1" ),
+    "HCNSoma": ( ["soma"], "gbar_HCN1" ),
+    "Nav1.6Soma": ( ["soma"], "gbar_Nav1_6" ),
+    "Kv3.4Soma": ( ["soma"], "gkbar_Kv3_4" ),
+    "Kv1.1Soma": ( ["soma"], "gbar_Kv1_1" ),
+    "Cav3.2Soma": ( ["soma"], "gcabar_Cav3_2" ),
+    "Kca3.1Soma": ( ["soma"], "gkbar_Kca3_1" ),
+    "Cav3.3Soma": ( ["soma"], "pcabar_Cav3_3" ),
+    "PC_KirSoma": ( ["soma"], "gkbar_Kir2_3" ),
+    "Kca1.1Soma": ( ["soma"], "gbar_Kca1_1" ),
+    "Kca2.2Soma": ( ["soma"], "gkbar_Kca2_2" ),
+    # dendrite
+    "Cav2.1Dend": ( ["dend"], "pcabar_Cav2_1" ),
+    "Kca1.1Dend": ( ["dend"], "gbar_Kca1_1" ),
+    "Kv4.3Dend": ( ["dend"], "gkbar_Kv4_3" ),
+    "Kv1.1Dend": ( ["dend"], "gbar_Kv1_1" ),
+    "Kv1.5Dend": ( ["dend"], "gKur_Kv1_5" ),
+    "Kv3.3Dend": ( ["dend"], "gbar_Kv3_3" ),
+    "Cav3.3Dend": ( ["dend"], "pcabar_Cav3_3" ),
+    "Cav3.2Dend": ( ["dend"], "gcabar_Cav3_2" ),
+    "Kca3.1Dend": ( ["dend"], "gkbar_Kca3_1" ),
+    "Cav3.1Dend": ( ["dend"], "pcabar_Cav3_1" ),
+    "Kca2.2Dend": ( ["dend"], "gkbar_Kca2_2" ),
+    "PC_KirDend": ( ["dend"], "gkbar_Kir2_3" ),
+    "Nav1.6Dend": ( ["dend"], "gbar_Nav1_6" ),
+    "HCNDend": ( ["dend"], "gbar_HCN1" ),
+    # AIS and AISK
+    "Cav3.1Ais": ( ["axonAIS"], "pcabar_Cav3_1" ),
+    "Nav1.6AIS": ( ["axonAIS"], "gbar_Nav1_6" ),
+    "Cav2.1AIS": ( ["axonAIS"], "pcabar_Cav2_1" ),
+    "Kv3.4AIS": ( ["axonAIS"], "gkbar_Kv3_4" ),
+    "Kv1.1AisK": ( ["axonAISK"], "gbar_Kv1_1" ),
+    # Node of Ranviers
+    "Nav1.6Nor": ( ["axonNOR"], "gbar_Nav1_6" ),
+    "Kv3.4Nor": ( ["axonNOR"], "gkbar_Kv3_4" ),
+    "Cav3.1Nor": ( ["axonNOR"], "pcabar_Cav3_1" ),
+    "Cav2.1Nor": ( ["axonNOR"], "pcabar_Cav2_1" ),
+    "Nav1.6Nor2": ( ["axonNOR2"], "gbar_Nav1_6" ),
+    "Kv3.4Nor2": ( ["axonNOR2"], "gkbar_Kv3_4" ),
+    "Cav3.1Nor2": ( ["axonNOR2"], "pcabar_Cav3_1" ),
+    "Cav2.1Nor2": ( ["axonNOR2"], "pcabar_Cav2_1" ),
+    "Nav1.6Nor3": ( ["axonNOR3"], "gbar_Nav1_6" ),
+    "Kv3.4Nor3": ( ["axonNOR3"], "gkbar_Kv3_4" ),
+    "Cav3.1Nor3": ( ["axonNOR3"], "pcabar_Cav3_1" ),
+    "Cav2.1Nor3": ( ["axonNOR3"], "pcabar_Cav2_1" ),
+    # Collaterals
+    "Nav1.6Axoncoll": ( ["axoncoll", "axoncoll2"], "gbar_Nav1_6" ),
+    "Kv3.4Axoncoll": ( ["axoncoll", "axoncoll2"], "gkbar_Kv3_4" ),
+    "Cav3.1Axoncoll": ( ["axoncoll", "axoncoll2"], "pcabar_Cav3_1" ),
+    "Cav2.1Axoncoll": ( ["axoncoll", "axoncoll2"], "pcabar_Cav2_1" ) }
 
 
 # ======================SciUNIT-CerebUNIT Based Model=======================
@@ -105,8 +178,8 @@ class PurkinjeCell( sciunit.Model,
         ccm(model_mod_path, model_lib_path)
         #print model_mod_path, model_lib_path, os.getcwd()
         #
-        # load NEURON model library
-        h.nrn_load_dll(model_lib_path)
+        # load NEURON model library (only once per process)
+        lml(model_lib_path)
         #
         # fixed time-step only
         Fixed_step = h.CVode()
@@ -116,14 +189,10 @@ class PurkinjeCell( sciunit.Model,
         #cwd = os.getcwd()
         #os.chdir(cwd + os.sep + "models" + os.sep + "cells" \
         #           + os.sep + "PC2015Masoli"
-        self.cwd = os.getcwd() # this is the root
-        self.path_to_files = self.cwd + os.sep + "models" + \
-                        os.sep + "cells" + os.sep + \
-                        "PC2015Masoli" + os.sep
-        os.chdir(self.path_to_files) # change to path_to_files
-        self.cell = Purkinje() # self.reset_cell = copy.deepcopy(self.cell)
-        os.chdir(self.cwd)
-        #os.chdir(cwd)  # reset to original directory
+        # the template reads its files from path_to_files (package
+        # relative) so the working directory is neither used nor changed
+        self.path_to_files = os.path.dirname(model_mod_path) + os.sep
+        self.cell = Purkinje( dir_path=self.path_to_files ) # self.reset_cell = copy.deepcopy(self.cell)
         #
         # discover no.cores in 1CPU & activate multisplit to use all cores
         dcam(h)
@@ -141,9 +210,26 @@ class PurkinjeCell( sciunit.Model,
                                            self.model_scale,
                                            self.model_name )
         self.predicted_files_full_path = [] # keeps file names
+        # None => files saved at once, or a simulation_manager.PredictionWriter
+        self.prediction_writer = None
+        # True => no rec_t, the time axis is implicit; see set_implicit_time
+        self.implicit_time = False
+        self.time_axis_start = None # (t0, dt) at the initialization
+        self.time_axis_handler = None
+        # =====stimuli added between segments, see advance_to============
+        self.continuation_stimuli = []
+        # =====knockouts/disconnections done, see undo===================
+        # the multisplit is activated again after a change of topology
+        self.transactions = TransactionStack( on_topology_change=lambda: dcam(h) )
         # =====specify cell_regions from which you want predictions======
         # created 22 Sept 2017
-        self.cell_regions = {"vm_soma": 0.0, "vm_NOR3": 0.0}
+        # modified 19 October 2026: the spikes at NOR3 peak below 0 mV
+        # (about -5 mV), hence their threshold at -20 mV
+        self.cell_regions = {"vm_soma": 0.0, "vm_NOR3": -20.0}
+        # =====spatial index of self.cell.dend, see select_dendrites=====
+        self.section_index = None
+        # =====sections of each pc_param entry, see set_pc_param=========
+        self.pc_param_sections = None
         #
         print ("size of rec_t is "+ str(self.cell.rec_t.size()) +
                " and its current value is "+ str(h._ref_t[0]))
@@ -165,7 +251,7 @@ class PurkinjeCell( sciunit.Model,
            by default
            pc.produce_spike_train()
            customize
-           pc.cell_regions = {"vm_soma": 0.0, "vm_NOR3": 0.0} # default
+           pc.cell_regions = {"vm_soma": 0.0, "vm_NOR3": -20.0} # default
            # format is key=> cell region; value=> threshold
            # now run
            pc.produce_spike_train()
@@ -196,7 +282,16 @@ class PurkinjeCell( sciunit.Model,
     # Note: This function name should be the same as the method name in
     #       ProducesElectricalResponse.
     # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
-    def produce_voltage_response( self ):
+    def produce_voltage_response( self, stop_criteria=None ):
+        """
+        Use case: pc.produce_voltage_response()
+        or, to end the run as soon as the outcome is known,
+        pc.produce_voltage_response( stop_criteria=[stop_after_n_spikes(20),
+                                     stop_on_depolarization_block()] )
+        with the criteria in simulation_manager (evaluated at the soma).
+        pc.predictions["truncated"] is then False or
+        {"reason": name of the criterion, "t_stop": time (ms) of the stop}
+        """
         print "Running " + self.model_name + " " + self.model_scale + " ... \n",
         #
         # ===========Implement produce_voltage_response capability============
@@ -208,7 +303,21 @@ class PurkinjeCell( sciunit.Model,
         # =================Setup-Initialize-Run Simulation====================
         #
         #self.set_simulation_properties() # set-up simulation time
-        irNm(h)                          # initialize & run NEURON
+        if stop_criteria is None:
+            irNm(h)                      # initialize & run NEURON
+            self.predictions["truncated"] = False
+        else:
+            monitor = StopMonitor( h, self.cell.soma, self.cell.vm_soma,
+                                   stop_criteria,
+                                   threshold=self.cell_regions.get("vm_soma", 0.0) )
+            try:
+                reason = irNm(h, monitor=monitor)
+            finally:
+                monitor.close()
+            if reason is None:
+                self.predictions["truncated"] = False
+            else:
+                self.predictions["truncated"] = {"reason": reason, "t_stop": h.t}
         # ====================================================================
         #
         # =============Save predictions in "model_predictions"================
@@ -221,7 +330,7 @@ class PurkinjeCell( sciunit.Model,
 
     # +++++++++++++++Model Capability: ko_AIS_channels+++++++++++++++++
     # created:  26 September 2017
-    # modified: 
+    # modified: 19 October 2026 (reversible, see undo)
     # Note: This function name should be the same as the method name in
     #       CanKOAISChannels.
     # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
@@ -232,46 +341,51 @@ class PurkinjeCell( sciunit.Model,
         cca( capability_name = "ko_AIS_channels",
              CerebUnitCapability = CanKOAISChannels ) # check capab.
         #
-        self.cell.axonAIS.pcabar_Cav3_1 = 0
-        self.cell.axonAIS.gbar_Nav1_6 = 0
-        self.cell.axonAIS.pcabar_Cav2_1 = 0
+        # kept as a transaction, see undo()
+        transaction = self.transactions.begin("ko_AIS_channels")
+        transaction.set_range(self.cell.axonAIS, "pcabar_Cav3_1", 0)
+        transaction.set_range(self.cell.axonAIS, "gbar_Nav1_6", 0)
+        transaction.set_range(self.cell.axonAIS, "pcabar_Cav2_1", 0)
         # ====================================================================
         #print " Done!"
+        return transaction
     
 
     # +++++++++++++++Model Capability: ko_Cav2_1_channels++++++++++++++++
     # created:  26 September 2017
-    # modified: 
+    # modified: 19 October 2026 (reversible, see undo)
     # Note: This function name should be the same as the method name in
-    #       CanKOCap2pt1Channels.
+    #       CanKOCav2pt1Channels.
     # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     def ko_Cav2_1_channels( self ):
         #
         # ==============Implement ko_Cav2_1_channels capability===============
         # 
         cca( capability_name = "ko_Cav2_1_channels",
-             CerebUnitCapability = CanKOCav2ptChannels ) # check capab.
+             CerebUnitCapability = CanKOCav2pt1Channels ) # check capab.
+        # kept as a transaction, see undo()
+        transaction = self.transactions.begin("ko_Cav2_1_channels")
         # soma
-        self.cell.soma.pcabar_Cav2_1 = 0
+        transaction.set_range(self.cell.soma, "pcabar_Cav2_1", 0)
         # AIS
-        self.cell.axonAIS.pcabar_Cav2_1 = 0
+        transaction.set_range(self.cell.axonAIS, "pcabar_Cav2_1", 0)
         # dendrite
-        for d in self.cell.dend:
-            d.pcabar_Cav2_1 = 0
+        transaction.set_range(self.cell.dend, "pcabar_Cav2_1", 0)
         # Node of Ranviers
-        self.cell.axonNOR.pcabar_Cav2_1 = 0
-        self.cell.axonNOR2.pcabar_Cav2_1 = 0
-        self.cell.axonNOR3.pcabar_Cav2_1 = 0
+        transaction.set_range(self.cell.axonNOR, "pcabar_Cav2_1", 0)
+        transaction.set_range(self.cell.axonNOR2, "pcabar_Cav2_1", 0)
+        transaction.set_range(self.cell.axonNOR3, "pcabar_Cav2_1", 0)
         # Collaterals
-        self.cell.axoncoll.pcabar_Cav2_1 = 0
-        self.cell.axoncoll2.pcabar_Cav2_1 = 0
+        transaction.set_range(self.cell.axoncoll, "pcabar_Cav2_1", 0)
+        transaction.set_range(self.cell.axoncoll2, "pcabar_Cav2_1", 0)
         # ====================================================================
         #print " Done!"
+        return transaction
     
 
     # +++++++++++++++Model Capability: disconnect_all_dendrites++++++++++++++++
     # created:  03 October 2017
-    # modified: 
+    # modified: 19 October 2026 (reversible, see undo)
     # Note: This function name should be the same as the method name in
     #       CanDisconnectDendrites.
     #       This function disconnects all dendrite sections from its parents
@@ -287,9 +401,35 @@ class PurkinjeCell( sciunit.Model,
         #for d in self.cell.dend:
         #    if h.SectionRef(sec = d).has_parent != 0:
         #        h.disconnect(sec = d)
-        h.disconnect(sec = self.cell.dend[0])
+        # kept as a transaction, see undo()
+        transaction = self.transactions.begin("disconnect_dendrites_from_soma")
+        transaction.disconnect(self.cell.dend[0])
         # ====================================================================
         #print " Done!"
+        return transaction
+
+
+    # +++++++++++++++++++++++++++++undo+++++++++++++++++++++++++++++++++
+    # created:  19 October 2026
+    # modified:
+    # Note: This function is NOT model capability function.
+    #       The capabilities ko_AIS_channels, ko_Cav2_1_channels and
+    #       disconnect_dendrites_from_soma are kept as transactions (see
+    #       transaction_manager) in self.transactions. This undoes the
+    #       latest n of them in place (all with n=None), so the control
+    #       cell is back without building Purkinje() again.
+    # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    def undo( self, n=1 ):
+        """
+        Use case: pc.ko_Cav2_1_channels()
+                  pc.produce_voltage_response()
+                  pc.undo() # control again
+                  pc.undo(None) # all the knockouts/disconnections
+        Returns the names of the capabilities undone.
+        """
+        if n is None:
+            return self.transactions.undo_all()
+        return self.transactions.undo(n)
 
 
     # +++++++++++++++++++++set_simulation_properties++++++++++++++++++++
@@ -301,9 +441,11 @@ class PurkinjeCell( sciunit.Model,
     #       temp =
     #       t_final =
     #       v_init =
+    #       steps_per_ms follows dt so that h.run() keeps dt > 0.025
     # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
     def set_simulation_properties( self, setup_parameters ):
         h.dt = setup_parameters["dt"]
+        h.steps_per_ms = 1.0 / setup_parameters["dt"]
         h.celsius = setup_parameters["celsius"]
         h.tstop = setup_parameters["tstop"]
         h.v_init = setup_parameters["v_init"]
@@ -337,6 +479,260 @@ class PurkinjeCell( sciunit.Model,
             list_of_stimuli[i].delay = \
                     current_parameters["current"+str(i+1)]["delay"]
         return list_of_stimuli
+
+    # ++++++++++++++++++++++++++++advance_to++++++++++++++++++++++++++++
+    # created:  19 October 2026
+    # modified:
+    # Note: This function is NOT model capability function.
+    #       It continues the current simulation (h.continuerun) up to t
+    #       instead of starting again from t=0; the recordings are appended
+    #       to. If nothing was simulated yet (or restart=True) the model is
+    #       initialized first (h.stdinit). Between two calls, stimuli
+    #       (add_stimuli), pc_param (set_pc_param), dt, etc... may change.
+    #       stop_criteria (see simulation_manager.StopMonitor) apply to the
+    #       new segment only; their windows (say, stop_on_silence) count
+    #       from the start of the segment.
+    # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    def advance_to( self, t, stop_criteria=None, restart=False, save=False ):
+        """
+        Use case: pc.set_simulation_properties( setup_parameters )
+                  pc.advance_to(1000.0)
+                  pc.add_stimuli( {"current1": {"amp": 0.1, "dur": 500.0,
+                                                "delay": 0.0}} )
+                  pc.advance_to(1500.0, save=True) # only 500 ms simulated
+        save=True saves and attaches the predictions of the whole run so
+        far (same as produce_voltage_response). Returns the time reached.
+        """
+        if restart:
+            # their delays counted from the time of the old run
+            self.clear_stimuli()
+        if restart or self.cell.vm_soma.size() == 0:
+            h.stdinit()
+        if t < h.t - h.dt/2:
+            raise ValueError("cannot advance to %s ms, the simulation is at %s ms"
+                             % (t, h.t))
+        if h.tstop < t:
+            h.tstop = t
+        if stop_criteria is None:
+            h.continuerun(t)
+            self.predictions["truncated"] = False
+        else:
+            monitor = StopMonitor( h, self.cell.soma, self.cell.vm_soma,
+                                   stop_criteria,
+                                   threshold=self.cell_regions.get("vm_soma", 0.0) )
+            try:
+                reason = continue_with_stop_criteria(h, monitor, t)
+            finally:
+                monitor.close()
+            if reason is None:
+                self.predictions["truncated"] = False
+            else:
+                self.predictions["truncated"] = {"reason": reason, "t_stop": h.t}
+        if save:
+            sp(self, "voltage_response", self.prediction_dir_path)
+        return h.t
+
+    # ++++++++++++++++++++++++++++add_stimuli+++++++++++++++++++++++++++
+    # created:  19 October 2026
+    # modified:
+    # Note: This function is NOT model capability function.
+    #       Same as set_stimulation_properties but the stimuli are kept by
+    #       the model (self.continuation_stimuli) and, with relative=True,
+    #       their delays count from the current time h.t; for a stimulus
+    #       in the next segment of advance_to.
+    # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    def add_stimuli( self, current_parameters, relative=True ):
+        """
+        Use case: pc.add_stimuli( {"current1": {"amp": 0.1, "dur": 500.0,
+                                                "delay": 10.0}} )
+                  # starts 10 ms from now
+                  pc.clear_stimuli()
+        """
+        stimuli = self.set_stimulation_properties(current_parameters)
+        if relative:
+            for stimulus in stimuli:
+                stimulus.delay = stimulus.delay + h.t
+        self.continuation_stimuli.extend(stimuli)
+        return stimuli
+
+    def clear_stimuli( self ):
+        self.continuation_stimuli = []
+
+    # +++++++++++++++++++++++++select_dendrites+++++++++++++++++++++++++
+    # created:  19 October 2026
+    # modified:
+    # Note: This function is NOT model capability function.
+    #       It returns the indices into self.cell.dend meeting ALL the
+    #       given criteria. The spatial index (see morphology_manager) is
+    #       built from the model files on first use, so placing thousands
+    #       of synapses or probes is a vectorized query.
+    # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    def select_dendrites( self, **criteria ):
+        """
+        Use case: pc.select_dendrites( path_distance=(100.0, 200.0) )
+                  pc.select_dendrites( box=((x0, y0, z0), (x1, y1, z1)) )
+                  pc.select_dendrites( diameter=(None, 1.0), group=3 )
+                  # sections, say, for synapses
+                  [ pc.cell.dend[i] for i in pc.select_dendrites(...) ]
+        """
+        if self.section_index is None:
+            self.section_index = SectionIndex.from_files(self.path_to_files)
+        return self.section_index.select(**criteria)
+
+    # +++++++++++++++++++++++++++set_pc_param+++++++++++++++++++++++++++
+    # created:  19 October 2026
+    # modified:
+    # Note: This function is NOT model capability function.
+    #       pc_param (PC_param.py) is only read when Purkinje() is built.
+    #       This sets the given pc_param entries (same keys) in the live
+    #       cell; see pc_param_locations. Entries not given are untouched;
+    #       pc.set_pc_param(pc_param) restores the published values.
+    # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    def set_pc_param( self, parameters ):
+        """
+        Use case: pc.set_pc_param( {"Nav1.6Soma": 0.2, "Kv3.4Soma": 0.06} )
+        """
+        if self.pc_param_sections is None:
+            self.pc_param_sections = {}
+            for key, (attributes, range_variable) in pc_param_locations.items():
+                mechanism = range_variable.split("_", 1)[1]
+                sections = []
+                for attribute in attributes:
+                    a_location = getattr(self.cell, attribute)
+                    if not isinstance(a_location, list):
+                        a_location = [a_location]
+                    sections.extend( [ sec for sec in a_location
+                                       if h.ismembrane(mechanism, sec=sec) ] )
+                self.pc_param_sections[key] = sections
+        for key, value in parameters.items():
+            range_variable = pc_param_locations[key][1]
+            for sec in self.pc_param_sections[key]:
+                setattr(sec, range_variable, value)
+      
+    # ++++++++++++++++++++++++record_dendrites++++++++++++++++++++++++++
+    # created:  19 October 2026
+    # modified:
+    # Note: This function is NOT model capability function.
+    #       It records variable at every segment of the chosen dendrites
+    #       into one (time x compartment) array; see
+    #       recording_manager.SpatialRecorder. The recorder samples every
+    #       later run until the caller closes it (recorder.close()).
+    # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    def record_dendrites( self, variable="v", interval=0.1, sections=None,
+                          memmap_path=None ):
+        """
+        Use case: recorder = pc.record_dendrites( variable="cai" )
+                  recorder = pc.record_dendrites( "v", interval=0.025,
+                                 sections=pc.select_dendrites(diameter=(None, 1.0)) )
+                  pc.produce_voltage_response()
+                  recorder.data # (n_samples, n_compartments)
+                  recorder.close()
+        where sections are indices into self.cell.dend (all by default).
+        """
+        if sections is None:
+            dendrites = self.cell.dend
+        else:
+            dendrites = [ self.cell.dend[int(i)] for i in sections ]
+        return SpatialRecorder( dendrites, variable=variable,
+                                interval=interval, memmap_path=memmap_path )
+
+    # +++++++++++++++++++++++++record_regions+++++++++++++++++++++++++++
+    # created:  19 October 2026
+    # modified:
+    # Note: This function is NOT model capability function.
+    #       It records the area-weighted average of variable over groups
+    #       of dendrites during the run; see recording_manager.RegionRecorder.
+    #       Every call makes a new recorder, which samples every later run
+    #       until the caller closes it (recorder.close()).
+    #       groups = "ModelViewParmSubset" => the (overlapping) groups
+    #                                         of ModelViewParmSubset.txt
+    #                "diameter" => diameter classes of diameter_edges (um)
+    #                {name: indices into self.cell.dend, ...}
+    # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    def record_regions( self, variable="v", interval=0.1,
+                        groups="ModelViewParmSubset",
+                        diameter_edges=(0.0, 3.5, 8.0, np.inf) ):
+        """
+        Use case: recorder = pc.record_regions( variable="cai" )
+                  recorder = pc.record_regions( "v", groups="diameter" )
+                  pc.produce_voltage_response()
+                  recorder.data # (n_samples, n_groups)
+                  recorder.column(3) # ModelViewParmSubset group 3
+                  recorder.close()
+        """
+        if self.section_index is None:
+            self.section_index = SectionIndex.from_files(self.path_to_files)
+        if groups == "ModelViewParmSubset":
+            names = sorted( set(self.section_index.group_ids.tolist()) )
+            members = [ self.section_index.in_group(name) for name in names ]
+        elif groups == "diameter":
+            names = []
+            members = []
+            for lower, upper in zip(diameter_edges[:-1], diameter_edges[1:]):
+                names.append( "diam_%g-%g" % (lower, upper) )
+                members.append( np.flatnonzero( (self.section_index.diam >= lower) &
+                                                 (self.section_index.diam < upper) ) )
+        else:
+            names = list(groups)
+            members = [ groups[name] for name in names ]
+        return RegionRecorder( self.cell.dend, members, variable=variable,
+                               interval=interval, names=names )
+
+    # ++++++++++++++++++++++++set_implicit_time+++++++++++++++++++++++++
+    # created:  19 October 2026
+    # modified:
+    # Note: This function is NOT model capability function.
+    #       The model runs with a fixed time-step (CVode is off) from t=0,
+    #       so rec_t is just t0 + dt*arange(n). With implicit=True rec_t
+    #       stops recording and the predictions carry the time axis
+    #       {"t0", "dt", "n"} (self.predictions["time_axis"]) instead of a
+    #       time column; see simulation_manager.get_recordings.
+    #       t0 and dt are kept at every initialization (an
+    #       FInitializeHandler, which holds the model until
+    #       set_implicit_time(False)), so a dt changed mid-run is refused
+    #       rather than giving a wrong time axis.
+    # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    def set_implicit_time( self, implicit=True ):
+        """
+        Use case: pc.set_implicit_time()      # before the run
+                  pc.set_implicit_time(False) # record rec_t again
+        """
+        if implicit and not self.implicit_time:
+            self.cell.rec_t.play_remove()
+            self.cell.rec_t.resize(0)
+            self.time_axis_handler = h.FInitializeHandler(self._keep_time_axis_start)
+        elif not implicit and self.implicit_time:
+            self.cell.rec_t.record(h._ref_t)
+            self.time_axis_handler = None
+            self.time_axis_start = None
+        self.implicit_time = implicit
+
+    def _keep_time_axis_start( self ):
+        self.time_axis_start = (h.t, h.dt)
+
+    # +++++++++++++++++++++++++compute_features+++++++++++++++++++++++++
+    # created:  19 October 2026
+    # modified:
+    # Note: This function is NOT model capability function.
+    #       It computes the electrophysiological features (see
+    #       feature_manager) of the voltage responses in self.predictions,
+    #       so produce_voltage_response() must have been called.
+    # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
+    def compute_features( self, stimulus=None, parameters=None ):
+        """
+        Use case: pc.produce_voltage_response()
+                  pc.compute_features()
+                  pc.predictions["features"]["vm_soma"]["rate"]
+                  # for a current step from 1000 to 2000 ms
+                  pc.compute_features( stimulus=(1000.0, 2000.0) )
+        """
+        features = features_from_predictions( self.predictions["voltage_response"],
+                                              self.cell_regions,
+                                              stimulus=stimulus,
+                                              parameters=parameters,
+                                              time_axis=self.predictions.get("time_axis") )
+        self.predictions["features"] = features
+        return features
       
     # +++++++++++++++++++++++++++++reset++++++++++++++++++++++++++++++++
     # created:  29 January 2018
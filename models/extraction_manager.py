@@ -0,0 +1,307 @@
+# =============================================================================
+# extraction_manager.py
+#
+# created  19 October 2026 Lungsi
+#
+# This py-file contains the batch extraction of spikes and features from the
+# saved voltage traces of a model-predictions tree (say, an archive of
+# thousands of vm_*.txt files), instead of one
+# signal_processing_manager.convert_vm_to_spike_train_from_file call per
+# file. Run it from the root of the package
+#   $ python -m models.extraction_manager model-predictions --processes 8
+# or initiated by
+#
+# from models import extraction_manager
+#
+# and individual extraction_manager initiated by:
+#
+# 1. extraction_manager.scan_prediction_files ( root=None,
+#                                               patterns=["vm_*.txt", "vm_*.trc"] )
+#    note: The paths (relative to root, by default
+#          file_manager.root_path/model-predictions) of the files in the
+#          tree whose names match any of the patterns, sorted.
+#
+# 2. extraction_manager.read_trace_file ( file_path )
+#    note: Returns (time, volts) of a saved prediction, the txt-files of
+#          save_predictions (two columns or an implicit time axis, see
+#          file_manager.load_prediction_file) or the .trc files of
+#          storage_manager. The text is parsed by np.fromstring at once
+#          (np.loadtxt before numpy 1.23 parses it line by line in Python).
+#
+# 3. extraction_manager.run_batch_extraction ( root=None, output_path=None,
+#                                              processes=None )
+#    note: Extracts, in a pool of processes, the spike times (see
+#          feature_manager.detect_spikes) and the features (see
+#          feature_manager.extract_features) of every file found by 1.
+#          The threshold of a file is that of its cell region (the file
+#          name, say, vm_soma) in cell_regions, else theta.
+#          The results are consolidated in ONE json-file, output_path (by
+#          default root/extraction_results.json),
+#          {"settings": {"theta", "cell_regions", "stimulus", "parameters"},
+#           "files": {relative path: {"mtime", "size", "sha1",
+#                                     "spike_times", "features"}}}
+#          which is also the manifest: on the next call with the same
+#          settings a file whose mtime and size are unchanged (or, with
+#          use_hash=True, whose sha1 is unchanged; only the files whose
+#          mtime or size changed are read for it) is skipped, and the
+#          entries of deleted files are removed. With other settings every
+#          file is extracted again. Returns {"processed", "skipped",
+#          "removed", "failed"} (lists of relative paths).
+#
+# 4. extraction_manager.write_features_table ( output_path, csv_path )
+#    note: The features of the results as a csv table, one row per file.
+#
+# =============================================================================
+
+import os
+import json
+import fnmatch
+import hashlib
+import argparse
+import multiprocessing
+
+import numpy as np
+
+from .file_manager import root_path as package_root_path
+from .file_manager import get_time_from_axis
+from .feature_manager import detect_spikes
+from .feature_manager import extract_features
+
+
+default_patterns = ("vm_*.txt", "vm_*.trc")
+default_cell_regions = {"vm_soma": 0.0, "vm_NOR3": -20.0} # as PurkinjeCell
+results_file_name = "extraction_results.json"
+
+
+def scan_prediction_files(root=None, patterns=default_patterns):
+    """
+    Use case: scan_prediction_files() # ["cells/PC2015Masoli/vm_soma.txt", ...]
+    """
+    if root is None:
+        root = os.path.join(package_root_path, "model-predictions")
+    found = []
+    for dir_path, dir_names, file_names in os.walk(root):
+        for file_name in file_names:
+            if any( fnmatch.fnmatch(file_name, pattern) for pattern in patterns ):
+                found.append( os.path.relpath( os.path.join(dir_path, file_name),
+                                               root ) )
+    return sorted(found)
+
+
+def read_trace_file(file_path):
+    """
+    Use case: time, volts = read_trace_file( "model-predictions/cells/PC2015Masoli/vm_soma.txt" )
+    """
+    name = os.path.splitext( os.path.basename(file_path) )[0]
+    if file_path.endswith(".trc"):
+        from .storage_manager import load_traces
+        traces = load_traces(file_path)
+        return traces["time"], traces[name]
+    with open(file_path) as a_file:
+        text = a_file.read()
+    header = ""
+    while text.startswith("#"):
+        line_end = text.find("\n")
+        if line_end < 0:
+            line_end = len(text)
+        header, text = text[:line_end], text[line_end+1:]
+    first_line = text[:text.find("\n")] if "\n" in text else text
+    n_columns = len( first_line.replace(",", " ").split() )
+    values = np.fromstring( text.replace(",", " "), sep=" " )
+    if n_columns == 1 and "dt=" in header:
+        time_axis = dict( (key, float(value))
+                          for key, value in [ item.split("=")
+                                              for item in header[1:].split() ] )
+        time_axis["n"] = len(values)
+        return get_time_from_axis(time_axis), values
+    values = values.reshape(-1, n_columns)
+    return values[:, 0], values[:, 1]
+
+
+def file_sha1(file_path):
+    """
+    Use case: file_sha1( file_path ) # hex digest of the contents
+    """
+    digest = hashlib.sha1()
+    with open(file_path, "rb") as a_file:
+        for block in iter(lambda: a_file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_signature(file_path, use_hash=False):
+    """
+    Use case: file_signature( file_path ) # {"mtime", "size", "sha1"}
+    sha1 is None unless use_hash is True.
+    """
+    status = os.stat(file_path)
+    signature = {"mtime": status.st_mtime, "size": status.st_size, "sha1": None}
+    if use_hash:
+        signature["sha1"] = file_sha1(file_path)
+    return signature
+
+
+def _is_unchanged(entry, signature):
+    return entry["mtime"] == signature["mtime"] and \
+           entry["size"] == signature["size"]
+
+
+def _settings(theta, cell_regions, stimulus, parameters):
+    # as they read back from the json-file
+    return json.loads( json.dumps( {"theta": theta,
+                                    "cell_regions": cell_regions,
+                                    "stimulus": stimulus,
+                                    "parameters": parameters} ) )
+
+
+def _to_float(value):
+    value = float(value)
+    return None if np.isnan(value) else value
+
+
+def _extract_file(arguments):
+    root, relative_path, signature, theta, stimulus, parameters = arguments
+    entry = dict(signature)
+    try:
+        time, volts = read_trace_file( os.path.join(root, relative_path) )
+        trace_ids, indices, spike_times = detect_spikes(time, volts, theta)
+        features = extract_features( time, volts, theta, stimulus=stimulus,
+                                     parameters=parameters )
+        entry["spike_times"] = spike_times.tolist()
+        entry["features"] = dict( (name, _to_float(values[0]))
+                                  for name, values in features.items() )
+    except Exception as error:
+        entry["error"] = "%s: %s" % (type(error).__name__, error)
+    return relative_path, entry
+
+
+def _load_results(output_path):
+    if os.path.isfile(output_path):
+        with open(output_path) as a_file:
+            return json.load(a_file)
+    return {"files": {}}
+
+
+def _save_results(results, output_path):
+    temporary_path = output_path + ".writing"
+    with open(temporary_path, "w") as a_file:
+        json.dump(results, a_file)
+    os.rename(temporary_path, output_path)
+
+
+def run_batch_extraction( root=None, output_path=None,
+                          patterns=default_patterns, processes=None,
+                          use_hash=False, cell_regions=None, theta=0.0,
+                          stimulus=None, parameters=None, chunksize=8 ):
+    """
+    Use case: summary = run_batch_extraction( "model-predictions", processes=8 )
+              len(summary["processed"]), len(summary["skipped"])
+    """
+    if root is None:
+        root = os.path.join(package_root_path, "model-predictions")
+    if output_path is None:
+        output_path = os.path.join(root, results_file_name)
+    if cell_regions is None:
+        cell_regions = default_cell_regions
+    results = _load_results(output_path)
+    settings = _settings(theta, cell_regions, stimulus, parameters)
+    # the results of other settings are not reused
+    same_settings = results.get("settings") == settings
+    results["settings"] = settings
+    relative_paths = scan_prediction_files(root, patterns)
+    summary = {"processed": [], "skipped": [], "removed": [], "failed": []}
+    tasks = []
+    for relative_path in relative_paths:
+        file_path = os.path.join(root, relative_path)
+        signature = file_signature(file_path)
+        entry = results["files"].get(relative_path)
+        if not same_settings or ( entry is not None and "error" in entry ):
+            entry = None
+        if entry is not None and _is_unchanged(entry, signature):
+            summary["skipped"].append(relative_path)
+            continue
+        if use_hash:
+            # only the files whose mtime or size changed are read
+            signature["sha1"] = file_sha1(file_path)
+            if entry is not None and entry.get("sha1") == signature["sha1"]:
+                # keeps the mtime of a touched but unchanged file
+                entry.update(signature)
+                summary["skipped"].append(relative_path)
+                continue
+        region = os.path.splitext( os.path.basename(relative_path) )[0]
+        tasks.append( (root, relative_path, signature,
+                       cell_regions.get(region, theta), stimulus, parameters) )
+    scanned = set(relative_paths)
+    for relative_path in list(results["files"]):
+        if relative_path not in scanned:
+            del results["files"][relative_path]
+            summary["removed"].append(relative_path)
+    if tasks:
+        pool = multiprocessing.Pool(processes)
+        try:
+            for relative_path, entry in pool.imap_unordered( _extract_file, tasks,
+                                                             chunksize ):
+                results["files"][relative_path] = entry
+                if "error" in entry:
+                    summary["failed"].append(relative_path)
+                else:
+                    summary["processed"].append(relative_path)
+        finally:
+            pool.close()
+            pool.join()
+    _save_results(results, output_path)
+    return summary
+
+
+def write_features_table(output_path, csv_path):
+    """
+    Use case: write_features_table( "model-predictions/extraction_results.json",
+                                    "features.csv" )
+    """
+    results = _load_results(output_path)["files"]
+    names = sorted( set( name for entry in results.values()
+                         for name in entry.get("features", {}) ) )
+    with open(csv_path, "w") as a_file:
+        a_file.write( ",".join(["file"] + names) + "\n" )
+        for relative_path in sorted(results):
+            features = results[relative_path].get("features", {})
+            row = [ "" if features.get(name) is None else repr(features[name])
+                    for name in names ]
+            a_file.write( ",".join([relative_path] + row) + "\n" )
+    return csv_path
+
+
+def main():
+    parser = argparse.ArgumentParser( description="batch spike and feature extraction" )
+    parser.add_argument("root", nargs="?", default=None,
+                        help="model-predictions directory")
+    parser.add_argument("--output", default=None, help="results json-file")
+    parser.add_argument("--csv", default=None, help="also write the features table")
+    parser.add_argument("--pattern", action="append", default=None)
+    parser.add_argument("--processes", type=int, default=None)
+    parser.add_argument("--hash", action="store_true",
+                        help="compare the sha1 of files whose mtime changed")
+    parser.add_argument("--theta", type=float, default=0.0)
+    arguments = parser.parse_args()
+    root = arguments.root
+    if root is None:
+        root = os.path.join(package_root_path, "model-predictions")
+    output_path = arguments.output
+    if output_path is None:
+        output_path = os.path.join(root, results_file_name)
+    summary = run_batch_extraction( root, output_path,
+                                    patterns=arguments.pattern or default_patterns,
+                                    processes=arguments.processes,
+                                    use_hash=arguments.hash,
+                                    theta=arguments.theta )
+    print ( "processed %d, skipped %d, removed %d, failed %d" %
+            tuple( len(summary[key]) for key in ("processed", "skipped",
+                                                 "removed", "failed") ) )
+    if arguments.csv is not None:
+        write_features_table(output_path, arguments.csv)
+
+
+if __name__ == "__main__":
+    main()
+#
+#
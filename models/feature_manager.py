@@ -0,0 +1,298 @@
+# =============================================================================
+# feature_manager.py
+#
+# created  19 October 2026 Lungsi
+#
+# This py-file contains the electrophysiological feature engine. Features
+# are computed for many voltage traces at once; the traces are the rows of
+# a 2D array (n_traces, n_samples) sharing one time array, for eg., the
+# store.column("vm_soma") of a sweep. Spikes of all the traces are found in
+# one pass and the per-spike and per-trace quantities are numpy reductions
+# (bincount, reduceat, argmax over windows), there is no loop over spikes.
+#
+# from models import feature_manager
+#
+# and individual feature_manager initiated by:
+#
+# 1. feature_manager.detect_spikes ( time, volts, theta=0.0 )
+#    note: Returns (trace_ids, indices, spike_times) of every upward
+#          crossing of theta (a scalar or one threshold per trace), sorted
+#          by trace then by time. volts[trace_ids, indices] < theta <=
+#          volts[trace_ids, indices+1] and spike_times are interpolated.
+#          This is the spike detector of the package; for one trace the
+#          spike times are detect_spikes( time, vm, theta )[2].
+#
+# 2. feature_manager.extract_features ( time, volts, theta=0.0,
+#                                       stimulus=None, parameters=None )
+#    note: Returns a dictionary of arrays, one value per trace (NaN when
+#          undefined, say, the isi_cv of a trace with one spike)
+#          spike_count, rate (Hz), mean_isi (ms), isi_cv,
+#          ap_threshold (mV, where dV/dt exceeds dvdt_threshold),
+#          ap_amplitude (mV, peak - ap_threshold), ap_width (ms, at half
+#          amplitude), ahp_depth (mV, ap_threshold - trough before the next
+#          spike) averaged over the spikes of the trace,
+#          n_bursts and burst_fraction (bursts are runs of >= min_spikes
+#          spikes with ISI < burst_isi) and, if stimulus=(start, end) in ms,
+#          v_baseline, v_steady_state and sag_ratio, that is,
+#          (v_steady_state - v_min) / (v_baseline - v_min) for
+#          hyperpolarizing steps. With stimulus the rate is that during the
+#          stimulus.
+#
+# 3. feature_manager.features_from_predictions ( predictions, cell_regions )
+#    note: For the stored predictions of a model,
+#          model.predictions["voltage_response"] ({region: (n, 2) array of
+#          time and voltage}, or voltages alone with
+#          time_axis=model.predictions["time_axis"]), with the thresholds of
+#          cell_regions.
+#          Returns {region: {feature: value}}. This is what
+#          PurkinjeCell.compute_features() calls.
+#
+# 4. feature_manager.load_prediction_files ( file_paths )
+#    note: Loads the txt-files saved in model-predictions (with a time
+#          column or an implicit time axis, see
+#          file_manager.load_prediction_file) into (time, volts) to pass to
+#          extract_features. The files must share the same time stamps.
+#
+# =============================================================================
+
+import numpy as np
+
+from .file_manager import load_prediction_file
+from .file_manager import split_prediction
+
+
+default_parameters = { "dvdt_threshold": 20.0,  # mV/ms, spike onset
+                       "window": 2.0,           # ms, around each crossing
+                       "burst_isi": 10.0,       # ms
+                       "burst_min_spikes": 3,
+                       "sag_window": 50.0,      # ms, baseline & steady-state
+                       "chunk_size": 10000 }    # spikes per window gather
+
+
+def detect_spikes( time, volts, theta=0.0 ):
+    """
+    Use case: trace_ids, indices, spike_times = detect_spikes( time, volts )
+    where volts is (n_traces, n_samples) or (n_samples,)
+    """
+    time = np.asarray(time, dtype=float)
+    volts = np.atleast_2d( np.asarray(volts, dtype=float) )
+    theta = np.broadcast_to( np.asarray(theta, dtype=float),
+                             (volts.shape[0],) )[:, np.newaxis]
+    trace_ids, indices = np.nonzero( (volts[:, :-1] < theta) &
+                                     (volts[:, 1:] >= theta) )
+    v0 = volts[trace_ids, indices]
+    v1 = volts[trace_ids, indices+1]
+    fraction = (theta[trace_ids, 0] - v0) / (v1 - v0)
+    spike_times = time[indices] + fraction * (time[indices+1] - time[indices])
+    return trace_ids, indices, spike_times
+
+
+def _trace_mean( values, trace_ids, n_traces ):
+    # mean of values per trace ignoring NaN; NaN for traces without values
+    valid = ~np.isnan(values)
+    sums = np.bincount( trace_ids[valid], values[valid], minlength=n_traces )
+    counts = np.bincount( trace_ids[valid], minlength=n_traces )
+    # (true division: bincount of no values with weights gives integers)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.true_divide(sums, counts)
+
+
+def _segment_reduce( ufunc, flat, starts, ends ):
+    # ufunc over flat[starts[k]:ends[k]] for every k (ends[k] > starts[k])
+    padded = np.append(flat, flat[-1])
+    indices = np.empty(2 * len(starts), dtype=int)
+    indices[0::2] = starts
+    indices[1::2] = ends
+    return ufunc.reduceat(padded, indices)[0::2]
+
+
+def _spike_shapes( volts, dt, trace_ids, indices, next_indices, parameters ):
+    # onset, peak, half-width of each spike from a window of samples
+    # (chunk_size spikes at a time to bound the memory)
+    n_samples = volts.shape[1]
+    n_before = n_after = max( 2, int(round(parameters["window"] / dt)) )
+    columns = np.arange(-n_before, n_after)
+    onset_v = np.empty(len(indices))
+    peak_v = np.empty(len(indices))
+    peak_index = np.empty(len(indices), dtype=int)
+    width = np.empty(len(indices))
+    for first in range(0, len(indices), parameters["chunk_size"]):
+        rows = slice(first, first + parameters["chunk_size"])
+        absolute = indices[rows, np.newaxis] + columns
+        seg = volts[ trace_ids[rows, np.newaxis],
+                     np.clip(absolute, 0, n_samples - 1) ]
+        rng = np.arange(len(seg))
+        # onset: last sample before the crossing with dV/dt < dvdt_threshold
+        below = ( np.diff(seg[:, :n_before+1], axis=1) / dt
+                  < parameters["dvdt_threshold"] )
+        onset = n_before - 1 - np.argmax(below[:, ::-1], axis=1)
+        onset[~below.any(axis=1)] = 0
+        onset_v[rows] = seg[rng, onset]
+        # peak: maximum after the crossing but before the next spike
+        after = np.where( absolute < next_indices[rows, np.newaxis],
+                          seg, -np.inf )
+        after[:, :n_before] = -np.inf
+        peak = np.argmax(after, axis=1)
+        peak_v[rows] = seg[rng, peak]
+        peak_index[rows] = np.clip( indices[rows] - n_before + peak,
+                                    0, n_samples - 1 )
+        # width at half amplitude, crossings interpolated
+        half = ( (peak_v[rows] + onset_v[rows]) / 2.0 )[:, np.newaxis]
+        under = seg < half
+        cols = np.arange(seg.shape[1])
+        left = np.max( np.where(under & (cols < peak[:, np.newaxis]), cols, -1),
+                       axis=1 )
+        right = np.min( np.where(under & (cols > peak[:, np.newaxis]), cols,
+                                 seg.shape[1]), axis=1 )
+        found = (left >= 0) & (right < seg.shape[1])
+        left = np.clip(left, 0, seg.shape[1] - 2)
+        right = np.clip(right, 1, seg.shape[1] - 1)
+        half = half[:, 0]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            t_left = left + ( (half - seg[rng, left])
+                              / (seg[rng, left+1] - seg[rng, left]) )
+            t_right = right - 1 + ( (seg[rng, right-1] - half)
+                                    / (seg[rng, right-1] - seg[rng, right]) )
+        width[rows] = np.where(found, (t_right - t_left) * dt, np.nan)
+    return onset_v, peak_v, peak_index, width
+
+
+def _bursts( isi, isi_trace, n_traces, parameters ):
+    short = isi < parameters["burst_isi"]
+    continued = np.concatenate( ([False], short[:-1] &
+                                 (isi_trace[1:] == isi_trace[:-1])) )
+    starts = short & ~continued
+    run_id = np.cumsum(starts) - 1
+    run_length = np.bincount( run_id[short], minlength=int(starts.sum()) )
+    run_trace = isi_trace[starts]
+    is_burst = run_length + 1 >= parameters["burst_min_spikes"]
+    n_bursts = np.bincount( run_trace[is_burst], minlength=n_traces )
+    spikes_in_bursts = np.bincount( run_trace[is_burst],
+                                    run_length[is_burst] + 1.0,
+                                    minlength=n_traces )
+    return n_bursts, spikes_in_bursts
+
+
+def _sag( time, volts, stimulus, parameters ):
+    start, end = stimulus
+    window = parameters["sag_window"]
+    baseline = (time >= start - window) & (time < start)
+    during = (time >= start) & (time < end)
+    steady = (time >= end - window) & (time < end)
+    v_baseline = volts[:, baseline].mean(axis=1)
+    v_min = volts[:, during].min(axis=1)
+    v_steady = volts[:, steady].mean(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sag_ratio = np.where( v_min < v_baseline,
+                              (v_steady - v_min) / (v_baseline - v_min), np.nan )
+    return v_baseline, v_steady, sag_ratio
+
+
+def extract_features( time, volts, theta=0.0, stimulus=None, parameters=None ):
+    """
+    Use case: features = extract_features( time, store.column("vm_soma") )
+              features["rate"] # one value per trace
+              extract_features( time, volts, stimulus=(1000.0, 2000.0) )
+    where time is (n_samples,) with a fixed step and volts is
+    (n_traces, n_samples) or (n_samples,).
+    """
+    options = dict(default_parameters)
+    if parameters is not None:
+        options.update(parameters)
+    time = np.asarray(time, dtype=float)
+    volts = np.atleast_2d( np.asarray(volts, dtype=float) )
+    n_traces, n_samples = volts.shape
+    dt = time[1] - time[0]
+    trace_ids, indices, spike_times = detect_spikes(time, volts, theta)
+    #
+    # ====================firing rate and ISIs==========================
+    if stimulus is None:
+        duration = time[-1] - time[0]
+        counted = np.ones(len(spike_times), dtype=bool)
+    else:
+        duration = stimulus[1] - stimulus[0]
+        counted = (spike_times >= stimulus[0]) & (spike_times < stimulus[1])
+    spike_count = np.bincount(trace_ids, minlength=n_traces)
+    features = { "spike_count": spike_count,
+                 "rate": 1000.0 * np.bincount( trace_ids[counted],
+                                               minlength=n_traces ) / duration }
+    same_trace = trace_ids[1:] == trace_ids[:-1]
+    isi = np.diff(spike_times)[same_trace]
+    isi_trace = trace_ids[1:][same_trace]
+    n_isi = np.bincount(isi_trace, minlength=n_traces)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_isi = np.true_divide( np.bincount(isi_trace, isi, minlength=n_traces),
+                                   n_isi )
+        mean_square = np.true_divide( np.bincount(isi_trace, isi**2,
+                                                  minlength=n_traces), n_isi )
+        isi_cv = np.sqrt( np.maximum(mean_square - mean_isi**2, 0.0) ) / mean_isi
+    isi_cv[n_isi < 2] = np.nan
+    features["mean_isi"] = mean_isi
+    features["isi_cv"] = isi_cv
+    #
+    # ======================action potential shape=======================
+    # a spike ends where the next spike of the same trace starts
+    next_indices = np.full(len(indices), n_samples, dtype=int)
+    next_indices[:-1][same_trace] = indices[1:][same_trace]
+    onset_v, peak_v, peak_index, width = _spike_shapes( volts, dt, trace_ids,
+                                                        indices, next_indices,
+                                                        options )
+    offsets = trace_ids * n_samples
+    if len(indices):
+        trough_v = _segment_reduce( np.minimum, volts.ravel(),
+                                    offsets + peak_index,
+                                    offsets + np.maximum(next_indices,
+                                                         peak_index + 1) )
+    else:
+        trough_v = np.empty(0)
+    features["ap_threshold"] = _trace_mean(onset_v, trace_ids, n_traces)
+    features["ap_amplitude"] = _trace_mean(peak_v - onset_v, trace_ids, n_traces)
+    features["ap_width"] = _trace_mean(width, trace_ids, n_traces)
+    features["ahp_depth"] = _trace_mean(onset_v - trough_v, trace_ids, n_traces)
+    #
+    # =============================bursts================================
+    n_bursts, spikes_in_bursts = _bursts(isi, isi_trace, n_traces, options)
+    features["n_bursts"] = n_bursts
+    with np.errstate(invalid="ignore", divide="ignore"):
+        features["burst_fraction"] = np.true_divide(spikes_in_bursts, spike_count)
+    #
+    # ===============================sag=================================
+    if stimulus is not None:
+        v_baseline, v_steady, sag_ratio = _sag(time, volts, stimulus, options)
+        features["v_baseline"] = v_baseline
+        features["v_steady_state"] = v_steady
+        features["sag_ratio"] = sag_ratio
+    return features
+
+
+def features_from_predictions( predictions, cell_regions, stimulus=None,
+                               parameters=None, time_axis=None ):
+    """
+    Use case: features_from_predictions( pc.predictions["voltage_response"],
+                                         pc.cell_regions )
+    time_axis is pc.predictions.get("time_axis") for an implicit time axis.
+    """
+    regions = list(cell_regions)
+    time = split_prediction( predictions[regions[0]], time_axis )[0]
+    volts = np.vstack([ split_prediction(predictions[region], time_axis)[1]
+                        for region in regions ])
+    thetas = np.array([ cell_regions[region] for region in regions ], dtype=float)
+    features = extract_features( time, volts, thetas, stimulus, parameters )
+    return dict( (region, dict( (name, values[i])
+                                for name, values in features.items() ))
+                 for i, region in enumerate(regions) )
+
+
+def load_prediction_files( file_paths ):
+    """
+    Use case: time, volts = load_prediction_files(
+                  ["model-predictions/cells/PC2015Masoli/vm_soma.txt", ...] )
+    """
+    data = [ load_prediction_file(file_path) for file_path in file_paths ]
+    time = data[0][0]
+    for a_time, values in data[1:]:
+        if len(a_time) != len(time) or not np.allclose(a_time, time):
+            raise ValueError("prediction files must share the same time stamps")
+    return time, np.vstack([ values for a_time, values in data ])
+#
+#
@@ -0,0 +1,172 @@
+# =============================================================================
+# fi_manager.py
+#
+# created  19 October 2026 Lungsi
+#
+# The f-I curve (firing frequency against injected current) is otherwise
+# built from step protocols, for eg. 03_positive_current_inj, about one
+# second of simulation per amplitude. This py-file contains the f-I curve
+# from ONE run with a current ramp (IRamp in CurrentRamp.mod), initiated by
+#
+# from models import fi_manager
+#
+# and individual fi_manager initiated by:
+#
+# 1. fi_manager.ramp_current ( time, delay, dur, amp_initial, amp_final )
+#    note: The current (nA) of IRamp at the given times, that is,
+#          (t - delay)/dur * amp_final + amp_initial for
+#          delay <= t <= delay + dur and 0 otherwise. NB: the current at the
+#          end of the ramp is amp_initial + amp_final.
+#
+# 2. fi_manager.fi_from_spike_times ( spike_times, ramp )
+#    note: ramp is {"delay", "dur", "amp_initial", "amp_final"}. Every
+#          interspike interval within the ramp gives one point: the
+#          instantaneous frequency 1000/ISI (Hz) against the ramp current
+#          at the middle of the interval. Returns (current, frequency).
+#
+# 3. fi_manager.run_ramp_fi ( model, amp_initial=0.0, amp_final=1.5,
+#                             dur=10000.0 )
+#    note: Runs the model once with the ramp on the soma and returns
+#          {"current", "frequency", "spike_times", "ramp"}. The slower the
+#          ramp (the larger dur) the closer the curve is to the steady
+#          state f-I of steps; see 5.
+#
+# 4. fi_manager.run_step_fi ( model, amplitudes, dur=1000.0 )
+#    note: The reference: one run per amplitude with a current step, the
+#          frequency being the mean instantaneous frequency over the last
+#          steady_fraction of the step. Returns (amplitudes, frequency).
+#
+# 5. fi_manager.validate_ramp_fi ( model, ramp_fi, amplitudes=[0.2, 0.5, 1.0] )
+#    note: Compares the ramp f-I (the output of 3, averaged within window nA
+#          of each amplitude) with the step f-I (4) at a few amplitudes.
+#          Returns {"current", "step_frequency", "ramp_frequency",
+#          "relative_error", "max_relative_error"}.
+#
+# =============================================================================
+
+import copy
+
+from neuron import h
+import numpy as np
+
+from .simulation_manager import initialize_and_run_NEURON_model as irNm
+from .simulation_manager import get_recordings
+from .protocol_manager import run_protocol
+from .feature_manager import detect_spikes
+
+
+# as 03_positive_current_inj, but tstop is set by the functions below
+default_setup_parameters = { "dt": 0.025, "celsius": 37, "tstop": 0.0,
+                             "v_init": -65 }
+
+
+def ramp_current(time, delay, dur, amp_initial, amp_final):
+    """
+    Use case: current = ramp_current( time, 300.0, 10000.0, 0.0, 1.5 )
+    """
+    time = np.asarray(time, dtype=float)
+    current = (time - delay) / dur * amp_final + amp_initial
+    return np.where( (time >= delay) & (time <= delay + dur), current, 0.0 )
+
+
+def fi_from_spike_times(spike_times, ramp):
+    """
+    Use case: current, frequency = fi_from_spike_times( spike_times,
+                  {"delay": 300.0, "dur": 10000.0,
+                   "amp_initial": 0.0, "amp_final": 1.5} )
+    """
+    spike_times = np.asarray(spike_times, dtype=float)
+    start = ramp["delay"]
+    end = ramp["delay"] + ramp["dur"]
+    spike_times = spike_times[ (spike_times >= start) & (spike_times <= end) ]
+    isi = np.diff(spike_times)
+    middle = spike_times[:-1] + isi / 2.0
+    current = ramp_current( middle, ramp["delay"], ramp["dur"],
+                            ramp["amp_initial"], ramp["amp_final"] )
+    return current, 1000.0 / isi
+
+
+def _soma_spike_times(model, time, responses):
+    theta = model.cell_regions.get("vm_soma", 0.0)
+    trace_ids, indices, spike_times = detect_spikes( time, responses["vm_soma"],
+                                                     theta )
+    return spike_times
+
+
+def run_ramp_fi( model, amp_initial=0.0, amp_final=1.5, dur=10000.0,
+                 delay=300.0, setup_parameters=None ):
+    """
+    Use case: ramp_fi = run_ramp_fi( pc, amp_initial=0.0, amp_final=1.5 )
+              plot( ramp_fi["current"], ramp_fi["frequency"] )
+    """
+    setup_parameters = copy.deepcopy( default_setup_parameters
+                                      if setup_parameters is None
+                                      else setup_parameters )
+    setup_parameters["tstop"] = delay + dur
+    model.set_simulation_properties(setup_parameters)
+    ramp = { "delay": delay, "dur": dur, "amp_initial": amp_initial,
+             "amp_final": amp_final }
+    stimulus = h.IRamp(0.5, sec=model.cell.soma)
+    for name, value in ramp.items():
+        setattr(stimulus, name, value)
+    irNm(h)
+    time, responses = get_recordings(model, copy=False)
+    spike_times = _soma_spike_times(model, time, responses)
+    del stimulus
+    current, frequency = fi_from_spike_times(spike_times, ramp)
+    return { "current": current, "frequency": frequency,
+             "spike_times": spike_times, "ramp": ramp }
+
+
+def run_step_fi( model, amplitudes, dur=1000.0, delay=300.0,
+                 steady_fraction=0.5, setup_parameters=None ):
+    """
+    Use case: amplitudes, frequency = run_step_fi( pc, [0.2, 0.5, 1.0] )
+    NaN for the amplitudes with less than two spikes in the steady part.
+    """
+    setup_parameters = copy.deepcopy( default_setup_parameters
+                                      if setup_parameters is None
+                                      else setup_parameters )
+    setup_parameters["tstop"] = delay + dur
+    steady_start = delay + dur * (1.0 - steady_fraction)
+    frequency = []
+    for amplitude in amplitudes:
+        protocol = { "setup_parameters": setup_parameters,
+                     "current_parameters": {
+                         "current1": {"amp": amplitude, "dur": dur,
+                                      "delay": delay} } }
+        time, responses = run_protocol(model, protocol, copy=False)
+        spike_times = _soma_spike_times(model, time, responses)
+        spike_times = spike_times[ (spike_times >= steady_start) &
+                                   (spike_times <= delay + dur) ]
+        if len(spike_times) < 2:
+            frequency.append(np.nan)
+        else:
+            frequency.append( np.mean(1000.0 / np.diff(spike_times)) )
+    return np.asarray(amplitudes, dtype=float), np.array(frequency)
+
+
+def validate_ramp_fi( model, ramp_fi, amplitudes=(0.2, 0.5, 1.0),
+                      window=0.05, **step_arguments ):
+    """
+    Use case: ramp_fi = run_ramp_fi( pc )
+              validation = validate_ramp_fi( pc, ramp_fi )
+              validation["max_relative_error"]
+    The ramp frequency at an amplitude is the mean of the ramp points
+    within +/- window (nA) of it.
+    """
+    current, step_frequency = run_step_fi(model, amplitudes, **step_arguments)
+    ramp_frequency = np.full(len(current), np.nan)
+    for i, amplitude in enumerate(current):
+        near = np.abs(ramp_fi["current"] - amplitude) <= window
+        if np.any(near):
+            ramp_frequency[i] = np.mean( ramp_fi["frequency"][near] )
+    with np.errstate(invalid="ignore", divide="ignore"):
+        relative_error = np.abs(ramp_frequency - step_frequency) / step_frequency
+    return { "current": current, "step_frequency": step_frequency,
+             "ramp_frequency": ramp_frequency,
+             "relative_error": relative_error,
+             "max_relative_error": np.nanmax(relative_error)
+                                   if np.any(~np.isnan(relative_error)) else np.nan }
+#
+#
@@ -2,7 +2,7 @@
 # file_manager.py
 #
 # created  26 July 2017 Lungsi
-# modified 29 August 2017 Lungsi
+# modified 19 October 2026 Lungsi
 #
 # This py-file contains file functions, initiated by
 #
@@ -44,10 +44,36 @@
 #          This returns the built path.
 #          NOTICE that get_build_path() is called in check_and_make_directory()
 #
+# 5. file_manager.load_prediction_file ( file_path )
+#    note: Returns (time, values) of a saved prediction; for eg.,
+#          model-predictions/cells/PC2015Masoli/vm_soma.txt
+#          The file either has two columns (time, values) or, for fixed
+#          time-step runs with an implicit time axis, one column of values
+#          after the header line "# t0=0.0 dt=0.025 n=40001" from which the
+#          time is rebuilt.
+#
+# 6. file_manager.split_prediction ( prediction, time_axis=None )
+#    note: Same for a prediction attached to a model, that is,
+#          model.predictions["voltage_response"]["vm_soma"] which is either
+#          an (n, 2) array or the values alone with
+#          time_axis = model.predictions["time_axis"] ({"t0", "dt", "n"}).
+#
+# All the paths are built from root_path, the directory containing the
+# models package (by default), and NOT from the working directory. No
+# function here changes the working directory (os.chdir), so models can be
+# built and their predictions saved from threads or from anywhere.
+# Set file_manager.root_path to save "model-predictions" elsewhere.
+#
 # =============================================================================
 
 import os
 
+import numpy as np
+
+# directory of the models package and the directory containing it
+models_path = os.path.dirname(os.path.abspath(__file__))
+root_path = os.path.dirname(models_path)
+
 
 def get_file_path(dir_names=["model-predictions", "cells"], file_name=None):
     """
@@ -60,7 +86,7 @@ def get_file_path(dir_names=["model-predictions", "cells"], file_name=None):
               1. model_name = "PC2015Masoli"
               2. file_name = vm_soma.txt
     """
-    dir_path = os.getcwd()
+    dir_path = root_path
     for dirs in dir_names:
         dir_path += os.sep + dirs
     dir_path = dir_path + os.sep # add a slash to indicate all are folders
@@ -74,8 +100,7 @@ def get_model_lib_path(model_scale=None, model_name=None):
     where model_name is found by calling the get_available_models() function like
     get_available_models(model_scale="cells")
     """
-    current_working_path = os.getcwd() + os.sep + "models"
-    model_path = current_working_path + os.sep + model_scale + os.sep + model_name
+    model_path = models_path + os.sep + model_scale + os.sep + model_name
     model_mod_path = model_path + os.sep + "mod_files"
     model_lib_path = os.path.dirname(model_mod_path) + os.sep + "x86_64" + \
                           os.sep + ".libs" + os.sep + "libnrnmech.so.0" 
@@ -93,7 +118,6 @@ def check_and_make_directory(*directory_names): #"model_predictions"
     the third is checked/made along the path_w/_second_name
     and so on ...
     """
-    root_path = os.getcwd() #+ os.sep + "models"
     current_working_path = root_path # initialize
     if len(directory_names) == 0: # raise error if no directory name is given
         raise ValueError("Must have at least one argument as a string for a directory name.")
@@ -102,13 +126,14 @@ def check_and_make_directory(*directory_names): #"model_predictions"
             # build the directory along the current_working_path
             built_path = get_build_path( current_working_path, dir_name )
             # check that the dir_name exists
-            if not os.path.exists(dir_name): # if it does not exists
+            try:
                 os.makedirs(built_path)  # create the directory
-            # set path to the current dir_name for checking the next dir_name
-            os.chdir(built_path)
+            except OSError:
+                # it exists (or a concurrent call just created it)
+                if not os.path.isdir(built_path):
+                    raise
             # update the current current_working_path
             current_working_path = built_path
-    os.chdir(root_path) # reset to root_path
     return built_path
 
 
@@ -140,9 +165,9 @@ def get_prediction_file( model_name = "CellYearAuthor",
               1. dir_names = list of string of directory names
               2. file_name = vm_soma.txt
     """
-    cwd = os.getcwd() + os.sep + "model-predictions" + os.sep
+    predictions_path = root_path + os.sep + "model-predictions" + os.sep
     dir_path = [ os.path.join(root, name)
-                 for root, dirs, files in os.walk(cwd)
+                 for root, dirs, files in os.walk(predictions_path)
                  for name in dirs
                  if name == model_name ]
     if not dir_path:
@@ -156,5 +181,52 @@ def get_prediction_file( model_name = "CellYearAuthor",
             print("There is no file name called " + file_name)
         else:
             return file_path[0]
+
+
+def get_time_from_axis( time_axis ):
+    """
+    Use case: get_time_from_axis( {"t0": 0.0, "dt": 0.025, "n": 40001} )
+    """
+    return time_axis["t0"] + time_axis["dt"] * np.arange( int(time_axis["n"]) )
+
+
+def format_time_axis( time_axis ):
+    """
+    Use case: np.savetxt( file_path, values, header=format_time_axis(time_axis) )
+    """
+    return "t0=%r dt=%r n=%d" % ( float(time_axis["t0"]), float(time_axis["dt"]),
+                                  int(time_axis["n"]) )
+
+
+def load_prediction_file( file_path ):
+    """
+    Use case: time, volts = load_prediction_file( file_path )
+    """
+    with open(file_path) as prediction_file:
+        first_line = prediction_file.readline()
+    if first_line.startswith("#") and "dt=" in first_line:
+        time_axis = dict( (key, float(value))
+                          for key, value in [ item.split("=")
+                                              for item in first_line[1:].split() ] )
+        values = np.atleast_1d( np.loadtxt(file_path) )
+        time_axis["n"] = len(values)
+        return get_time_from_axis(time_axis), values
+    data = np.loadtxt(file_path)
+    return data[:, 0], data[:, 1]
+
+
+def split_prediction( prediction, time_axis=None ):
+    """
+    Use case: time, volts = split_prediction(
+                                 pc.predictions["voltage_response"]["vm_soma"],
+                                 pc.predictions.get("time_axis") )
+    """
+    prediction = np.asarray(prediction)
+    if prediction.ndim == 2:
+        return prediction[:, 0], prediction[:, 1]
+    if time_axis is None:
+        raise ValueError("a prediction without time column needs its time_axis")
+    time_axis = dict(time_axis, n=len(prediction))
+    return get_time_from_axis(time_axis), prediction
 #
 #
@@ -0,0 +1,482 @@
+# =============================================================================
+# golden_manager.py
+#
+# created  19 October 2026 Lungsi
+#
+# A speed-up of the template, the mechanisms, the discretization or dt must
+# not change what the model does. This py-file contains the golden-trace
+# regression check: the results of every protocol are recorded ONCE as
+# compact golden files and every later run is compared with them. Run it
+# from the root of the package
+#   $ python -m models.golden_manager record --tstop 1500
+#   $ python -m models.golden_manager record --fast
+#   $ python -m models.golden_manager check --fast            # the fast gate
+#   $ python -m models.golden_manager check --processes 6     # the slow check
+# or initiated by
+#
+# from models import golden_manager
+#
+# and individual golden_manager initiated by:
+#
+# 1. golden_manager.record_golden ( model, protocol_name, tstop=None,
+#                                   tables=False, suite=None )
+#    note: Runs the protocol (see protocol_manager) and saves its golden
+#          result into the goldens directory of the model (next to
+#          protocols; goldens/<suite> for a suite, say, "fast") as two files
+#          <protocol_name>.json: the protocol as run (tstop may be cut
+#                 short to keep the check fast), the state of the rate
+#                 tables ("usetable", see table_manager; off by default, so
+#                 the goldens are of the exact rates), the spike thresholds
+#                 ("cell_regions"), the spike times and the features (see
+#                 feature_manager.extract_features) of each cell region,
+#                 for the whole trace ("trace") and for every current of
+#                 the protocol ("current1", ...) within tstop
+#          <protocol_name>.trc: the traces decimated to one sample every
+#                 decimation ms and quantized to max_error mV (see
+#                 storage_manager.save_traces), a few kB.
+#          Returns the golden dictionary.
+#
+# 2. golden_manager.load_golden ( model_scale, model_name, protocol_name )
+#    note: The golden dictionary, with the decimated traces under "traces".
+#
+# 3. golden_manager.compare_to_golden ( golden, time, responses,
+#                                       cell_regions, tolerance=None )
+#    note: For each cell region the metrics (all >= 0)
+#          "spike_count": difference in number of spikes,
+#          "spike_time": largest shift (ms) between matched spike times,
+#          "vm_rms", "vm_max": root mean square and largest difference (mV)
+#                    with the golden trace, on its decimated time stamps,
+#          "feature": largest relative difference of the features,
+#                    |new - golden| / max(|golden|, 1)
+#          and the drift (signed, new - golden)
+#          "spike_shift": mean shift (ms) of the matched spikes,
+#          "features": {epoch: {feature: difference}}.
+#          Returns {"passed", "failed": ["vm_soma spike_time", ...],
+#                   "metrics", "drift"}.
+#
+# 4. golden_manager.check_goldens ( model, protocol_names=None,
+#                                   tolerance=None, suite=None )
+#    note: Reruns the protocol of every golden (by default all the goldens
+#          of the model or suite), with the rate tables and spike
+#          thresholds of the golden, and compares it (3.). Returns
+#          {protocol_name: {"passed", "failed", "metrics", "drift", "time",
+#                           "protocol_changed"}}, time in seconds and
+#          protocol_changed True if the protocol file no longer matches
+#          the protocol of the golden (the golden protocol is what runs).
+#          run_golden_checks( protocol_names, processes ) does the same in
+#          a pool of processes, one model (PurkinjeCell by default) each.
+#
+# Record the goldens before a change is made; they are data of the model,
+# not of the change, so record them again only when a behavior change is
+# intended. The goldens of every protocol at 1500 ms are the slow check;
+# the "fast" suite, fast_protocols cut at fast_tstop, is the fast gate.
+#
+# =============================================================================
+
+import os
+import copy
+import json
+import time
+import datetime
+import argparse
+import collections
+import multiprocessing
+
+import numpy as np
+from neuron import h
+
+from .protocol_manager import get_protocol_dir_path
+from .protocol_manager import get_available_protocols
+from .protocol_manager import load_protocol
+from .protocol_manager import run_protocol
+from .feature_manager import detect_spikes
+from .feature_manager import extract_features
+from .storage_manager import save_traces
+from .storage_manager import load_traces
+from .table_manager import tabulated_mechanisms
+from .table_manager import set_tables
+
+
+default_decimation = 0.5  # ms between the samples of the stored traces
+default_max_error = 0.01  # mV, quantization of the stored traces
+
+# tolerance of each metric; a metric set to None is not checked
+default_tolerance = { "spike_count": 0,    # spikes
+                      "spike_time": 0.5,   # ms
+                      "vm_rms": 2.0,       # mV
+                      "vm_max": None,      # mV
+                      "feature": 0.02 }    # relative
+
+# the features of the epochs of the currents (the rest is for the whole trace)
+epoch_features = ("rate", "v_baseline", "v_steady_state", "sag_ratio")
+
+# the fast gate: the goldens of these protocols cut at fast_tstop (ms), in
+# the fast_suite; 02 and 05 are, that early, the spontaneous firing before
+# the currents of 03 and 04
+fast_suite = "fast"
+fast_protocols = ( "01_no_channels_ais", "03_positive_current_inj",
+                   "04_negative_current_inj", "06_Cav21_KO" )
+fast_tstop = 400.0
+
+
+# state of each worker process of run_golden_checks
+worker_state = {}
+
+
+def get_golden_dir_path(model_scale=None, model_name=None, suite=None):
+    """
+    Use case: get_golden_dir_path(model_scale="cells", model_name="PC2015Masoli")
+    """
+    protocol_dir_path = get_protocol_dir_path(model_scale, model_name)
+    dir_path = os.path.join( os.path.dirname(protocol_dir_path), "goldens" )
+    if suite is not None:
+        dir_path = os.path.join(dir_path, suite)
+    return dir_path
+
+
+def get_available_goldens(model_scale=None, model_name=None, suite=None):
+    """
+    Use case: get_available_goldens(model_scale="cells", model_name="PC2015Masoli")
+    """
+    dir_path = get_golden_dir_path(model_scale, model_name, suite)
+    if not os.path.isdir(dir_path):
+        return []
+    return sorted( [ os.path.splitext(item)[0]
+                     for item in os.listdir(dir_path)
+                     if item.endswith(".json") ] )
+
+
+def _epochs(protocol):
+    # the currents that end after tstop (a golden cut short) are left out
+    tstop = protocol["setup_parameters"]["tstop"]
+    epochs = collections.OrderedDict( [("trace", None)] )
+    for name, current in protocol["current_parameters"].items():
+        if current["delay"] + current["dur"] <= tstop:
+            epochs[name] = ( current["delay"], current["delay"] + current["dur"] )
+    return epochs
+
+
+def _to_float(value):
+    value = float(value)
+    return None if np.isnan(value) else value
+
+
+def summarize_responses(protocol, time, responses, cell_regions):
+    """
+    Use case: spike_times, features = summarize_responses( protocol, time,
+                                          responses, pc.cell_regions )
+    """
+    spike_times = {}
+    features = {}
+    for cell_region, theta in cell_regions.items():
+        volts = responses[cell_region]
+        spike_times[cell_region] = detect_spikes(time, volts, theta)[2].tolist()
+        features[cell_region] = {}
+        for epoch, stimulus in _epochs(protocol).items():
+            values = extract_features(time, volts, theta, stimulus=stimulus)
+            names = values if stimulus is None else epoch_features
+            features[cell_region][epoch] = dict( (name, _to_float(values[name][0]))
+                                                 for name in names )
+    return spike_times, features
+
+
+def _protocol_as_run(protocol, tstop):
+    # tstop only cuts a protocol short, it never runs it longer
+    protocol = copy.deepcopy(protocol)
+    if tstop is not None and tstop < protocol["setup_parameters"]["tstop"]:
+        protocol["setup_parameters"]["tstop"] = tstop
+    return dict( (key, protocol[key])
+                 for key in ("name", "setup_parameters", "current_parameters",
+                             "capabilities") if key in protocol )
+
+
+def _run(model, protocol):
+    start_time = time.time()
+    try:
+        responses = run_protocol(model, protocol)
+    finally:
+        # protocols with capabilities (knockouts) are undone for the next run
+        model.undo( len(protocol.get("capabilities", [])) )
+    elapsed = time.time() - start_time
+    return responses, elapsed
+
+
+def _table_states(tables):
+    # usetable_<suffix> of the tabulated mechanisms loaded (see table_manager)
+    return dict( (suffix, 1 if tables else 0) for suffix in tabulated_mechanisms
+                 if hasattr(h, "usetable_" + suffix) )
+
+
+def _run_with_tables(model, protocol, usetable):
+    previous = set_tables(usetable)
+    try:
+        return _run(model, protocol)
+    finally:
+        set_tables(previous)
+
+
+def record_golden( model, protocol_name, tstop=None, tables=False,
+                   suite=None, decimation=default_decimation,
+                   max_error=default_max_error ):
+    """
+    Use case: record_golden( pc, "03_positive_current_inj", tstop=1500.0 )
+    """
+    protocol = _protocol_as_run( load_protocol( model_scale=model.model_scale,
+                                                model_name=model.model_name,
+                                                protocol_name=protocol_name ),
+                                 tstop )
+    usetable = _table_states(tables)
+    (time_values, responses), elapsed = _run_with_tables(model, protocol, usetable)
+    cell_regions = dict(model.cell_regions)
+    spike_times, features = summarize_responses( protocol, time_values,
+                                                 responses, cell_regions )
+    step = max( 1, int(round( decimation / protocol["setup_parameters"]["dt"] )) )
+    traces = collections.OrderedDict( [("time", time_values[::step])] )
+    for cell_region in sorted(model.cell_regions):
+        traces[cell_region] = responses[cell_region][::step]
+    dir_path = get_golden_dir_path(model.model_scale, model.model_name, suite)
+    if not os.path.isdir(dir_path):
+        os.makedirs(dir_path)
+    save_traces( os.path.join(dir_path, protocol_name + ".trc"), traces,
+                 max_error=dict( (name, max_error) for name in traces
+                                 if name != "time" ),
+                 dtype=dict( (name, "float64" if name == "time" else "float32")
+                             for name in traces ) )
+    golden = collections.OrderedDict( [
+        ("protocol", protocol),
+        ("recorded", datetime.date.today().isoformat()),
+        ("run_time", elapsed),
+        ("decimation", decimation),
+        ("max_error", max_error),
+        ("usetable", usetable),
+        ("cell_regions", cell_regions),
+        ("spike_times", spike_times),
+        ("features", features) ] )
+    with open(os.path.join(dir_path, protocol_name + ".json"), "w") as golden_file:
+        json.dump(golden, golden_file, indent=4, separators=(",", ": "))
+        golden_file.write("\n")
+    golden["traces"] = traces
+    return golden
+
+
+def load_golden(model_scale=None, model_name=None, protocol_name=None,
+                suite=None):
+    """
+    Use case: load_golden( model_scale="cells", model_name="PC2015Masoli",
+                           protocol_name="03_positive_current_inj" )
+    """
+    file_path = os.path.join( get_golden_dir_path(model_scale, model_name, suite),
+                              protocol_name + ".json" )
+    if not os.path.isfile(file_path):
+        raise ValueError("There is no golden called " + protocol_name)
+    with open(file_path) as golden_file:
+        golden = json.load( golden_file,
+                            object_pairs_hook=collections.OrderedDict )
+    golden["traces"] = load_traces( os.path.splitext(file_path)[0] + ".trc" )
+    return golden
+
+
+def _feature_differences(golden_features, features):
+    differences = {}
+    largest = 0.0
+    for epoch, golden_values in golden_features.items():
+        differences[epoch] = {}
+        for name, golden_value in golden_values.items():
+            value = features.get(epoch, {}).get(name)
+            if golden_value is None and value is None:
+                difference, relative = 0.0, 0.0
+            elif golden_value is None or value is None:
+                difference, relative = None, np.inf
+            else:
+                difference = value - golden_value
+                relative = abs(difference) / max(abs(golden_value), 1.0)
+            differences[epoch][name] = difference
+            largest = max(largest, relative)
+    return differences, largest
+
+
+def compare_to_golden(golden, time, responses, cell_regions, tolerance=None):
+    """
+    Use case: time, responses = run_protocol( pc, golden["protocol"] )
+              compare_to_golden( golden, time, responses, pc.cell_regions )
+    """
+    if tolerance is None:
+        tolerance = default_tolerance
+    spike_times, features = summarize_responses( golden["protocol"], time,
+                                                 responses, cell_regions )
+    metrics = {}
+    drift = {}
+    failed = []
+    for cell_region in cell_regions:
+        golden_spikes = np.asarray(golden["spike_times"][cell_region])
+        spikes = np.asarray(spike_times[cell_region])
+        n = min(len(golden_spikes), len(spikes))
+        shifts = spikes[:n] - golden_spikes[:n]
+        error = np.interp( golden["traces"]["time"], time,
+                           responses[cell_region] ) - golden["traces"][cell_region]
+        feature_drift, feature_error = _feature_differences(
+                                           golden["features"][cell_region],
+                                           features[cell_region] )
+        metrics[cell_region] = {
+            "spike_count": abs( len(spikes) - len(golden_spikes) ),
+            "spike_time": float( np.max(np.abs(shifts)) ) if n else 0.0,
+            "vm_rms": float( np.sqrt(np.mean(error**2)) ),
+            "vm_max": float( np.max(np.abs(error)) ),
+            "feature": feature_error }
+        drift[cell_region] = { "spike_shift": float(np.mean(shifts)) if n else 0.0,
+                               "features": feature_drift }
+        for name, limit in sorted(tolerance.items()):
+            if limit is not None and metrics[cell_region][name] > limit:
+                failed.append(cell_region + " " + name)
+    return { "passed": not failed, "failed": failed, "metrics": metrics,
+             "drift": drift }
+
+
+def check_golden(model, protocol_name, tolerance=None, suite=None):
+    """
+    Use case: check_golden( pc, "03_positive_current_inj" )["passed"]
+    """
+    golden = load_golden(model.model_scale, model.model_name, protocol_name,
+                         suite)
+    try:
+        protocol = _protocol_as_run( load_protocol( model_scale=model.model_scale,
+                                                    model_name=model.model_name,
+                                                    protocol_name=protocol_name ),
+                                     golden["protocol"]["setup_parameters"]["tstop"] )
+        protocol_changed = json.loads( json.dumps(protocol) ) != golden["protocol"]
+    except ValueError: # the protocol file was removed
+        protocol_changed = True
+    # goldens recorded before these were kept run as the model is
+    (time_values, responses), elapsed = _run_with_tables( model,
+                                                          golden["protocol"],
+                                                          golden.get("usetable", {}) )
+    result = compare_to_golden( golden, time_values, responses,
+                                golden.get("cell_regions", model.cell_regions),
+                                tolerance )
+    result["time"] = elapsed
+    result["protocol_changed"] = protocol_changed
+    return result
+
+
+def check_goldens(model, protocol_names=None, tolerance=None, suite=None):
+    """
+    Use case: report = check_goldens( pc )
+              all( result["passed"] for result in report.values() )
+    """
+    if protocol_names is None:
+        protocol_names = get_available_goldens(model.model_scale,
+                                               model.model_name, suite)
+    report = collections.OrderedDict()
+    for protocol_name in protocol_names:
+        report[protocol_name] = check_golden(model, protocol_name, tolerance,
+                                             suite)
+    return report
+
+
+def _initialize_worker(model_factory, factory_args):
+    if model_factory is None:
+        from .cells.PC2015Masoli_model import PurkinjeCell as model_factory
+    worker_state["model"] = model_factory(*factory_args)
+    # one process per core, hence no threads within the process
+    from neuron import h
+    h.ParallelContext().nthread(1)
+
+
+def _check_in_worker(arguments):
+    protocol_name, tolerance, suite = arguments
+    return protocol_name, check_golden( worker_state["model"], protocol_name,
+                                        tolerance, suite )
+
+
+def run_golden_checks( protocol_names=None, tolerance=None, processes=None,
+                       model_factory=None, factory_args=(),
+                       model_scale="cells", model_name="PC2015Masoli",
+                       suite=None ):
+    """
+    Use case: report = run_golden_checks( processes=6 )
+              report = run_golden_checks( suite=fast_suite ) # the fast gate
+    """
+    if protocol_names is None:
+        protocol_names = get_available_goldens(model_scale, model_name, suite)
+    if processes is None:
+        processes = min( multiprocessing.cpu_count(), len(protocol_names) )
+    report = collections.OrderedDict()
+    if not protocol_names:
+        return report
+    pool = multiprocessing.Pool( processes, _initialize_worker,
+                                 (model_factory, factory_args) )
+    try:
+        results = dict( pool.map( _check_in_worker,
+                                  [ (protocol_name, tolerance, suite)
+                                    for protocol_name in protocol_names ],
+                                  chunksize=1 ) )
+    finally:
+        pool.close()
+        pool.join()
+    for protocol_name in protocol_names:
+        report[protocol_name] = results[protocol_name]
+    return report
+
+
+def format_report(report):
+    """
+    Use case: print ( format_report( check_goldens( pc ) ) )
+    """
+    lines = []
+    for protocol_name, result in report.items():
+        status = "PASS" if result["passed"] else "FAIL " + ", ".join(result["failed"])
+        lines.append( "%-28s %s (%.1f s)%s" %
+                      ( protocol_name, status, result["time"],
+                        " [protocol changed]" if result["protocol_changed"] else "" ) )
+        for cell_region in sorted(result["metrics"]):
+            metric = result["metrics"][cell_region]
+            lines.append( "    %-8s spikes %+d  shift %+.3f ms (max %.3f)  "
+                          "vm_rms %.3f mV  vm_max %.3f mV  feature %.4f" %
+                          ( cell_region, metric["spike_count"],
+                            result["drift"][cell_region]["spike_shift"],
+                            metric["spike_time"], metric["vm_rms"],
+                            metric["vm_max"], metric["feature"] ) )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser( description="PC2015Masoli golden-trace check" )
+    parser.add_argument("action", choices=["record", "check"])
+    parser.add_argument("protocols", nargs="*",
+                        help="protocol names (by default all)")
+    parser.add_argument("--tstop", type=float, default=None,
+                        help="record: cut the protocols short (ms)")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="check: number of worker processes")
+    parser.add_argument("--fast", action="store_true",
+                        help="the fast gate, fast_protocols cut at fast_tstop")
+    parser.add_argument("--tables", action="store_true",
+                        help="record: with the rate tables (exact rates otherwise)")
+    arguments = parser.parse_args()
+    suite = fast_suite if arguments.fast else None
+    if arguments.action == "record":
+        from .cells.PC2015Masoli_model import PurkinjeCell
+        model = PurkinjeCell()
+        if arguments.fast:
+            protocol_names = arguments.protocols or list(fast_protocols)
+            tstop = fast_tstop if arguments.tstop is None else arguments.tstop
+        else:
+            protocol_names = arguments.protocols or \
+                             get_available_protocols(model.model_scale, model.model_name)
+            tstop = arguments.tstop
+        for protocol_name in protocol_names:
+            golden = record_golden( model, protocol_name, tstop=tstop,
+                                    tables=arguments.tables, suite=suite )
+            print ( "recorded %s (%.1f s)" % (protocol_name, golden["run_time"]) )
+        return
+    report = run_golden_checks( arguments.protocols or None,
+                                processes=arguments.processes, suite=suite )
+    print ( format_report(report) )
+    if not all( result["passed"] for result in report.values() ):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
+#
+#
@@ -0,0 +1,205 @@
+# =============================================================================
+# impedance_manager.py
+#
+# created  19 October 2026 Lungsi
+#
+# Input resistance, membrane time constant and frequency response are
+# otherwise read from seconds of simulated hyperpolarizing steps (say,
+# 04_negative_current_inj). This py-file computes them with NEURON's
+# Impedance class instead, that is, one linear solve of the cell (linearized
+# about its present state) per frequency, for all the compartments at once,
+# initiated by
+#
+# from models import impedance_manager
+#
+# and individual impedance_manager initiated by:
+#
+# 1. impedance_manager.set_linearization_state ( model, v_init=None, t=0.0,
+#                                                 holding=None )
+#    note: The impedance is that of the cell linearized about its present
+#          state (extended=True, the channel gating included) or of the
+#          passive membrane (extended=False, the default). This initializes
+#          the model (h.finitialize) and, for t > 0, runs it without stimuli
+#          up to t ms, say, to settle. Without it the state is that of the
+#          last run.
+#          extended=True means something only about a steady state.
+#          PC2015Masoli fires spontaneously, so its state at t is some
+#          phase of a spike, unless a hyperpolarizing holding current (nA,
+#          into the soma up to t) or knockouts (say, ko_AIS_channels)
+#          silence it.
+#
+# 2. impedance_manager.get_sites ( model )
+#    note: Every compartment (section, x) of the cell connected to the
+#          soma, soma first.
+#
+# 3. impedance_manager.compute_impedance ( model, frequencies=[0.0, 1.0, 10.0],
+#                                          sites=None, extended=False )
+#    note: With the soma(0.5) as the measurement/injection site returns
+#          {"frequency": (n_frequencies,),
+#           "input", "input_phase": (n_frequencies, n_sites),
+#           "transfer", "transfer_phase": (n_frequencies, n_sites),
+#           "sites": [(section name, x), ...]}
+#          input is |Z| (MOhm) of a current injected AND measured at the site,
+#          transfer is |Z| (MOhm) between the site and the soma (the same
+#          for either direction) and the phases are in radians.
+#          For eg. input_resistance = result["input"][0, 0] at 0 Hz.
+#
+# 4. impedance_manager.resonance ( result )
+#    note: For every site the frequency of the largest |Z| (input and
+#          transfer) and the resonance strength Q = |Z(f_res)| / |Z(f_0)|,
+#          f_0 being the lowest frequency computed (say, 0 Hz); Q > 1
+#          only for resonant sites.
+#
+# 5. impedance_manager.time_constant ( model, frequency=0.1, sites=None )
+#    note: The equivalent membrane time constant (ms) at each site from
+#          the phase at a low frequency, tau = -phase / (2 pi f), which is
+#          tau for a single RC compartment and, in general, the mean delay
+#          of the voltage response to a current impulse.
+#
+# 6. impedance_manager.characterize ( model, frequencies=None )
+#    note: 3, 4 and 5 for the soma in one dictionary
+#          {"input_resistance", "time_constant", "resonance_frequency",
+#           "resonance_strength", "impedance"}.
+#
+# Impedance is computed on one thread without multisplit; these are set
+# for the computation and the previous number of threads and multisplit
+# put back afterwards (see simulation_manager.deactivate_multisplit).
+#
+# =============================================================================
+
+from neuron import h
+import numpy as np
+
+from .simulation_manager import discover_cores_activate_multisplit as dcam
+from .simulation_manager import deactivate_multisplit
+
+
+default_frequencies = np.concatenate( [[0.0], np.logspace(-1, 3, 41)] )
+
+
+def set_linearization_state(model, v_init=None, t=0.0, holding=None):
+    """
+    Use case: set_linearization_state( pc, v_init=-65.0, t=500.0, holding=-0.1 )
+              compute_impedance( pc, extended=True )
+    """
+    if v_init is not None:
+        h.v_init = v_init
+    if holding is not None:
+        # removed on return, once the state is set
+        holding_clamp = h.IClamp(0.5, sec=model.cell.soma)
+        holding_clamp.delay = 0.0
+        holding_clamp.dur = 1e9
+        holding_clamp.amp = holding
+    h.finitialize(h.v_init)
+    if t > 0.0:
+        if h.tstop < t:
+            h.tstop = t
+        h.continuerun(t)
+
+
+def get_sites(model):
+    """
+    Use case: sites = get_sites( pc ) # [(section, x), ...]
+    """
+    tree = h.SectionList()
+    tree.wholetree(sec=model.cell.soma)
+    sites = [ (model.cell.soma, seg.x) for seg in model.cell.soma ]
+    for sec in tree:
+        if sec == model.cell.soma:
+            continue
+        sites.extend( [ (sec, seg.x) for seg in sec ] )
+    return sites
+
+
+def _serial():
+    # the state to put back, (number of threads, multisplit active)
+    previous = ( int( h.ParallelContext().nthread() ), deactivate_multisplit(h) )
+    h.ParallelContext().nthread(1)
+    return previous
+
+
+def _restore(previous):
+    nthread, multisplit = previous
+    if multisplit:
+        dcam(h, nthread)
+    else:
+        h.ParallelContext().nthread(nthread)
+
+
+def compute_impedance(model, frequencies=None, sites=None, extended=False):
+    """
+    Use case: result = compute_impedance( pc, [0.0, 5.0, 50.0] )
+              result["transfer"][:, k] # |Z| from site k to the soma
+    """
+    if frequencies is None:
+        frequencies = default_frequencies
+    frequencies = np.asarray(frequencies, dtype=float)
+    if sites is None:
+        sites = get_sites(model)
+    shape = (len(frequencies), len(sites))
+    result = { "frequency": frequencies,
+               "input": np.empty(shape), "input_phase": np.empty(shape),
+               "transfer": np.empty(shape), "transfer_phase": np.empty(shape),
+               "sites": [ (sec.name(), x) for sec, x in sites ] }
+    previous = _serial()
+    try:
+        impedance = h.Impedance()
+        impedance.loc(0.5, sec=model.cell.soma)
+        for i, frequency in enumerate(frequencies):
+            impedance.compute(frequency, 1 if extended else 0)
+            for k, (sec, x) in enumerate(sites):
+                result["input"][i, k] = impedance.input(x, sec=sec)
+                result["input_phase"][i, k] = impedance.input_phase(x, sec=sec)
+                result["transfer"][i, k] = impedance.transfer(x, sec=sec)
+                result["transfer_phase"][i, k] = impedance.transfer_phase(x, sec=sec)
+    finally:
+        _restore(previous)
+    return result
+
+
+def resonance(result):
+    """
+    Use case: peaks = resonance( compute_impedance( pc ) )
+              peaks["input_frequency"], peaks["input_strength"] # per site
+    """
+    lowest = np.argmin(result["frequency"])
+    peaks = {}
+    for name in ("input", "transfer"):
+        magnitude = result[name]
+        largest = np.argmax(magnitude, axis=0)
+        columns = np.arange(magnitude.shape[1])
+        peaks[name + "_frequency"] = result["frequency"][largest]
+        peaks[name + "_strength"] = magnitude[largest, columns] / magnitude[lowest]
+    return peaks
+
+
+def time_constant(model, frequency=0.1, sites=None, extended=False):
+    """
+    Use case: tau = time_constant( pc ) # ms, per site (soma first)
+    """
+    result = compute_impedance( model, [frequency], sites=sites,
+                                extended=extended )
+    return -result["input_phase"][0] / (2.0 * np.pi * frequency) * 1000.0
+
+
+def characterize(model, frequencies=None, extended=False):
+    """
+    Use case: set_linearization_state( pc, v_init=-65.0 )
+              properties = characterize( pc )
+              properties["input_resistance"] # MOhm
+    """
+    if frequencies is None:
+        frequencies = default_frequencies
+    soma = [ (model.cell.soma, 0.5) ]
+    result = compute_impedance( model, frequencies, sites=soma,
+                                extended=extended )
+    peaks = resonance(result)
+    lowest = np.argmin(result["frequency"])
+    return { "input_resistance": result["input"][lowest, 0],
+             "time_constant": time_constant( model, sites=soma,
+                                             extended=extended )[0],
+             "resonance_frequency": peaks["input_frequency"][0],
+             "resonance_strength": peaks["input_strength"][0],
+             "impedance": result }
+#
+#
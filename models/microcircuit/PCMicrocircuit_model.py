@@ -0,0 +1,213 @@
+# =============================================================================
+# PCMicrocircuit_model.py
+#
+# created  19 October 2026 Lungsi
+#
+# This py-file contains the class of the Purkinje cell microcircuit, that
+# is, the cellular model PC2015Masoli (PurkinjeCell) bombarded by parallel
+# fiber (PF) synapses placed on its dendrite (Purkinje.dend sections).
+#
+# The synaptic input is event-driven. Spike times of every fiber are
+# generated beforehand (vectorized in numpy) and played into the synapses
+# through VecStim -> NetCon, so during the run there is no Python callback
+# whatsoever and the cost is the cable solve plus event delivery.
+# Synapses are linear (Exp2Syn), hence all the fibers that land on the
+# same segment share one Exp2Syn, each with its own NetCon.
+#
+# Use case:
+#   from models import microcircuit
+#   mc = microcircuit.PCMicrocircuit.PurkinjeMicrocircuit()
+#   mc.place_synapses( n_synapses=10000 )
+#   spike_times, offsets = microcircuit.PCMicrocircuit.generate_poisson_trains(
+#                              n_trains=10000, rate=1.0,
+#                              t_start=0.0, t_stop=1000.0 )
+#   mc.drive( spike_times, offsets )
+#   mc.run( {"dt": 0.025, "celsius": 37, "tstop": 1000, "v_init": -65} )
+#
+# The format of the spike trains is (spike_times, offsets); the spikes of
+# train i are spike_times[offsets[i]:offsets[i+1]] (sorted) and
+# len(offsets) == n_trains + 1.
+#
+# note: This file is imported in the __init__.py located here as
+#       from . import PCMicrocircuit_model as PCMicrocircuit
+#
+# =============================================================================
+
+from neuron import h
+import numpy as np
+
+from ..cells.PC2015Masoli_model import PurkinjeCell
+
+
+def sort_into_trains(spike_times, train_ids, n_trains):
+    """
+    Use case: sort_into_trains( spike_times, train_ids, n_trains )
+    Returns (spike_times, offsets) sorted by train then by time.
+    """
+    order = np.lexsort( (spike_times, train_ids) )
+    counts = np.bincount(train_ids, minlength=n_trains)
+    offsets = np.concatenate( ([0], np.cumsum(counts)) )
+    return spike_times[order], offsets
+
+
+def generate_poisson_trains( n_trains=1000, rate=1.0, t_start=0.0,
+                             t_stop=1000.0, seed=None ):
+    """
+    Use case: generate_poisson_trains( n_trains=10000, rate=1.0,
+                                       t_start=0.0, t_stop=1000.0 )
+    where rate is in Hz (a scalar or one rate per train) and times in ms.
+    """
+    rng = np.random.RandomState(seed)
+    rate = np.broadcast_to( np.asarray(rate, dtype=float), (n_trains,) )
+    counts = rng.poisson( rate * (t_stop - t_start) / 1000.0 )
+    train_ids = np.repeat( np.arange(n_trains), counts )
+    spike_times = rng.uniform( t_start, t_stop, counts.sum() )
+    return sort_into_trains(spike_times, train_ids, n_trains)
+
+
+def generate_burst_trains( n_trains=1000, burst_onsets=(500.0,),
+                           spikes_per_burst=5, intraburst_rate=100.0,
+                           jitter=1.0, seed=None ):
+    """
+    Use case: generate_burst_trains( n_trains=10000,
+                                     burst_onsets=[500.0, 1500.0],
+                                     spikes_per_burst=5,
+                                     intraburst_rate=100.0, jitter=1.0 )
+    Every train fires spikes_per_burst spikes at intraburst_rate (Hz) after
+    each of the burst_onsets (ms), each burst shifted by a gaussian jitter
+    (ms) drawn per train and per burst.
+    """
+    rng = np.random.RandomState(seed)
+    burst_onsets = np.asarray(burst_onsets, dtype=float)
+    isi = 1000.0 / intraburst_rate
+    # shape (n_trains, n_bursts, spikes_per_burst)
+    spike_times = ( burst_onsets[np.newaxis, :, np.newaxis]
+                    + rng.normal(0.0, jitter, (n_trains, len(burst_onsets), 1))
+                    + isi * np.arange(spikes_per_burst)[np.newaxis, np.newaxis, :] )
+    spike_times = np.maximum(spike_times, 0.0).ravel()
+    train_ids = np.repeat( np.arange(n_trains),
+                           len(burst_onsets) * spikes_per_burst )
+    return sort_into_trains(spike_times, train_ids, n_trains)
+
+
+def merge_trains(*trains):
+    """
+    Use case: merge_trains( generate_poisson_trains(...),
+                            generate_burst_trains(...) )
+    where all the trains have the same n_trains.
+    """
+    n_trains = len(trains[0][1]) - 1
+    spike_times = np.concatenate([ times for times, offsets in trains ])
+    train_ids = np.concatenate([ np.repeat(np.arange(n_trains), np.diff(offsets))
+                                 for times, offsets in trains ])
+    return sort_into_trains(spike_times, train_ids, n_trains)
+
+
+class PurkinjeMicrocircuit(object):
+    '''
+    Use case: from models import microcircuit
+    mc = microcircuit.PCMicrocircuit.PurkinjeMicrocircuit()
+    # or wrap an already instantiated cells.PC2015Masoli.PurkinjeCell()
+    mc = microcircuit.PCMicrocircuit.PurkinjeMicrocircuit( pc )
+    '''
+    # parallel fiber -> Purkinje cell AMPA synapse
+    default_synapse = { "tau1": 0.3,     # ms
+                        "tau2": 3.0,     # ms
+                        "e": 0.0,        # mV
+                        "weight": 0.0005,# uS
+                        "delay": 1.0 }   # ms
+    #
+    def __init__( self, purkinje_cell=None, synapse_parameters=None ):
+        if not hasattr(h, "VecStim"):
+            raise AttributeError("NEURON has no VecStim (vecevent.mod); use NEURON 7.5 or later")
+        self.model_scale = "microcircuit"
+        self.model_name = "PCMicrocircuit"
+        if purkinje_cell is None:
+            purkinje_cell = PurkinjeCell()
+        self.purkinje_cell = purkinje_cell
+        self.dend = purkinje_cell.cell.dend
+        self.synapse_parameters = dict(self.default_synapse)
+        if synapse_parameters is not None:
+            self.synapse_parameters.update(synapse_parameters)
+        self.synapse_section = np.array([], dtype=int)
+        self.synapse_x = np.array([])
+        self.synapses = []       # one Exp2Syn per occupied segment
+        self.synapse_index = np.array([], dtype=int) # synapse -> self.synapses
+        self._vecstims = []
+        self._spike_vectors = []
+        self._netcons = []
+
+    def place_synapses( self, n_synapses=1000, sections=None, seed=None ):
+        """
+        Use case: mc.place_synapses( n_synapses=10000, sections=None )
+                  mc.place_synapses( n_synapses=10000,
+                     sections=mc.purkinje_cell.select_dendrites(
+                                                 diameter=(None, 1.0) ) )
+        where sections is an array of indices into Purkinje.dend (all the
+        dendrite by default). Synapses are placed uniformly along the
+        length of the chosen sections.
+        """
+        rng = np.random.RandomState(seed)
+        if sections is None:
+            sections = np.arange(len(self.dend))
+        sections = np.asarray(sections, dtype=int)
+        lengths = np.array([ self.dend[i].L for i in sections ])
+        nsegs = np.array([ self.dend[i].nseg for i in sections ])
+        chosen = rng.choice( len(sections), n_synapses, p=lengths/lengths.sum() )
+        # snap to the center of the segment the synapse falls in
+        seg = np.floor( rng.uniform(0.0, 1.0, n_synapses) * nsegs[chosen] ).astype(int)
+        self.synapse_section = sections[chosen]
+        self.synapse_x = (seg + 0.5) / nsegs[chosen]
+        # one synapse object per occupied segment
+        segment_key = self.synapse_section * (nsegs.max() + 1) + seg
+        occupied, first, self.synapse_index = np.unique( segment_key,
+                                                         return_index=True,
+                                                         return_inverse=True )
+        self.synapses = []
+        for i in first:
+            syn = h.Exp2Syn( self.synapse_x[i],
+                             sec=self.dend[int(self.synapse_section[i])] )
+            syn.tau1 = self.synapse_parameters["tau1"]
+            syn.tau2 = self.synapse_parameters["tau2"]
+            syn.e = self.synapse_parameters["e"]
+            self.synapses.append(syn)
+
+    def drive( self, spike_times, offsets, weight=None, delay=None ):
+        """
+        Use case: mc.drive( spike_times, offsets )
+        where (spike_times, offsets) is returned by generate_poisson_trains
+        or generate_burst_trains with n_trains == number of synapses.
+        Replaces any previous drive.
+        """
+        n_synapses = len(self.synapse_section)
+        if len(offsets) - 1 != n_synapses:
+            raise ValueError("need one spike train per synapse")
+        if weight is None:
+            weight = self.synapse_parameters["weight"]
+        if delay is None:
+            delay = self.synapse_parameters["delay"]
+        self._vecstims = []
+        self._spike_vectors = []
+        self._netcons = []
+        spike_times = np.asarray(spike_times, dtype=float)
+        for i in range(n_synapses):
+            vec = h.Vector( spike_times[offsets[i]:offsets[i+1]] )
+            stim = h.VecStim()
+            stim.play(vec)
+            nc = h.NetCon( stim, self.synapses[self.synapse_index[i]],
+                           0, delay, weight )
+            self._spike_vectors.append(vec)
+            self._vecstims.append(stim)
+            self._netcons.append(nc)
+
+    def run( self, setup_parameters ):
+        """
+        Use case: mc.run( {"dt": 0.025, "celsius": 37,
+                           "tstop": 1000, "v_init": -65} )
+        The predictions are saved and attached to the Purkinje cell model,
+        mc.purkinje_cell.predictions
+        """
+        self.purkinje_cell.set_simulation_properties(setup_parameters)
+        self.purkinje_cell.produce_voltage_response()
+#
+#
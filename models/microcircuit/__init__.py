@@ -1,6 +1,4 @@
 # microcircuit/
 # microcircuit/ModelDirectoryName_model.py calls the model
 # microcircuit/ModelDirectoryName contains the model files
-from . import ModelDirectoryName_model as ModelDirectoryName
-
-
+from . import PCMicrocircuit_model as PCMicrocircuit
@@ -2,7 +2,7 @@
 # model_manager.py
 #
 # created  26 July 2017 Lungsi
-# modified 29 August 2017 Lungsi
+# modified 19 October 2026 Lungsi
 #
 # This py-file contains functions to manage models, initiated by
 #
@@ -26,16 +26,39 @@
 #          Based on the model_mod_path and model_lib_path this function
 #          checks if the model is already compiled in the lib-path.
 #          If its not compiled the model mod-files in the mod-path
-#          is compiled.
+#          is compiled. It is compiled again if any mod-file is newer
+#          than the compiled library (say, after an edit of its TABLEs).
 #          c. 2.
 #
+# 3. model_manager.load_model_library ( model_lib_path )
+#    note: NEURON refuses to load the same compiled mechanisms twice.
+#          This loads the library (lib-path, see 2.) only the first time
+#          it is called for that path, so the model can be instantiated
+#          any number of times in one Python process; for eg., a network.
+#
+# 4. model_manager.benchmark_cell_template ( template_dir_path, variants,
+#                                            n_builds=3 )
+#    note: This times the construction of cell templates (the compiled
+#          library must be loaded, see 3.), variants being
+#          {name: template}, and returns the mean construction time
+#          (seconds) of each; for eg., for PC2015Masoli see
+#          cells/PC2015Masoli/benchmark_dendrites.py
+#
 # =============================================================================
 
 import os
 import subprocess
+import threading
+import time
 
 from neuron import h
 
+from .file_manager import models_path
+
+# lib-paths of already loaded NEURON model libraries
+loaded_model_libraries = set()
+_load_lock = threading.Lock()
+
 
 def get_available_models(model_scale=None):
     """
@@ -44,17 +67,20 @@ def get_available_models(model_scale=None):
     Function gives you the list of available models for the chosen
     modelling scale.
     """
-    root_path = os.getcwd() + os.sep
-    model_path = root_path +  "models" + os.sep + model_scale
-    os.chdir(model_path) # change pwd path to model_path
+    model_path = os.path.join(models_path, model_scale)
     model_directories = \
-            [item for item in os.listdir(os.getcwd()) if os.path.isdir(item)]
-    #print os.path.isdir(model_directories[0]) # will return True
-    os.chdir(os.path.dirname(root_path)) # reset to original path
-    #print os.path.isdir(model_directories[0]) # will return False
+            [ item for item in os.listdir(model_path)
+              if os.path.isdir(os.path.join(model_path, item)) ]
     return model_directories #return os.listdir(model_path)
 
 
+def _is_stale(model_mod_path, model_lib_path):
+    lib_mtime = os.path.getmtime(model_lib_path)
+    return any( os.path.getmtime( os.path.join(model_mod_path, file_name) ) > lib_mtime
+                for file_name in os.listdir(model_mod_path)
+                if file_name.endswith(".mod") )
+
+
 def check_and_compile_model(model_mod_path, model_lib_path):
     """
     Use case: check_and_compile_model(model_mod_path, model_lib_path)
@@ -66,12 +92,45 @@ def check_and_compile_model(model_mod_path, model_lib_path):
     are compiled. The mod directory & compiled directory are both
     childs of their parent model directory.
     """
-    if os.path.isfile(model_lib_path) is False:
+    if os.path.isfile(model_lib_path) is False or \
+       _is_stale(model_mod_path, model_lib_path):
         #os.system("cd " + modelpath + "; nrnivmodl")
         #os.system("nrnivmodl " + modelpath)
         paths = os.path.split(model_mod_path)
-        subprocess.call("cd " + paths[0] + ";nrnivmodl " + paths[1], shell=True)
+        # compiled in the model directory without changing our own cwd
+        subprocess.call(["nrnivmodl", paths[1]], cwd=paths[0])
     else:  # uncomment to debug this function
         print("compiled files already exists")
+
+
+def load_model_library(model_lib_path):
+    """
+    Use case: load_model_library(model_lib_path)
+    where model_lib_path is obtained by calling get_model_lib_path()
+    """
+    with _load_lock:
+        if model_lib_path not in loaded_model_libraries:
+            h.nrn_load_dll(model_lib_path)
+            loaded_model_libraries.add(model_lib_path)
+
+
+def benchmark_cell_template(template_dir_path, variants, n_builds=3):
+    """
+    Use case: benchmark_cell_template( path_to_files,
+                                       {"legacy": LegacyPurkinje,
+                                        "hoc loops": Purkinje} )
+    ------------------------------------
+    The cells read their files from template_dir_path (dir_path keyword of
+    the template) and are deleted after each build.
+    """
+    timings = {}
+    for name, template in variants.items():
+        start_time = time.time()
+        for i in range(n_builds):
+            cell = template(dir_path=template_dir_path)
+            del cell
+        timings[name] = (time.time() - start_time) / n_builds
+        print ("--- %s: %s seconds per cell ---" % (name, timings[name]))
+    return timings
 #
 #
@@ -0,0 +1,154 @@
+# =============================================================================
+# morphology_manager.py
+#
+# created  19 October 2026 Lungsi
+#
+# This py-file contains the spatial index of the sections of a cell, initiated by
+#
+# from models import morphology_manager
+#
+# and individual morphology_manager initiated by:
+#
+# 1. morphology_manager.SectionIndex.from_files ( dir_path )
+#    note: dir_path is the directory of the model files; for eg.,
+#          models/cells/PC2015Masoli/ containing
+#          coordinate.csv   (index, x1 y1 z1 diam1, x2 y2 z2 diam2),
+#          connections.csv  (child, child_x, parent, parent_x) and
+#          ModelViewParmSubset.txt (section, group)
+#          The index is built once, without NEURON, and holds for every
+#          section (in the order of Purkinje.dend)
+#          midpoint   => (n, 3) array of 3D midpoints
+#          length     => section lengths (um)
+#          diam       => section diameters (um)
+#          path_distance => path distance (um) from the soma to the section
+#                           midpoint, computed in one traversal of the tree
+#          and a KD-tree over the midpoints.
+#
+# 2. Queries (all return sorted numpy arrays of indices into Purkinje.dend)
+#    index.with_path_distance ( 100.0, 200.0 )
+#    index.with_diameter ( None, 1.0 )  # None => unbounded
+#    index.within_box ( (x0, y0, z0), (x1, y1, z1) )
+#    index.within_radius ( (x, y, z), radius )
+#    index.in_group ( group )            # ModelViewParmSubset group
+#    index.nearest ( points )            # for (m, 3) points, vectorized
+#    index.select ( path_distance=(100.0, 200.0), diameter=(None, 1.0), ... )
+#    note: select() intersects any of the above criteria.
+#
+#    NB: path distances are measured from the point where the dendrite
+#        joins the soma, that is, soma(1). h.distance() from soma(0.5)
+#        is larger by soma.L/2.
+#
+# =============================================================================
+
+import os
+import collections
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+class SectionIndex(object):
+    '''
+    Use case: index = SectionIndex.from_files( pc.path_to_files )
+    dend_indices = index.select( path_distance=(100.0, 200.0),
+                                 diameter=(None, 1.0) )
+    '''
+    def __init__( self, coordinates, connections, subsets=None ):
+        coordinates = np.atleast_2d(coordinates)
+        connections = np.atleast_2d(connections)
+        start = coordinates[:, 1:4]
+        end = coordinates[:, 5:8]
+        self.n_sections = len(coordinates)
+        self.midpoint = (start + end) / 2.0
+        self.length = np.sqrt( np.sum((end - start)**2, axis=1) )
+        self.diam = coordinates[:, 4].copy()
+        self.parent = np.full(self.n_sections, -1, dtype=int)
+        self.parent[connections[:, 0].astype(int)] = connections[:, 2].astype(int)
+        self.path_distance = self._compute_path_distance( connections )
+        if subsets is None:
+            subsets = np.empty((0, 2), dtype=int)
+        subsets = np.atleast_2d(subsets).astype(int)
+        self.group_sections = subsets[:, 0]
+        self.group_ids = subsets[:, 1]
+        self.tree = cKDTree(self.midpoint)
+
+    @classmethod
+    def from_files( cls, dir_path ):
+        coordinates = np.genfromtxt( os.path.join(dir_path, "coordinate.csv") )
+        connections = np.genfromtxt( os.path.join(dir_path, "connections.csv") )
+        subsets = np.genfromtxt( os.path.join(dir_path, "ModelViewParmSubset.txt"),
+                                 dtype=int )
+        return cls(coordinates, connections, subsets)
+
+    def _compute_path_distance( self, connections ):
+        children = collections.defaultdict(list)
+        for child, child_x, parent, parent_x in connections:
+            children[int(parent)].append( (int(child), parent_x) )
+        # distance from soma(1) to the start (x=0) of each section
+        section_start = np.zeros(self.n_sections)
+        queue = collections.deque( [0] ) # dend[0] is connected to soma(1)
+        while queue:
+            parent = queue.popleft()
+            for child, parent_x in children[parent]:
+                section_start[child] = ( section_start[parent]
+                                         + parent_x * self.length[parent] )
+                queue.append(child)
+        return section_start + self.length / 2.0
+
+    @staticmethod
+    def _in_range( values, lower, upper ):
+        mask = np.ones(len(values), dtype=bool)
+        if lower is not None:
+            mask &= values >= lower
+        if upper is not None:
+            mask &= values <= upper
+        return np.flatnonzero(mask)
+
+    def with_path_distance( self, lower=None, upper=None ):
+        return self._in_range(self.path_distance, lower, upper)
+
+    def with_diameter( self, lower=None, upper=None ):
+        return self._in_range(self.diam, lower, upper)
+
+    def within_box( self, lower_corner, upper_corner ):
+        lower_corner = np.asarray(lower_corner, dtype=float)
+        upper_corner = np.asarray(upper_corner, dtype=float)
+        mask = np.all( (self.midpoint >= lower_corner) &
+                       (self.midpoint <= upper_corner), axis=1 )
+        return np.flatnonzero(mask)
+
+    def within_radius( self, center, radius ):
+        return np.array( sorted(self.tree.query_ball_point(center, radius)),
+                         dtype=int )
+
+    def in_group( self, group ):
+        return np.unique( self.group_sections[self.group_ids == group] )
+
+    def nearest( self, points ):
+        distances, indices = self.tree.query( np.atleast_2d(points) )
+        return indices
+
+    def select( self, path_distance=None, diameter=None, box=None,
+                sphere=None, group=None ):
+        """
+        Use case: index.select( path_distance=(100.0, 200.0),
+                                diameter=(None, 1.0),
+                                box=((x0, y0, z0), (x1, y1, z1)),
+                                sphere=((x, y, z), radius),
+                                group=3 )
+        Criteria left as None are not applied.
+        """
+        selected = np.arange(self.n_sections)
+        if path_distance is not None:
+            selected = np.intersect1d(selected, self.with_path_distance(*path_distance))
+        if diameter is not None:
+            selected = np.intersect1d(selected, self.with_diameter(*diameter))
+        if box is not None:
+            selected = np.intersect1d(selected, self.within_box(*box))
+        if sphere is not None:
+            selected = np.intersect1d(selected, self.within_radius(*sphere))
+        if group is not None:
+            selected = np.intersect1d(selected, self.in_group(group))
+        return selected
+#
+#
@@ -0,0 +1,221 @@
+# =============================================================================
+# PCNetwork_model.py
+#
+# created  19 October 2026 Lungsi
+#
+# This py-file contains the class of a network of Purkinje cells. Every
+# cell is the cell template of the cellular model PC2015Masoli, that is,
+# the Purkinje class in models/cells/PC2015Masoli/Purkinje.py
+#
+# The network is distributed with NEURON's ParallelContext. Every cell has
+# a global identifier (gid) and every rank (MPI process) builds ONLY the
+# cells whose gid it owns and ONLY the connections onto those cells. The
+# gid ownership and the connectivity are computed independently (and
+# identically) on every rank from n_cells and the seed, so there is no
+# serial setup on one rank nor any communication before the run.
+# Spikes are exchanged between ranks by NetCon (pc.gid_connect).
+#
+# gid placement (placement=)
+# "round_robin"   => gid % nhost
+# "load_balanced" => greedy longest-processing-time: cells sorted by
+#                    decreasing complexity are given, one by one, to the
+#                    rank with the least total complexity. complexity is a
+#                    list (one value per gid); for eg., number of
+#                    compartments or h.LoadBalance().cell_complexity()
+#
+# Use case on one multi-core Linux box:
+#   $ mpiexec -n 4 nrniv -mpi -python run_network.py
+# or
+#   $ mpiexec -n 4 python run_network.py  # with h.nrnmpi_init() before import
+# where run_network.py is
+#   from models import network
+#   net = network.PCNetwork.PurkinjeNetwork( n_cells=1000,
+#                                            placement="load_balanced" )
+#   net.run( {"dt": 0.025, "celsius": 37, "tstop": 1000, "v_init": -65} )
+#   spike_times, spike_gids = net.gather_spikes() # full arrays on rank 0
+#   net.done()
+# Without MPI the same script runs all the cells in one process; threads
+# within a process are used with nthread=.
+#
+# note: This file is imported in the __init__.py located here as
+#       from . import PCNetwork_model as PCNetwork
+#
+# =============================================================================
+
+import os
+import heapq
+
+from neuron import h
+import numpy as np
+
+from ..file_manager import get_model_lib_path as gmlp
+from ..model_manager import check_and_compile_model as ccm
+from ..model_manager import load_model_library as lml
+from ..simulation_manager import set_runtime_parameters as set_runtime
+from ..cells.PC2015Masoli import Purkinje as cell_template
+
+
+def assign_gids(n_cells, nhost, rank, placement="round_robin", complexity=None):
+    """
+    Use case: assign_gids( 1000, int(pc.nhost()), int(pc.id()),
+                           placement="load_balanced", complexity=[...] )
+    Returns the (sorted) array of gids owned by rank.
+    """
+    if placement == "round_robin":
+        return np.arange(rank, n_cells, nhost)
+    elif placement == "load_balanced":
+        if complexity is None:
+            complexity = np.ones(n_cells)
+        complexity = np.asarray(complexity, dtype=float)
+        if len(complexity) != n_cells:
+            raise ValueError("complexity must have one value per cell")
+        # heaviest cells first; ties broken by gid so every rank agrees
+        order = np.lexsort( (np.arange(n_cells), -complexity) )
+        loads = [ (0.0, host) for host in range(nhost) ]
+        owner = np.empty(n_cells, dtype=int)
+        for gid in order:
+            load, host = heapq.heappop(loads)
+            owner[gid] = host
+            heapq.heappush(loads, (load + complexity[gid], host))
+        return np.flatnonzero(owner == rank)
+    else:
+        raise ValueError("placement must be 'round_robin' or 'load_balanced'")
+
+
+def draw_presynaptic_gids(target_gid, n_cells, n_inputs, seed):
+    """
+    Use case: draw_presynaptic_gids( 5, 1000, 10, seed=1 )
+    The random stream depends only on seed and target_gid, hence the
+    connectivity does not depend on the number of ranks nor on placement.
+    """
+    rng = np.random.RandomState(seed + target_gid)
+    # draw among the n_cells-1 other cells, then skip target_gid (no autapse)
+    source_gids = rng.choice(n_cells-1, min(n_inputs, n_cells-1), replace=False)
+    source_gids[source_gids >= target_gid] += 1
+    return np.sort(source_gids)
+
+
+class PurkinjeNetwork(object):
+    '''
+    Use case: from models import network
+    net = network.PCNetwork.PurkinjeNetwork( n_cells=100 )
+    net.run( setup_parameters )
+    -------------------------------------------
+    Default connectivity: each cell receives n_inputs inhibitory
+    (GABAergic) collateral inputs onto its soma from randomly drawn cells.
+    '''
+    # spike detection and synapse defaults
+    default_connectivity = { "n_inputs": 10,
+                             "weight": 0.001,    # uS
+                             "delay": 1.5,       # ms
+                             "threshold": 0.0,   # mV at axonNOR3
+                             "syn_tau": 5.0,     # ms
+                             "syn_e": -80.0 }    # mV
+    #
+    def __init__( self, n_cells=100, placement="round_robin", complexity=None,
+                  connectivity=None, nthread=1, seed=1, record_vm=False ):
+        #
+        self.model_scale = "network"
+        self.model_name = "PCNetwork"
+        self.n_cells = n_cells
+        self.seed = seed
+        self.connectivity = dict(self.default_connectivity)
+        if connectivity is not None:
+            self.connectivity.update(connectivity)
+        #
+        # ===============distribute the gids across ranks================
+        self.pc = h.ParallelContext()
+        self.rank = int(self.pc.id())
+        self.nhost = int(self.pc.nhost())
+        if nthread > 1:
+            self.pc.nthread(nthread, 1)
+        self.gids = assign_gids( n_cells, self.nhost, self.rank,
+                                 placement=placement, complexity=complexity )
+        #
+        # ==================build only the local cells===================
+        self.cells = {}
+        self.synapses = {}
+        self._spike_detectors = []
+        self._netcons = []
+        self._build_cells(record_vm)
+        self._connect_cells()
+        #
+        # ========record all spikes of the local cells===================
+        self.spike_times = h.Vector()
+        self.spike_gids = h.Vector()
+        self.pc.spike_record(-1, self.spike_times, self.spike_gids)
+
+    def _build_cells( self, record_vm ):
+        model_mod_path, model_lib_path = gmlp( model_scale="cells",
+                                               model_name="PC2015Masoli" )
+        ccm(model_mod_path, model_lib_path)
+        lml(model_lib_path)
+        dir_path = os.path.dirname(os.path.abspath(cell_template.__file__))
+        for gid in self.gids:
+            gid = int(gid)
+            cell = cell_template.Purkinje( dir_path=dir_path )
+            # the template records time and voltage at every step;
+            # keep only what is needed for thousands of cells
+            cell.rec_t.play_remove()
+            cell.vm_NOR3.play_remove()
+            if not record_vm:
+                cell.vm_soma.play_remove()
+            self.pc.set_gid2node(gid, self.rank)
+            detector = h.NetCon( cell.axonNOR3(0.5)._ref_v, None,
+                                 sec=cell.axonNOR3 )
+            detector.threshold = self.connectivity["threshold"]
+            self.pc.cell(gid, detector)
+            self._spike_detectors.append(detector)
+            self.cells[gid] = cell
+
+    def _connect_cells( self ):
+        # the synapse is linear, therefore one synapse per cell receives
+        # all the NetCons targeting that cell
+        for gid, cell in self.cells.items():
+            syn = h.ExpSyn(0.5, sec=cell.soma)
+            syn.tau = self.connectivity["syn_tau"]
+            syn.e = self.connectivity["syn_e"]
+            self.synapses[gid] = syn
+            for src_gid in draw_presynaptic_gids( gid, self.n_cells,
+                                                  self.connectivity["n_inputs"],
+                                                  self.seed ):
+                nc = self.pc.gid_connect(int(src_gid), syn)
+                nc.weight[0] = self.connectivity["weight"]
+                nc.delay = self.connectivity["delay"]
+                self._netcons.append(nc)
+
+    def run( self, setup_parameters ):
+        """
+        Use case: net.run( {"dt": 0.025, "celsius": 37,
+                            "tstop": 1000, "v_init": -65} )
+        All ranks must call this.
+        """
+        set_runtime(h, setup_parameters)
+        self.pc.set_maxstep(10)
+        h.finitialize(setup_parameters["v_init"])
+        self.pc.psolve(setup_parameters["tstop"])
+
+    def gather_spikes( self, root=0 ):
+        """
+        Use case: spike_times, spike_gids = net.gather_spikes()
+        All ranks must call this. On root the spikes of the whole network
+        sorted by time are returned, on the other ranks (None, None).
+        """
+        local = ( np.array(self.spike_times), np.array(self.spike_gids) )
+        gathered = self.pc.py_gather(local, root)
+        if self.rank != root:
+            return None, None
+        spike_times = np.concatenate([ t for t, g in gathered ])
+        spike_gids = np.concatenate([ g for t, g in gathered ]).astype(int)
+        order = np.argsort(spike_times, kind="mergesort")
+        return spike_times[order], spike_gids[order]
+
+    def done( self ):
+        """
+        Use case: net.done()
+        Releases the gids so that another network can be built.
+        """
+        self.pc.barrier()
+        self.pc.gid_clear()
+#
+#
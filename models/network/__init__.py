@@ -1,6 +1,4 @@
 # network/
 # network/ModelDirectoryName_model.py calls the model
 # network/ModelDirectoryName contains the model files
-from . import ModelDirectoryName_model as ModelDirectoryName
-
-
+from . import PCNetwork_model as PCNetwork
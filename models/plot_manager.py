@@ -2,7 +2,7 @@
 # plot_manager.py
 #
 # created  30 August 2017 Lungsi
-# modified 30 August 2017 Lungsi
+# modified 19 October 2026 Lungsi
 #
 # This py-file contains plot functions, initiated by
 #
@@ -28,6 +28,7 @@ import numpy as np
 from matplotlib import pyplot as plt
 
 from .file_manager import get_prediction_file as gpf
+from .file_manager import load_prediction_file
 
 
 def visualize_spikes( model_name = "CellYearAuthor",
@@ -67,9 +68,7 @@ def visualize_voltages( model_name = "CellYearAuthor",
     file_name = region_of_interest + ".txt"
     file_path = gpf( model_name = model_name,
                      file_name = file_name )
-    data = np.loadtxt(file_path)
-    time = data[:,0]
-    volts= data[:,1]
+    time, volts = load_prediction_file(file_path)
     #
     fig = plt.figure()
     plt.plot(time, volts)
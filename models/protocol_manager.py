@@ -0,0 +1,231 @@
+# =============================================================================
+# protocol_manager.py
+#
+# created  19 October 2026 Lungsi
+#
+# This py-file contains functions to manage stimulation protocols, initiated by
+#
+# from models import protocol_manager
+#
+# and individual protocol_manager initiated by:
+#
+# 1. protocol_manager.get_available_protocols ( model_scale="cells",
+#                                               model_name="PC2015Masoli" )
+#    note: A protocol is a json-file saved in the protocols/ directory of
+#          the model, next to the original author script of the same name;
+#          for eg., 03_positive_current_inj.json next to
+#          03_positive_current_inj.py
+#          This returns the list of protocol names (without extension).
+#
+# 2. protocol_manager.load_protocol ( model_scale="cells",
+#                                     model_name="PC2015Masoli",
+#                                     protocol_name="03_positive_current_inj" )
+#    note: This returns the protocol as a dictionary with the keys
+#          "setup_parameters" (same format as set_simulation_properties),
+#          "current_parameters" (same format as set_stimulation_properties)
+#          and "capabilities" (list of capability methods, say,
+#          "ko_AIS_channels", to call before running the protocol).
+#
+# 3. protocol_manager.save_protocol ( protocol,
+#                                     model_scale="cells",
+#                                     model_name="PC2015Masoli" )
+#    note: This (over)writes the json-file of the protocol. It is used to
+#          store results that belong with the protocol; for eg., the
+#          recommended time-step from timestep_manager.
+#
+# 4. protocol_manager.apply_protocol ( model, protocol, dt=None )
+#    note: This sets up the simulation and stimulation of the instantiated
+#          model (say, PurkinjeCell()) as prescribed by the protocol. The
+#          list of stimuli is returned and MUST be kept alive for the
+#          duration of the run (see set_stimulation_properties).
+#
+# 5. protocol_manager.run_protocol ( model, protocol, dt=None )
+#    note: This applies and runs the protocol without saving any files.
+#          Returns the recorded time and a dictionary of the recorded
+#          voltages for each of the model.cell_regions; copy=False
+#          returns views of the recordings instead (valid until the next
+#          run) for results used at once, say, to compute features.
+#
+# 6. protocol_manager.run_protocol_until ( model, protocol, stop_criteria,
+#                                          dt=None )
+#    note: Same as run_protocol but the run ends as soon as one of the
+#          stop_criteria (see simulation_manager.StopMonitor) is met.
+#          Returns time, responses and truncated, which is None or
+#          {"reason": name of the criterion, "t_stop": ms}; the recordings
+#          then end at t_stop.
+#
+# 7. protocol_manager.run_knockout_batch ( model, protocol,
+#                                          ["ko_AIS_channels",
+#                                           "ko_Cav2_1_channels"] )
+#    note: Runs the protocol on the control cell, then for every knockout
+#          (a capability name or a list of them) knocks out, runs and undoes
+#          the knockout (see model.undo) on the same live cell, that is,
+#          control -> KO -> control without building the cell again.
+#          Returns {"control": (time, responses), knockout: (time,
+#          responses), ...}; with check_control=True the control is run
+#          again after every undo and "control_drift" holds the largest
+#          difference (mV) to the first control run, which is 0 if the
+#          undo is complete.
+#
+# =============================================================================
+
+import os
+import copy
+import json
+import collections
+
+from neuron import h
+import numpy as np
+
+from .simulation_manager import initialize_and_run_NEURON_model as irNm
+from .simulation_manager import StopMonitor
+from .simulation_manager import get_recordings
+
+
+def get_protocol_dir_path(model_scale=None, model_name=None):
+    """
+    Use case: get_protocol_dir_path(model_scale="cells", model_name="PC2015Masoli")
+    """
+    models_path = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(models_path, model_scale, model_name, "protocols")
+
+
+def get_available_protocols(model_scale=None, model_name=None):
+    """
+    Use case: get_available_protocols(model_scale="cells", model_name="PC2015Masoli")
+    """
+    dir_path = get_protocol_dir_path(model_scale, model_name)
+    return sorted( [ os.path.splitext(item)[0]
+                     for item in os.listdir(dir_path)
+                     if item.endswith(".json") ] )
+
+
+def load_protocol(model_scale=None, model_name=None, protocol_name=None):
+    """
+    Use case: load_protocol( model_scale="cells", model_name="PC2015Masoli",
+                             protocol_name="03_positive_current_inj" )
+    """
+    file_path = os.path.join( get_protocol_dir_path(model_scale, model_name),
+                              protocol_name + ".json" )
+    if not os.path.isfile(file_path):
+        raise ValueError("There is no protocol called " + protocol_name)
+    with open(file_path) as protocol_file:
+        protocol = json.load( protocol_file,
+                              object_pairs_hook=collections.OrderedDict )
+    return protocol
+
+
+def save_protocol(protocol, model_scale=None, model_name=None):
+    """
+    Use case: save_protocol( protocol, model_scale="cells",
+                             model_name="PC2015Masoli" )
+    where protocol is the dictionary returned by load_protocol().
+    """
+    file_path = os.path.join( get_protocol_dir_path(model_scale, model_name),
+                              protocol["name"] + ".json" )
+    with open(file_path, "w") as protocol_file:
+        json.dump(protocol, protocol_file, indent=4, separators=(",", ": "))
+        protocol_file.write("\n")
+    return file_path
+
+
+def apply_protocol(model, protocol, dt=None):
+    """
+    Use case: stimuli = apply_protocol( pc, protocol )
+    where pc = PurkinjeCell() and protocol is returned by load_protocol().
+    If dt is given it overrides the dt of the protocol setup_parameters.
+    ------------------------------------
+    NB: the capabilities (for eg. "ko_AIS_channels") are applied to the
+        live cell. They are not undone after the run; model.undo() does.
+    """
+    setup_parameters = copy.deepcopy(protocol["setup_parameters"])
+    if dt is not None:
+        setup_parameters["dt"] = dt
+    model.set_simulation_properties(setup_parameters)
+    for capability_name in protocol.get("capabilities", []):
+        getattr(model, capability_name)()
+    return model.set_stimulation_properties(protocol["current_parameters"])
+
+
+def run_protocol(model, protocol, dt=None, copy=True):
+    """
+    Use case: time, responses = run_protocol( pc, protocol, dt=0.05 )
+    where responses = {"vm_soma": array, "vm_NOR3": array}
+    ------------------------------------
+    Unlike produce_voltage_response() nothing is saved into
+    model-predictions and model.predictions is left untouched.
+    With copy=False the arrays are views of the recordings, valid until
+    the next run (see simulation_manager.get_recordings).
+    """
+    stimuli = apply_protocol(model, protocol, dt=dt)
+    irNm(h)
+    time, responses = get_recordings(model, copy=copy)
+    del stimuli
+    return time, responses
+
+
+def run_protocol_until(model, protocol, stop_criteria, dt=None, copy=True):
+    """
+    Use case: time, responses, truncated = run_protocol_until( pc, protocol,
+                                   [stop_after_n_spikes(20)] )
+    where stop_after_n_spikes is in simulation_manager.
+    """
+    stimuli = apply_protocol(model, protocol, dt=dt)
+    monitor = StopMonitor( h, model.cell.soma, model.cell.vm_soma, stop_criteria,
+                           threshold=model.cell_regions.get("vm_soma", 0.0) )
+    try:
+        reason = irNm(h, monitor=monitor)
+    finally:
+        monitor.close()
+    truncated = None if reason is None else {"reason": reason, "t_stop": h.t}
+    time, responses = get_recordings(model, copy=copy)
+    del stimuli
+    return time, responses, truncated
+
+
+def _knockout_name(knockout):
+    if isinstance(knockout, (list, tuple)):
+        return "+".join(knockout)
+    return knockout
+
+
+def run_knockout_batch(model, protocol, knockouts, dt=None, check_control=False):
+    """
+    Use case: results = run_knockout_batch( pc, protocol,
+                            ["ko_Cav2_1_channels",
+                             ["ko_AIS_channels", "disconnect_dendrites_from_soma"]] )
+              results["control"], results["ko_Cav2_1_channels"]
+    The capabilities of the protocol itself are applied once, before the
+    control run, and undone at the end.
+    """
+    control_protocol = copy.deepcopy(protocol)
+    protocol_capabilities = control_protocol.pop("capabilities", [])
+    for capability_name in protocol_capabilities:
+        getattr(model, capability_name)()
+    try:
+        results = collections.OrderedDict()
+        results["control"] = run_protocol(model, control_protocol, dt=dt)
+        if check_control:
+            results["control_drift"] = collections.OrderedDict()
+        for knockout in knockouts:
+            name = _knockout_name(knockout)
+            capability_names = knockout if isinstance(knockout, (list, tuple)) else [knockout]
+            n_before = len(model.transactions)
+            try:
+                for capability_name in capability_names:
+                    getattr(model, capability_name)()
+                results[name] = run_protocol(model, control_protocol, dt=dt)
+            finally:
+                model.undo( len(model.transactions) - n_before )
+            if check_control:
+                time, responses = run_protocol(model, control_protocol, dt=dt,
+                                               copy=False)
+                control_responses = results["control"][1]
+                results["control_drift"][name] = max(
+                    [ float(np.max(np.abs(responses[region] - control_responses[region])))
+                      for region in control_responses ] )
+    finally:
+        model.undo( len(protocol_capabilities) )
+    return results
+#
+#
@@ -0,0 +1,218 @@
+# =============================================================================
+# recording_manager.py
+#
+# created  19 October 2026 Lungsi
+#
+# This py-file contains recorders of many compartments at once, initiated by
+#
+# from models import recording_manager
+#
+# and individual recording_manager initiated by:
+#
+# 1. recording_manager.SpatialRecorder ( sections, variable="v",
+#                                        interval=0.1, memmap_path=None )
+#    note: Records variable (say, "v" or "cai") at every segment of the
+#          sections into ONE preallocated buffer of shape
+#          (n_samples, n_compartments), that is, time x compartment,
+#          instead of one h.Vector per segment. Every interval (ms) the
+#          values are gathered through an h.PtrVector (NEURON 7.5 or later)
+#          into one row of the buffer. The buffer is allocated at
+#          initialization (h.stdinit/h.run) for h.tstop, in memory or, with
+#          memmap_path, in a memory-mapped file (say, on /dev/shm or for
+#          runs larger than the memory), and doubled whenever a run goes on
+#          past it (say, h.continuerun or PurkinjeCell.advance_to beyond
+#          the h.tstop of the initialization).
+#          recorder.data => (n_recorded, n_compartments) array
+#          recorder.time => (n_recorded,) sampling times (ms)
+#          recorder.section_indices, recorder.x => compartment of each
+#          column (index into sections and the segment position)
+#          For eg. for all the dendrites of PC2015Masoli
+#          pc.record_dendrites( variable="cai", interval=0.1 )
+#          The FInitializeHandler, the PtrVector callback and the sampling
+#          events hold the recorder, which samples every later run (and is
+#          never collected) until recorder.close() is called.
+#
+# 2. recording_manager.RegionRecorder ( sections, groups, variable="v",
+#                                       interval=0.1, names=None )
+#    note: Same gathering as 1. but at every sample the compartments are
+#          averaged, weighted by their membrane area, within each group of
+#          sections (groups may overlap; say, the ModelViewParmSubset
+#          groups) and ONLY the group averages are stored, that is,
+#          recorder.data has shape (n_samples, n_groups). The averaging is
+#          one sparse matrix product per sample.
+#          For eg. pc.record_regions( variable="cai",
+#                                     groups="ModelViewParmSubset" )
+#          or groups="diameter" (the diameter classes of the channel
+#          distribution, see PC2015Masoli/Purkinje.py).
+#
+# =============================================================================
+
+from neuron import h
+import numpy as np
+from scipy import sparse
+
+from .simulation_manager import vector_as_numpy
+
+
+def _no_pointer_update():
+    # the PtrVector callback of a closed recorder (None crashes NEURON 8)
+    pass
+
+class SpatialRecorder(object):
+    '''
+    Use case: recorder = SpatialRecorder( pc.cell.dend, variable="cai",
+                                          interval=0.1 )
+    h.run()
+    recorder.data # (time x compartment), contiguous
+    recorder.close() # call close() when done; data stays readable
+    '''
+    def __init__( self, sections, variable="v", interval=0.1,
+                  memmap_path=None, dtype="float64" ):
+        if not hasattr(h, "PtrVector"):
+            raise AttributeError("NEURON has no PtrVector; use NEURON 7.5 or later")
+        self.sections = list(sections)
+        self.variable = variable
+        self.interval = interval
+        self.memmap_path = memmap_path
+        self.dtype = np.dtype(dtype)
+        section_indices = []
+        x = []
+        for i, sec in enumerate(self.sections):
+            for seg in sec:
+                section_indices.append(i)
+                x.append(seg.x)
+        self.section_indices = np.array(section_indices, dtype=int)
+        self.x = np.array(x)
+        self.n_compartments = len(self.x)
+        self.pointers = h.PtrVector(self.n_compartments)
+        self._set_pointers()
+        # NEURON may move the variables (say, cache efficiency or nseg)
+        self.pointers.ptr_update_callback(self._set_pointers)
+        self.gathered = h.Vector(self.n_compartments)
+        self.n_columns = self.n_compartments
+        self.buffer = None
+        self.n_recorded = 0
+        self.closed = False
+        self._init_handler = h.FInitializeHandler(self._on_initialize)
+
+    def close( self ):
+        """
+        Use case: recorder.close() # no more sampling, recorder.data is kept
+        Releases the FInitializeHandler and the PtrVector callback (bound
+        methods of the recorder); a pending sampling event stops there.
+        """
+        self.closed = True
+        self._init_handler = None
+        self.pointers.ptr_update_callback(_no_pointer_update)
+
+    def _set_pointers( self ):
+        reference = "_ref_" + self.variable
+        i = 0
+        for sec in self.sections:
+            for seg in sec:
+                self.pointers.pset(i, getattr(seg, reference))
+                i += 1
+
+    def _allocate( self, n_samples ):
+        shape = (n_samples, self.n_columns)
+        if self.buffer is not None and self.buffer.shape == shape:
+            return
+        if self.memmap_path is None:
+            self.buffer = np.empty(shape, dtype=self.dtype)
+        else:
+            self.buffer = np.memmap( self.memmap_path, dtype=self.dtype,
+                                     mode="w+", shape=shape )
+
+    def _grow( self, n_samples ):
+        # the recorded rows are kept; a memory-mapped file is extended
+        shape = (n_samples, self.n_columns)
+        if self.memmap_path is None:
+            buffer = np.empty(shape, dtype=self.dtype)
+            buffer[:self.n_recorded] = self.buffer[:self.n_recorded]
+            self.buffer = buffer
+        else:
+            self.buffer.flush()
+            with open(self.memmap_path, "r+b") as memmap_file:
+                memmap_file.truncate( n_samples * self.n_columns
+                                      * self.dtype.itemsize )
+            self.buffer = np.memmap( self.memmap_path, dtype=self.dtype,
+                                     mode="r+", shape=shape )
+
+    def _on_initialize( self ):
+        self._allocate( int(round(h.tstop / self.interval)) + 1 )
+        self.n_recorded = 0
+        self._sample()
+
+    def _sample( self ):
+        if self.closed:
+            return
+        if self.n_recorded >= len(self.buffer):
+            self._grow( 2 * len(self.buffer) )
+        self.pointers.gather(self.gathered)
+        self.buffer[self.n_recorded] = self._reduce( vector_as_numpy(self.gathered) )
+        self.n_recorded += 1
+        # next sample time from the count, so no drift accumulates
+        h.CVode().event( self.n_recorded * self.interval, self._sample )
+
+    def _reduce( self, values ):
+        return values
+
+    @property
+    def data( self ):
+        return self.buffer[:self.n_recorded]
+
+    @property
+    def time( self ):
+        return self.interval * np.arange(self.n_recorded)
+
+    def columns_of( self, section_index ):
+        """
+        Use case: recorder.data[:, recorder.columns_of(138)] # segments of dend[138]
+        """
+        return np.flatnonzero(self.section_indices == section_index)
+
+
+class RegionRecorder(SpatialRecorder):
+    '''
+    Use case: recorder = RegionRecorder( pc.cell.dend,
+                                         [[0, 1, 2], [3, 4]], # section indices
+                                         variable="v", names=["a", "b"] )
+    h.run()
+    recorder.data # (time x group) area-weighted averages
+    recorder.close() # as SpatialRecorder
+    '''
+    def __init__( self, sections, groups, variable="v", interval=0.1,
+                  names=None, memmap_path=None, dtype="float64" ):
+        SpatialRecorder.__init__( self, sections, variable=variable,
+                                  interval=interval, memmap_path=memmap_path,
+                                  dtype=dtype )
+        self.names = list(range(len(groups))) if names is None else list(names)
+        area = np.array([ seg.area() for sec in self.sections for seg in sec ])
+        # weights[g, c] = area of compartment c / total area of group g
+        rows = []
+        columns = []
+        for g, group in enumerate(groups):
+            in_group = np.flatnonzero( np.in1d(self.section_indices,
+                                               np.asarray(group, dtype=int)) )
+            rows.append( np.full(len(in_group), g, dtype=int) )
+            columns.append(in_group)
+        rows = np.concatenate(rows) if rows else np.empty(0, dtype=int)
+        columns = np.concatenate(columns) if columns else np.empty(0, dtype=int)
+        weights = area[columns]
+        total = np.bincount(rows, weights, minlength=len(groups))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weights = weights / total[rows]
+        self.weights = sparse.csr_matrix( (weights, (rows, columns)),
+                                          shape=(len(groups), self.n_compartments) )
+        self.n_columns = len(groups)
+
+    def _reduce( self, values ):
+        return self.weights.dot(values)
+
+    def column( self, name ):
+        """
+        Use case: recorder.column(3) # ModelViewParmSubset group 3
+        """
+        return self.data[:, self.names.index(name)]
+#
+#
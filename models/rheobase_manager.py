@@ -0,0 +1,217 @@
+# =============================================================================
+# rheobase_manager.py
+#
+# created  19 October 2026 Lungsi
+#
+# This py-file contains the threshold current (rheobase) search, instead of
+# trial runs by hand with set_stimulation_properties, initiated by
+#
+# from models import rheobase_manager
+#
+# and individual rheobase_manager initiated by:
+#
+# 1. rheobase_manager.find_rheobase ( amp_low=0.0, amp_high=2.0,
+#                                     tolerance=0.01, dur=100.0 )
+#    note: A bracketed search run by a pool of worker processes, each with
+#          ONE model (model_factory(), PurkinjeCell by default):
+#          a. one worker simulates the prefix, from initialization up to
+#             t_prestim (ms), ONCE and writes the state (h.SaveState) into
+#             a state file shared by the workers
+#          b. every round, n_per_round amplitudes evenly spaced within the
+#             bracket (amp_low, amp_high) are run in parallel; each worker
+#             restores the state at t_prestim, injects its step of dur ms
+#             into the soma and stops at the first spike (see
+#             simulation_manager.stop_after_n_spikes)
+#          c. the bracket becomes (largest amplitude without spike, smallest
+#             amplitude with spike) until it is narrower than tolerance (nA).
+#          Returns {"rheobase": smallest amplitude with a spike (nA),
+#                   "bracket": (amp_low, amp_high), "latency": ms from the
+#                   step onset to the first spike at the rheobase,
+#                   "rounds": number of rounds, "evaluations": [(amplitude,
+#                   latency or None), ...]}.
+#          PC2015Masoli fires spontaneously; a hyperpolarizing holding
+#          current (nA, during the prefix and the step) silences it. The
+#          first round also runs a control without step (amplitude 0)
+#          and a spike in it raises ValueError naming the holding, since
+#          the spontaneous spikes would count as well.
+#
+# 2. rheobase_manager.run_from_state ( prepared, state_path, amplitude, dur )
+#    note: b. for one amplitude in the present process, where prepared is
+#          returned by prepare_model( model, setup_parameters ) and the
+#          state saved by save_prefix_state( prepared, t_prestim,
+#          state_path ) in a process with the same model and prepare_model.
+#
+# =============================================================================
+
+import os
+import tempfile
+import multiprocessing
+
+from neuron import h
+import numpy as np
+
+from .simulation_manager import StopMonitor
+from .simulation_manager import stop_after_n_spikes
+from .simulation_manager import continue_with_stop_criteria
+
+
+default_setup_parameters = { "dt": 0.025, "celsius": 37, "tstop": 0.0,
+                             "v_init": -65 }
+
+
+# state of each worker process of find_rheobase
+worker_state = {}
+
+
+def prepare_model(model, setup_parameters, holding=0.0):
+    """
+    Use case: prepared = prepare_model( pc, setup_parameters, holding=-0.1 )
+    The stimuli and the spike detector, which must exist (and be kept
+    alive) both when the state is saved and when it is restored, because
+    h.SaveState holds the state of every point process and NetCon.
+    """
+    model.set_simulation_properties(setup_parameters)
+    holding_clamp = h.IClamp(0.5, sec=model.cell.soma)
+    holding_clamp.delay = 0.0
+    holding_clamp.dur = 1e9
+    holding_clamp.amp = holding
+    step = h.IClamp(0.5, sec=model.cell.soma)
+    step.delay = 1e9 # off until run_from_state
+    step.dur = 0.0
+    step.amp = 0.0
+    monitor = StopMonitor( h, model.cell.soma, model.cell.vm_soma,
+                           [stop_after_n_spikes(1)],
+                           threshold=model.cell_regions.get("vm_soma", 0.0) )
+    return {"holding": holding_clamp, "step": step, "monitor": monitor}
+
+
+def save_prefix_state(prepared, t_prestim, state_path):
+    """
+    Use case: save_prefix_state( prepared, 300.0, "prefix.state" )
+    """
+    h.tstop = t_prestim
+    h.stdinit()
+    h.continuerun(t_prestim)
+    state = h.SaveState()
+    state.save()
+    state.fwrite( h.File(state_path) )
+    return state_path
+
+
+def run_from_state(prepared, state_path, amplitude, dur):
+    """
+    Use case: latency = run_from_state( prepared, "prefix.state", 0.3, 100.0 )
+    latency (ms) of the first spike after the step onset, or None.
+    """
+    state = h.SaveState()
+    state.fread( h.File(state_path) )
+    state.restore()
+    h.frecord_init() # the recordings start again at t_prestim
+    start = h.t
+    prepared["step"].delay = start
+    prepared["step"].dur = dur
+    prepared["step"].amp = amplitude
+    monitor = prepared["monitor"]
+    monitor.spike_times = []
+    monitor.reason = None
+    monitor.t_start = start
+    h.tstop = start + dur
+    continue_with_stop_criteria(h, monitor, start + dur)
+    prepared["step"].amp = 0.0
+    if monitor.spike_times:
+        return monitor.spike_times[0] - start
+    return None
+
+
+def _initialize_worker(model_factory, factory_args, setup_parameters, holding):
+    if model_factory is None:
+        from .cells.PC2015Masoli_model import PurkinjeCell as model_factory
+    worker_state["model"] = model_factory(*factory_args)
+    # one process per core, hence no threads within the process
+    h.ParallelContext().nthread(1)
+    worker_state["prepared"] = prepare_model( worker_state["model"],
+                                              setup_parameters, holding )
+
+
+def _save_prefix(arguments):
+    t_prestim, state_path = arguments
+    return save_prefix_state( worker_state["prepared"], t_prestim, state_path )
+
+
+def _run_candidate(arguments):
+    state_path, amplitude, dur = arguments
+    return amplitude, run_from_state( worker_state["prepared"], state_path,
+                                      amplitude, dur )
+
+
+def _next_bracket(evaluations, amp_low, amp_high):
+    spiking = [ amplitude for amplitude, latency in evaluations
+                if latency is not None and amplitude <= amp_high ]
+    if spiking:
+        amp_high = min(spiking)
+    silent = [ amplitude for amplitude, latency in evaluations
+               if latency is None and amp_low <= amplitude < amp_high ]
+    if silent:
+        amp_low = max(silent)
+    return amp_low, amp_high
+
+
+def find_rheobase( amp_low=0.0, amp_high=2.0, tolerance=0.01, dur=100.0,
+                   t_prestim=300.0, holding=0.0, n_per_round=None,
+                   setup_parameters=None, model_factory=None,
+                   factory_args=(), processes=None, max_rounds=20 ):
+    """
+    Use case: result = find_rheobase( amp_low=0.0, amp_high=2.0,
+                                      tolerance=0.005, holding=-0.1 )
+              result["rheobase"] # nA
+    """
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    if n_per_round is None:
+        n_per_round = processes
+    if setup_parameters is None:
+        setup_parameters = default_setup_parameters
+    shm = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    handle, state_path = tempfile.mkstemp(prefix="prefix_", suffix=".state",
+                                          dir=shm)
+    os.close(handle)
+    pool = multiprocessing.Pool( processes, _initialize_worker,
+                                 (model_factory, factory_args,
+                                  setup_parameters, holding) )
+    try:
+        pool.apply( _save_prefix, ((t_prestim, state_path),) )
+        # the ends of the bracket are checked in the first round, and a
+        # control without step that the cell is silent at the holding
+        candidates = list( np.linspace(amp_low, amp_high, max(n_per_round, 2)) )
+        if 0.0 not in candidates:
+            candidates.insert(0, 0.0)
+        evaluations = []
+        rounds = 0
+        while True:
+            rounds += 1
+            evaluations.extend( pool.map( _run_candidate,
+                                          [ (state_path, amplitude, dur)
+                                            for amplitude in candidates ] ) )
+            if rounds == 1:
+                latencies = dict(evaluations)
+                if latencies[0.0] is not None:
+                    raise ValueError( "spike without step at holding %s nA; "
+                                      "a more hyperpolarizing holding "
+                                      "silences the cell" % holding )
+                if latencies[amp_low] is not None:
+                    raise ValueError("spike at amp_low %s nA" % amp_low)
+                if latencies[candidates[-1]] is None:
+                    raise ValueError("no spike at amp_high %s nA" % amp_high)
+            amp_low, amp_high = _next_bracket(evaluations, amp_low, amp_high)
+            if amp_high - amp_low <= tolerance or rounds >= max_rounds:
+                break
+            candidates = list( np.linspace(amp_low, amp_high, n_per_round + 2)[1:-1] )
+    finally:
+        pool.close()
+        pool.join()
+        os.remove(state_path)
+    return { "rheobase": amp_high, "bracket": (amp_low, amp_high),
+             "latency": dict(evaluations)[amp_high], "rounds": rounds,
+             "evaluations": sorted(evaluations) }
+#
+#
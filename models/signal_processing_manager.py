@@ -2,7 +2,7 @@
 # signal_processing_manager.py
 #
 # created  29 August 2017 Lungsi
-# modified 29 August 2017 Lungsi
+# modified 19 October 2026 Lungsi
 #
 # This py-file contains functions, initiated by
 #
@@ -29,6 +29,9 @@ from neo.core import IrregularlySampledSignal as iss
 from elephant.spike_train_generation import peak_detection as pd
 from quantities import mV
 
+from .file_manager import load_prediction_file
+from .file_manager import split_prediction
+
 
 def convert_vm_to_spike_train_from_file( path_to_file="/file/path",
                                          theta=0.0):
@@ -52,9 +55,7 @@ def convert_vm_to_spike_train_from_file( path_to_file="/file/path",
     signal_sign = [ "above" if np.sign(x)==0 or 0.0 or 1.0 or 1
                     else "below"
                     for x in [theta] ][0]
-    data = np.loadtxt( path_to_file )
-    column_time = data[:,0]
-    column_volts= data[:,1]
+    column_time, column_volts = load_prediction_file( path_to_file )
     # convert voltage response into analog signal and get spikes
     signal = iss( column_time, column_volts, units='mV', time_units='ms' )
     spikes = pd( signal, threshold=np.array(theta)*mV,
@@ -70,9 +71,10 @@ def convert_voltage_response_to_spike_train( model ):
     response_type = "spike_train"
     model.predictions.update( { response_type: {} } )
     for cell_region, with_thresh in model.cell_regions.iteritems():
-        t_vm = model.predictions["voltage_response"][cell_region]
+        time, volts = split_prediction( model.predictions["voltage_response"][cell_region],
+                                        model.predictions.get("time_axis") )
         # convert voltage response into analog signal
-        signal = iss( t_vm[:,0], t_vm[:,1], units='mV', time_units='ms' )
+        signal = iss( time, volts, units='mV', time_units='ms' )
         # determine the signal sign from the analog signal based on thresh
         signal_sign = [ "above" if np.sign(x)==0 or 0.0 or
                                                1 or 1.0
@@ -2,6 +2,7 @@
 # simulation_manager.py
 #
 # created  26 July 2017 Lungsi
+# modified 19 October 2026 Lungsi
 #
 # This py-file contains file functions, initiated by
 #
@@ -13,11 +14,17 @@
 #
 #    note: This utility is implemented by the py-files (__init__)
 #          containing models written in NEURON simulator.
+#          The cells are split into pieces, one set per thread;
+#          simulation_manager.deactivate_multisplit(h) joins them again
+#          (say, for h.Impedance which does not work with multisplit).
 #
 # 2. simulation_manager.initialize_and_run_NEURON_model(h)
 #
 #    note: This utility is implemented by the py-files (capability method)
 #          containing models written in NEURON simulator.
+#          With monitor=StopMonitor(...) the run stops as soon as one of
+#          its stop criteria is met (see 5.) and the name of that criterion
+#          is returned (None if the run reached tstop).
 #
 # 3. simulation_manager.check_capability_availability( capability_name =
 #                                                      "produce_spike_train",
@@ -36,9 +43,55 @@
 #          whose filename is given by "vm_soma", "vm_NOR3", etc ... These
 #          txt-file/s will be saved in the desired path.
 #
+# 5. simulation_manager.StopMonitor ( h, section, vm_vector, stop_criteria )
+#    note: Watches one cell region (say, soma and its recorded vm_soma)
+#          during a run. Spikes are detected by a NetCon on the section and
+#          the stop criteria are evaluated at every spike (event criteria)
+#          or at every chunk boundary (every 10 ms by default). Criteria:
+#          stop_after_n_spikes(n)                      [at every spike]
+#          stop_on_depolarization_block(window, voltage)
+#          stop_on_silence(window)
+#          stop_on_periodic_firing(n_isi, cv)
+#          The windows count from monitor.t_start, the time at which the
+#          monitor was made or the run initialized, so a monitor made
+#          mid-run (say, PurkinjeCell.advance_to) waits a whole window.
+#          For eg. StopMonitor(h, cell.soma, cell.vm_soma,
+#                              [stop_after_n_spikes(20),
+#                               stop_on_depolarization_block()])
+#          The NetCon and FInitializeHandler of a monitor hold it (and it
+#          keeps stopping every later run) until monitor.close() is called.
+#
+# 6. simulation_manager.PredictionWriter ( max_pending=8 )
+#    note: Saves predictions in a background thread so that the next
+#          simulation of a sweep overlaps with writing the files of the
+#          previous one. Set pc.prediction_writer = PredictionWriter() and
+#          save_predictions queues the arrays (handing them over, they
+#          must not be modified afterwards) instead of writing them. When
+#          max_pending files are queued the simulation waits. Call
+#          writer.flush() to wait until every queued file is on disk and
+#          writer.close() at the end of the batch. Every file is written
+#          under a temporary name then renamed, so a file either has its
+#          full content or does not exist.
+#
+# 7. simulation_manager.get_recordings ( model, copy=False )
+#    note: Returns the recorded time and {cell_region: voltage} of the
+#          model as numpy arrays. By default these are views of the
+#          recording h.Vectors (vector_as_numpy), no data is copied. A view
+#          is valid until the Vector is resized, that is, until the next
+#          run; copy=True (or np.array(view)) for arrays to keep.
+#          With model.implicit_time (fixed time-step runs without rec_t)
+#          the time is rebuilt from get_time_axis(model), {"t0", "dt", "n"}
+#          with the t0 and dt of the initialization; ValueError if dt was
+#          changed during the recording.
+#          save_predictions then writes one column per file after the
+#          header line "# t0=0.0 dt=0.025 n=40001" and attaches the values
+#          alone, with model.predictions["time_axis"]; read them back with
+#          file_manager.load_prediction_file or file_manager.split_prediction.
+#
 # =============================================================================
 
 import os
+import threading
 import subprocess
 import multiprocessing  # for utilities.discover_cores_activate_multisplit(h)
 import time
@@ -49,41 +102,224 @@ import functools  # for clone_method
 from neuron import h
 import numpy as np
 
+from .file_manager import get_time_from_axis
+from .file_manager import format_time_axis
+
+try:
+    import Queue as queue
+except ImportError: # python 3
+    import queue
 
-def discover_cores_activate_multisplit(h):
+
+def discover_cores_activate_multisplit(h, nthread=None):
     """
     Use case: discover_cores_activate_multisplit(h)
     where h is a module; from neuron import h.
+    With nthread the number of threads instead of the no. of cores.
     """
     # discover no. of cores in 1CPU and activate multisplit to use all cores
-    cores = multiprocessing.cpu_count()
+    cores = multiprocessing.cpu_count() if nthread is None else nthread
     h.load_file("parcom.hoc")
+    # pieces of an earlier multisplit are joined first, not split further
+    deactivate_multisplit(h)
     p = h.ParallelComputeTool()
     p.change_nthread(cores, 1)
     p.multisplit(1)
+    # the tool keeps where the sections were split (see deactivate_multisplit)
+    multisplit_state["tool"] = p
+    multisplit_state["sections"] = [ h.SectionRef(sec=sec) for sec in h.allsec() ]
     #print "cores", cores
 
 
+# the ParallelComputeTool of the active multisplit, None if not active,
+# and the sections when it was activated
+multisplit_state = {"tool": None, "sections": []}
+
+
+def deactivate_multisplit(h):
+    """
+    Use case: was_active = deactivate_multisplit(h)
+    Joins the sections split by discover_cores_activate_multisplit again;
+    the number of threads is left as it is. If a cell was deleted since
+    (say, a PurkinjeCell built anew) the pieces are not joined, only the
+    multisplit is cleared.
+    """
+    tool = multisplit_state["tool"]
+    if tool is None:
+        return False
+    sections = multisplit_state["sections"]
+    multisplit_state["tool"] = None
+    multisplit_state["sections"] = []
+    if all( sref.exists() for sref in sections ):
+        tool.multisplit(0)
+    else: # the tool would join deleted sections
+        parallel_context = h.ParallelContext()
+        parallel_context.partition()
+        parallel_context.gid_clear(2)
+        h.CVode().cache_efficient(0)
+    return True
+
+
 # ++++++++++++++++++++++set_runtime_parameters+++++++++++++++++++++
 # created:  03 August 2017
 # modified: 01 January 2018 (renamed from set_simulation_properties)
+# Note: steps_per_ms follows dt, otherwise h.run() (stdrun setdt) silently
+#       reduces any dt larger than 1/steps_per_ms to 1/steps_per_ms.
 # ++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++++
 def set_runtime_parameters( h, setup_parameters ):
         h.dt = setup_parameters["dt"]
+        h.steps_per_ms = 1.0 / setup_parameters["dt"]
         h.celsius = setup_parameters["celsius"]
         h.tstop = setup_parameters["tstop"]
         h.v_init = setup_parameters["v_init"]
 
         
-def initialize_and_run_NEURON_model(h):
+def initialize_and_run_NEURON_model(h, monitor=None, chunk=10.0):
     """
     Use case: initialize_and_run_NEURON_model(h)
     where h is a module; from neuron import h.
+    or
+    truncated = initialize_and_run_NEURON_model(h, monitor=StopMonitor(...))
     """
     h.finitialize()
     start_time = time.clock()
-    h.run()
+    if monitor is None:
+        h.run()
+        truncated = None
+    else:
+        h.stdinit()
+        truncated = continue_with_stop_criteria(h, monitor, h.tstop, chunk)
     print ("--- %s seconds ---" % (time.clock() - start_time))
+    return truncated
+
+
+def continue_with_stop_criteria(h, monitor, t_stop, chunk=10.0):
+    """
+    Use case: continue_with_stop_criteria(h, monitor, h.tstop)
+    Continues an initialized run up to t_stop, chunk (ms) at a time.
+    Returns the name of the stop criterion met or None.
+    """
+    while h.t < t_stop - h.dt/2:
+        h.continuerun( min(h.t + chunk, t_stop) )
+        if monitor.reason is not None or monitor.check():
+            break
+    return monitor.reason
+
+
+class StopMonitor(object):
+    '''
+    Use case: monitor = StopMonitor( h, pc.cell.soma, pc.cell.vm_soma,
+                                     [stop_after_n_spikes(10)],
+                                     threshold=0.0 )
+    monitor.reason is None or the name of the criterion that stopped the run.
+    '''
+    def __init__(self, h, section, vm_vector, stop_criteria, threshold=0.0):
+        self.h = h
+        self.vm_vector = vm_vector
+        self.stop_criteria = list(stop_criteria)
+        self.spike_times = []
+        self.reason = None
+        self.t_start = h.t
+        self.detector = h.NetCon(section(0.5)._ref_v, None, sec=section)
+        self.detector.threshold = threshold
+        self.detector.record(self._on_spike)
+        # an FInitializeHandler clears the spikes of the previous run
+        self._init_handler = h.FInitializeHandler(self._on_initialize)
+
+    def close(self):
+        """
+        Use case: try:
+                      irNm(h, monitor=monitor)
+                  finally:
+                      monitor.close()
+        The NetCon and FInitializeHandler refer to bound methods of the
+        monitor, so it is never collected (nor stops stopping later runs)
+        until they are released here.
+        """
+        if self.detector is not None:
+            self.detector.record()
+        self.detector = None
+        self._init_handler = None
+
+    def _on_initialize(self):
+        self.spike_times = []
+        self.reason = None
+        self.t_start = self.h.t
+
+    def _on_spike(self):
+        self.spike_times.append(self.h.t)
+        self.check(on_spike=True)
+
+    def check(self, on_spike=False):
+        for criterion in self.stop_criteria:
+            if criterion.on_spike == on_spike and criterion(self):
+                self.reason = criterion.name
+                self.h.stoprun = 1
+                return True
+        return False
+
+    def recent_vm(self, window):
+        """
+        Use case: monitor.recent_vm(50.0) # the last 50 ms of voltage
+        """
+        size = int(self.vm_vector.size())
+        n = int(round(window / self.h.dt))
+        return np.array( self.vm_vector.c(max(0, size - n)) )
+
+
+# the stop criteria are classes (not closures) so that they can be sent to
+# the worker processes of sweep_manager
+class stop_after_n_spikes(object):
+    name = "n_spikes"
+    on_spike = True
+    def __init__(self, n):
+        self.n = n
+    def __call__(self, monitor):
+        return len(monitor.spike_times) >= self.n
+
+
+class stop_on_depolarization_block(object):
+    name = "depolarization_block"
+    on_spike = False
+    def __init__(self, window=50.0, voltage=-40.0):
+        self.window = window
+        self.voltage = voltage
+    def __call__(self, monitor):
+        t = monitor.h.t
+        if t - monitor.t_start < self.window or \
+           ( monitor.spike_times and monitor.spike_times[-1] > t - self.window ):
+            return False
+        return np.mean( monitor.recent_vm(self.window) ) > self.voltage
+
+
+class stop_on_silence(object):
+    name = "silence"
+    on_spike = False
+    def __init__(self, window=500.0):
+        self.window = window
+    def __call__(self, monitor):
+        t = monitor.h.t
+        if t - monitor.t_start < self.window:
+            return False
+        # silent since the last spike or, without spikes, since t_start
+        if monitor.spike_times:
+            last = max(monitor.spike_times[-1], monitor.t_start)
+        else:
+            last = monitor.t_start
+        return last < t - self.window
+
+
+class stop_on_periodic_firing(object):
+    name = "periodic_firing"
+    on_spike = False
+    def __init__(self, n_isi=10, cv=0.02):
+        self.n_isi = n_isi
+        self.cv = cv
+    def __call__(self, monitor):
+        if len(monitor.spike_times) < self.n_isi + 1:
+            return False
+        isi = np.diff( monitor.spike_times[-(self.n_isi+1):] )
+        return np.std(isi) / np.mean(isi) < self.cv
 
 
 def check_capability_availability(capability_name="None",
@@ -104,6 +340,62 @@ def check_capability_availability(capability_name="None",
         print(CerebUnitCapability.__name__ + " has the method " + capability_name)
 
 
+def vector_as_numpy(vector):
+    """
+    Use case: vm = vector_as_numpy( pc.cell.vm_soma )
+    Zero-copy view of the h.Vector, valid until the Vector is resized (say,
+    by the next run). NEURON without Vector.as_numpy gets a copy.
+    """
+    try:
+        return vector.as_numpy()
+    except AttributeError:
+        return np.array(vector)
+
+
+def get_time_axis(model):
+    """
+    Use case: get_time_axis( pc ) # {"t0": 0.0, "dt": 0.025, "n": 40001}
+    The time axis of a fixed time-step run, no rec_t needed. t0 and dt are
+    those of the initialization (model.time_axis_start, see
+    PurkinjeCell.set_implicit_time), else 0 and h.dt. A recording that
+    does not end at h.t with them (say, dt was changed mid-run) raises
+    ValueError; its time must be recorded (rec_t) instead.
+    """
+    first_region = sorted(model.cell_regions)[0]
+    t0, dt = getattr(model, "time_axis_start", None) or (0.0, h.dt)
+    n = int( getattr(model.cell, first_region).size() )
+    if n > 0 and abs( t0 + dt * (n - 1) - h.t ) > 0.5 * dt:
+        raise ValueError( "%d samples from t0=%g with dt=%g do not end at "
+                          "t=%g, dt changed during the recording? Record "
+                          "the time, set_implicit_time(False)"
+                          % (n, t0, dt, h.t) )
+    return {"t0": t0, "dt": dt, "n": n}
+
+
+def get_recorded_time(model, copy=False):
+    """
+    Use case: time = get_recorded_time( pc )
+    rec_t or, if model.implicit_time, the time rebuilt from get_time_axis.
+    """
+    if getattr(model, "implicit_time", False):
+        return get_time_from_axis( get_time_axis(model) )
+    convert = np.array if copy else vector_as_numpy
+    return convert( model.cell.rec_t )
+
+
+def get_recordings(model, copy=False):
+    """
+    Use case: time, responses = get_recordings( pc )
+    where responses = {"vm_soma": array, "vm_NOR3": array} for the
+    model.cell_regions; views unless copy=True.
+    """
+    convert = np.array if copy else vector_as_numpy
+    responses = {}
+    for cell_region in model.cell_regions:
+        responses[cell_region] = convert( getattr(model.cell, cell_region) )
+    return get_recorded_time(model, copy), responses
+
+
 # created  18 August 2016 Lungsi
 # modified 22 September 2017 Lungsi
 def save_predictions(model, response_type, dir_path):
@@ -111,34 +403,52 @@ def save_predictions(model, response_type, dir_path):
     Use case: save_predictions(model, response_type, model.prediction_dir_pat)
     where model = self and therefore
           model.cell = Purkinje() # cell_template
-          model.cell_regions = {"vm_soma": 0.0, "vm_NOR3": 0.0}
+          model.cell_regions = {"vm_soma": 0.0, "vm_NOR3": -20.0}
     Here cell_template = Purkinje() is the instantiated Python class of the
     NEURON model. prediction_dir_path is the path obtained by calling the
     check_and_make_directory() function; for eg.,
     check_and_make_directory("model-predictions", "cells", "PC2015Masoli")
     And "vm_soma", "vm_NOR3" etc ... are the variable number of arguments
     that represent NEURON cell properties.
+    If model.prediction_writer is a PredictionWriter the files are written
+    in the background.
     """
     dir_path = dir_path + os.sep
+    writer = getattr(model, "prediction_writer", None)
     #
     if response_type=="voltage_response":
         # create a container for storing/attaching the voltage responses
         # to the model
         model.predictions.update( { response_type: {} } )
         # get the times associated with each voltage response
-        time = np.array( getattr( model.cell, "rec_t") )
+        # (views of the recordings, copied once into t_vm_array below)
+        implicit_time = getattr(model, "implicit_time", False)
+        if implicit_time:
+            # no time column; the files start with the time axis instead
+            time_axis = get_time_axis(model)
+            model.predictions["time_axis"] = time_axis
+            header = format_time_axis(time_axis)
+            responses = dict( (cell_region,
+                               vector_as_numpy( getattr(model.cell, cell_region) ))
+                              for cell_region in model.cell_regions )
+        else:
+            header = ""
+            time, responses = get_recordings( model )
         # loop through each cell region to save the prediction into
         # a .txt file and also attach the prediction into the model
         for cell_region, with_thresh in model.cell_regions.iteritems():
             # create an array of time and voltage responses
-            t_vm_array = \
-                    np.column_stack( ( time,
-                                       np.array( getattr( model.cell,
-                                                          cell_region ) )
-                                        ) )
+            if implicit_time:
+                t_vm_array = np.array( responses[cell_region] )
+            else:
+                t_vm_array = np.column_stack( ( time, responses[cell_region] ) )
             # save the a_prediction into a .txt file
             file_name_full_path = dir_path + cell_region + ".txt"
-            np.savetxt( file_name_full_path, t_vm_array, delimiter = ' ' )
+            if writer is None:
+                np.savetxt( file_name_full_path, t_vm_array, delimiter = ' ',
+                            header = header )
+            else:
+                writer.savetxt( file_name_full_path, t_vm_array, header=header )
             # attach the a_prediction to the model
             a_prediction = {cell_region: t_vm_array}
             model.predictions[response_type].update(a_prediction)
@@ -149,13 +459,84 @@ def save_predictions(model, response_type, dir_path):
         for cell_region, with_thresh in model.cell_regions.iteritems():
             spikes = model.predictions[response_type][cell_region]
             file_name_full_path = dir_path + "spikes_" + cell_region + ".txt"
-            np.savetxt( file_name_full_path, spikes )
+            if writer is None:
+                np.savetxt( file_name_full_path, spikes )
+            else:
+                writer.savetxt( file_name_full_path, np.array(spikes) )
             #
             model.predicted_files_full_path.append(file_name_full_path)
             #
     # save the file_name for possible reset
     #model.predicted_files_full_path.append(file_name_full_path)
 
+
+class PredictionWriter(object):
+    '''
+    Use case: pc.prediction_writer = PredictionWriter()
+    for ... : # sweep
+        pc.produce_voltage_response() # files are queued, not written
+    pc.prediction_writer.close()      # all the files are on disk
+    '''
+    def __init__(self, max_pending=8):
+        self.pending = queue.Queue(maxsize=max_pending)
+        self.errors = []
+        self.closed = False
+        self.thread = threading.Thread(target=self._write_loop)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def _write_loop(self):
+        while True:
+            item = self.pending.get()
+            try:
+                if item is None:
+                    break
+                file_path, array, delimiter, header = item
+                temporary_path = file_path + ".writing"
+                with open(temporary_path, "wb") as a_file:
+                    np.savetxt( a_file, array, delimiter=delimiter,
+                                header=header )
+                    a_file.flush()
+                    os.fsync(a_file.fileno())
+                os.rename(temporary_path, file_path)
+            except Exception as error:
+                self.errors.append( (item[0], error) )
+            finally:
+                self.pending.task_done()
+
+    def _raise_errors(self):
+        if self.errors:
+            errors, self.errors = self.errors, []
+            raise IOError( "could not write " +
+                           ", ".join([ "%s (%s)" % (path, error)
+                                       for path, error in errors ]) )
+
+    def savetxt(self, file_path, array, delimiter=' ', header=''):
+        """
+        Use case: writer.savetxt( "model-predictions/.../vm_soma.txt", array )
+        array is owned by the writer from now on. Blocks if max_pending
+        files are already queued.
+        """
+        if self.closed:
+            raise ValueError("the PredictionWriter is closed")
+        self._raise_errors()
+        self.pending.put( (file_path, array, delimiter, header) )
+
+    def flush(self):
+        """
+        Use case: writer.flush() # every queued file is written
+        """
+        self.pending.join()
+        self._raise_errors()
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self.pending.put(None)
+            self.thread.join()
+        self._raise_errors()
+
+
 # created 01 January 2018
 def clone_method(m):
     if (sys.version_info > (3, 0)):
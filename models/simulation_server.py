@@ -0,0 +1,440 @@
+# =============================================================================
+# simulation_server.py
+#
+# created  19 October 2026 Lungsi
+#
+# This py-file contains a long-running local simulation service. Starting a
+# run from scratch pays for the Python start-up, the imports, nrn_load_dll
+# and building Purkinje() before anything is simulated. Here a pool of
+# worker processes each build the model ONCE and then serve requests, so
+# the latency of a request is the simulation itself.
+#
+# Start the server (from the root of the package)
+#   $ python -m models.simulation_server --port 8765 --workers 4
+# or on a Unix socket
+#   $ python -m models.simulation_server --socket /tmp/pc2015masoli.sock
+#
+# and individual simulation_server initiated by:
+#
+# 1. simulation_server.request_simulation ( request,
+#                                           address=("127.0.0.1", 8765) )
+#    note: address is (host, port) or the path of the Unix socket.
+#          request is a dictionary
+#          {"protocol": "03_positive_current_inj", # or a protocol dict
+#           "parameters": {"Nav1.6Soma": 0.2},     # pc_param entries
+#           "dt": 0.05,                            # optional
+#           "output": "traces",                    # or "features"
+#           "stimulus": [1000.0, 2000.0]}          # optional, features
+#          and the reply is {"time": array, "vm_soma": array, ...} for
+#          traces or {"vm_soma": {"rate": ..., ...}, ...} for features
+#          (see feature_manager). Over HTTP this is a POST of the json
+#          request to /run; GET /protocols lists the protocols and
+#          GET /status the number of workers and pending requests.
+#
+# 2. server = simulation_server.SimulationServer ( address, n_workers,
+#                                                  request_timeout=None )
+#    note: For use within Python; server.submit(request) runs a request
+#          without HTTP, server.serve_forever() serves the requests and
+#          server.shutdown() stops the workers. A worker that dies (say, a
+#          segmentation fault in NEURON) is replaced and the request it
+#          was running fails; with request_timeout (s) a request without
+#          reply in time fails as well.
+#
+# Between requests the worker puts pc_param back to the published values
+# and clears model.predictions. A request may only name the capabilities
+# kept as transactions (transaction_capabilities, say, "ko_AIS_channels"),
+# which are undone in place (model.undo) after the run, failed or not; only
+# after a failed request the worker rebuilds its model, after replying and
+# before taking the next request.
+#
+# =============================================================================
+
+import os
+import json
+import time
+import socket
+import argparse
+import itertools
+import threading
+import multiprocessing
+from multiprocessing.queues import SimpleQueue
+
+try:
+    from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+    from SocketServer import ThreadingMixIn, UnixStreamServer
+    import httplib
+except ImportError: # python 3
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+    from socketserver import ThreadingMixIn, UnixStreamServer
+    import http.client as httplib
+
+import numpy as np
+
+
+default_address = ("127.0.0.1", 8765)
+
+# the capabilities a request may name: those the model keeps as
+# transactions (see PurkinjeCell.undo), so that they are undone after the run
+transaction_capabilities = ( "ko_AIS_channels", "ko_Cav2_1_channels",
+                             "disconnect_dendrites_from_soma" )
+
+
+class RequestError(ValueError):
+    '''
+    An invalid request; it was not run and the model is unchanged.
+    '''
+    pass
+
+
+def _to_json( value ):
+    # numpy arrays and scalars to lists and floats; NaN to None
+    if isinstance(value, dict):
+        return dict( (key, _to_json(item)) for key, item in value.items() )
+    if isinstance(value, np.ndarray):
+        return [ _to_json(item) for item in value.tolist() ]
+    if isinstance(value, (list, tuple)):
+        return [ _to_json(item) for item in value ]
+    if isinstance(value, (float, np.floating)):
+        return None if np.isnan(value) else float(value)
+    if isinstance(value, np.integer):
+        return int(value)
+    return value
+
+
+def handle_request( model, request, capabilities=transaction_capabilities ):
+    """
+    Use case: handle_request( pc, {"protocol": "02_spontaneous_fire",
+                                   "output": "features"} )
+    Runs one request on a warm model. Returns (reply, altered) where
+    altered is True if the cell must be rebuilt. A protocol naming any
+    capability but capabilities raises RequestError.
+    """
+    # imported here as handle_request only runs in the workers
+    from .protocol_manager import load_protocol
+    from .protocol_manager import run_protocol
+    from .feature_manager import extract_features
+    from .cells.PC2015Masoli.PC_param import pc_param
+    #
+    protocol = request["protocol"]
+    if not isinstance(protocol, dict):
+        protocol = load_protocol( model_scale=model.model_scale,
+                                  model_name=model.model_name,
+                                  protocol_name=protocol )
+    not_allowed = [ name for name in protocol.get("capabilities", [])
+                    if name not in capabilities ]
+    if not_allowed:
+        raise RequestError( "capabilities not allowed: " + ", ".join(not_allowed) )
+    model.set_pc_param( pc_param )
+    model.set_pc_param( request.get("parameters", {}) )
+    undoable = hasattr(model, "transactions")
+    depth = len(model.transactions) if undoable else 0
+    try:
+        # views of the recordings, converted to the reply before the next run
+        time, responses = run_protocol( model, protocol, dt=request.get("dt"),
+                                        copy=False )
+    finally:
+        # exactly the capabilities applied, even if the run failed half-way
+        if undoable:
+            model.undo( len(model.transactions) - depth )
+    altered = not undoable and len( protocol.get("capabilities", []) ) > 0
+    if request.get("output", "traces") == "features":
+        regions = list(responses)
+        features = extract_features( time,
+                                     np.vstack([ responses[region]
+                                                 for region in regions ]),
+                                     [ model.cell_regions[region]
+                                       for region in regions ],
+                                     stimulus=request.get("stimulus") )
+        reply = dict( (region, dict( (name, values[i])
+                                     for name, values in features.items() ))
+                      for i, region in enumerate(regions) )
+    else:
+        reply = dict(responses)
+        reply["time"] = time
+    return reply, altered
+
+
+def _worker_loop( worker_id, tasks, results, model_factory, factory_args ):
+    from neuron import h
+    model = model_factory(*factory_args)
+    # one process per core, hence no threads within the process
+    h.ParallelContext().nthread(1)
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        request_id, request = task
+        # so that the server fails the request if this process dies
+        results.put( ("started", worker_id, request_id, None) )
+        altered = False
+        try:
+            reply, altered = handle_request(model, request)
+            reply = _to_json(reply)
+        except RequestError as error:
+            reply = {"error": "%s: %s" % (type(error).__name__, error)}
+        except Exception as error:
+            reply = {"error": "%s: %s" % (type(error).__name__, error)}
+            altered = True # the cell may be left half-way through
+        results.put( ("done", worker_id, request_id, reply) )
+        # reset while no request is waiting on this worker
+        if altered:
+            del model
+            model = model_factory(*factory_args)
+        else:
+            model.reset()
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    def address_string( self ):
+        if isinstance(self.client_address, tuple):
+            return self.client_address[0]
+        return "unix-socket"
+
+    def _reply( self, code, content ):
+        body = json.dumps(content).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET( self ):
+        simulation_server = self.server.simulation_server
+        if self.path == "/protocols":
+            from .protocol_manager import get_available_protocols
+            self._reply( 200, get_available_protocols( model_scale="cells",
+                                                       model_name="PC2015Masoli" ) )
+        elif self.path == "/status":
+            self._reply( 200, simulation_server.status() )
+        else:
+            self._reply( 404, {"error": "unknown path " + self.path} )
+
+    def do_POST( self ):
+        if self.path != "/run":
+            self._reply( 404, {"error": "unknown path " + self.path} )
+            return
+        length = int( self.headers.get("Content-Length", 0) )
+        try:
+            request = json.loads( self.rfile.read(length).decode("utf-8") )
+        except ValueError as error:
+            self._reply( 400, {"error": "invalid json: %s" % error} )
+            return
+        reply = self.server.simulation_server.submit(request)
+        self._reply( 400 if "error" in reply else 200, reply )
+
+
+class _TCPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class _UnixServer(ThreadingMixIn, UnixStreamServer):
+    daemon_threads = True
+
+
+class SimulationServer(object):
+    '''
+    Use case: server = SimulationServer( ("127.0.0.1", 8765), n_workers=4 )
+    server.serve_forever() # until KeyboardInterrupt or server.shutdown()
+    '''
+    def __init__( self, address=default_address, n_workers=None,
+                  model_factory=None, factory_args=(), request_timeout=None,
+                  poll_interval=1.0 ):
+        if model_factory is None:
+            from .cells.PC2015Masoli_model import PurkinjeCell as model_factory
+        if n_workers is None:
+            n_workers = multiprocessing.cpu_count()
+        self.address = address
+        self.model_factory = model_factory
+        self.factory_args = factory_args
+        self.request_timeout = request_timeout
+        self.poll_interval = poll_interval
+        self.tasks = multiprocessing.Queue()
+        # written synchronously, so "started" is sent even if the worker dies
+        # right after (a Queue sends from a feeder thread)
+        self.results = SimpleQueue()
+        # replies are matched to the waiting requests by request_id and the
+        # requests to the workers running them by worker_id
+        self._pending = {}
+        self._running = {}
+        self._dead = set()
+        self._closing = False
+        self._lock = threading.Lock()
+        self._request_ids = itertools.count()
+        self._worker_ids = itertools.count()
+        self.workers = {}
+        for i in range(n_workers):
+            self._start_worker()
+        self._dispatcher = threading.Thread(target=self._dispatch)
+        self._dispatcher.daemon = True
+        self._dispatcher.start()
+        self.httpd = None
+
+    def _start_worker( self ):
+        worker_id = next(self._worker_ids)
+        worker = multiprocessing.Process( target=_worker_loop,
+                                          args=(worker_id, self.tasks,
+                                                self.results,
+                                                self.model_factory,
+                                                self.factory_args) )
+        worker.daemon = True
+        worker.start()
+        self.workers[worker_id] = worker
+
+    def _finish( self, request_id, reply ):
+        # with self._lock; a request that timed out is no longer pending
+        slot = self._pending.pop(request_id, None)
+        if slot is not None:
+            slot["reply"] = reply
+            slot["event"].set()
+
+    def _dispatch( self ):
+        while True:
+            kind, worker_id, request_id, reply = self.results.get()
+            if kind is None:
+                break
+            with self._lock:
+                if kind == "started":
+                    if worker_id in self._dead: # found dead before this
+                        self._finish( request_id, {"error": "the worker "
+                                      "running the request died"} )
+                    else:
+                        self._running[worker_id] = request_id
+                else:
+                    self._running.pop(worker_id, None)
+                    self._finish(request_id, reply)
+
+    def _replace_dead_workers( self ):
+        # with self._lock
+        for worker_id, worker in list(self.workers.items()):
+            if worker.is_alive():
+                continue
+            del self.workers[worker_id]
+            self._dead.add(worker_id)
+            request_id = self._running.pop(worker_id, None)
+            if request_id is not None:
+                self._finish( request_id,
+                              {"error": "the worker running the request died "
+                                        "(exit code %s)" % worker.exitcode} )
+            if not self._closing:
+                self._start_worker()
+
+    def submit( self, request ):
+        """
+        Use case: reply = server.submit( {"protocol": "02_spontaneous_fire"} )
+        Blocks until a worker has run the request, the worker died or
+        request_timeout (s) passed; the latter two reply {"error": ...}.
+        """
+        slot = {"event": threading.Event(), "reply": None}
+        with self._lock:
+            request_id = next(self._request_ids)
+            self._pending[request_id] = slot
+        self.tasks.put( (request_id, request) )
+        start_time = time.time()
+        while not slot["event"].wait(self.poll_interval):
+            with self._lock:
+                self._replace_dead_workers()
+                if ( self.request_timeout is not None and
+                     time.time() - start_time > self.request_timeout ):
+                    self._finish( request_id, {"error": "no reply within %s s"
+                                               % self.request_timeout} )
+        return slot["reply"]
+
+    def status( self ):
+        with self._lock:
+            self._replace_dead_workers()
+            n_pending = len(self._pending)
+            workers = list(self.workers.values())
+        return { "workers": len(workers),
+                 "alive": sum( [ worker.is_alive() for worker in workers ] ),
+                 "pending": n_pending }
+
+    def serve_forever( self ):
+        if isinstance(self.address, tuple):
+            self.httpd = _TCPServer(self.address, _RequestHandler)
+        else:
+            if os.path.exists(self.address):
+                os.remove(self.address)
+            self.httpd = _UnixServer(self.address, _RequestHandler)
+        self.httpd.simulation_server = self
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self.httpd.server_close()
+            self.httpd = None
+            if not isinstance(self.address, tuple) and os.path.exists(self.address):
+                os.remove(self.address)
+
+    def shutdown( self ):
+        if self.httpd is not None:
+            self.httpd.shutdown()
+        with self._lock:
+            self._closing = True
+            workers = list(self.workers.values())
+        for worker in workers:
+            self.tasks.put(None)
+        for worker in workers:
+            worker.join()
+        self.results.put( (None, None, None, None) )
+        self._dispatcher.join()
+
+
+class _UnixHTTPConnection(httplib.HTTPConnection):
+    def __init__( self, path, timeout=None ):
+        httplib.HTTPConnection.__init__(self, "localhost")
+        self.unix_path = path
+        self.unix_timeout = timeout
+
+    def connect( self ):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.unix_timeout)
+        self.sock.connect(self.unix_path)
+
+
+def request_simulation( request, address=default_address, timeout=None ):
+    """
+    Use case: reply = request_simulation( {"protocol": "02_spontaneous_fire",
+                                           "output": "traces"} )
+              reply["time"], reply["vm_soma"] # numpy arrays
+    """
+    if isinstance(address, tuple):
+        connection = httplib.HTTPConnection(address[0], address[1], timeout=timeout)
+    else:
+        connection = _UnixHTTPConnection(address, timeout=timeout)
+    try:
+        connection.request( "POST", "/run", json.dumps(request),
+                            {"Content-Type": "application/json"} )
+        reply = json.loads( connection.getresponse().read().decode("utf-8") )
+    finally:
+        connection.close()
+    if "error" in reply:
+        raise RuntimeError(reply["error"])
+    if request.get("output", "traces") == "features":
+        return reply
+    return dict( (key, np.array(value)) for key, value in reply.items() )
+
+
+def main():
+    parser = argparse.ArgumentParser( description="PC2015Masoli simulation server" )
+    parser.add_argument("--host", default=default_address[0])
+    parser.add_argument("--port", type=int, default=default_address[1])
+    parser.add_argument("--socket", default=None, help="path of a Unix socket")
+    parser.add_argument("--workers", type=int, default=None)
+    arguments = parser.parse_args()
+    if arguments.socket is None:
+        address = (arguments.host, arguments.port)
+    else:
+        address = arguments.socket
+    server = SimulationServer(address, n_workers=arguments.workers)
+    print ("serving on %s with %d workers" % (address, len(server.workers)))
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
+#
+#
@@ -0,0 +1,264 @@
+# =============================================================================
+# storage_manager.py
+#
+# created  19 October 2026 Lungsi
+#
+# This py-file contains the compact storage of recorded traces, an
+# alternative to the float64 text files of model-predictions, initiated by
+#
+# from models import storage_manager
+#
+# and individual storage_manager initiated by:
+#
+# 1. storage_manager.save_traces ( file_path,
+#                                  {"time": time, "vm_soma": vm},
+#                                  max_error={"vm_soma": 0.01} )
+#    note: Every trace is encoded in chunks (chunk_size samples) as
+#          a. integers: the bit pattern of the float32 (or float64) values
+#             (lossless for that dtype) or, if a max_error (mV) is given, the
+#             values quantized to a step of ~2*max_error (lossy; the decoded
+#             trace is within max_error of the original, checked on encoding)
+#          b. predictive encoding: differences of order 1 (lossless) or 2
+#             (lossy, that is, residuals of a linear prediction) which are
+#             small for smooth membrane potentials, stored in the narrowest
+#             integer type that holds them
+#          c. byte shuffling and zlib.
+#          Each chunk starts its prediction afresh so it is decoded on its
+#          own. Traces without max_error (say, "time") are lossless.
+#
+# 2. storage_manager.load_traces ( file_path, names=None, start=0, stop=None )
+#    note: Returns {name: array} of samples start:stop, decoding only the
+#          chunks that overlap start:stop.
+#
+# 3. storage_manager.iter_chunks ( file_path, name )
+#    note: Yields the decoded chunks of the trace one after the other, for
+#          eg. to process a long trace in bounded memory.
+#
+# 4. storage_manager.convert_prediction_file ( "model-predictions/cells/
+#                                   PC2015Masoli/vm_soma.txt", max_error=0.01 )
+#    note: Converts a saved prediction (time, voltage columns) into
+#          vm_soma.trc, next to the txt-file; the time is stored lossless.
+#          Returns the path of the new file.
+#
+# File layout: b"PCTR", header length (uint32, little endian), json header,
+# then the zlib blocks of the chunks.
+#
+# =============================================================================
+
+import os
+import json
+import zlib
+import struct
+
+import numpy as np
+
+from .file_manager import load_prediction_file
+
+
+magic = b"PCTR"
+default_chunk_size = 65536
+# integer types for the residuals, narrowest first
+residual_types = ("int8", "int16", "int32", "int64")
+
+
+def _narrowest_type( residuals ):
+    if len(residuals) == 0:
+        return "int8"
+    largest = max( abs(int(residuals.min())), abs(int(residuals.max())) )
+    for a_type in residual_types:
+        if largest <= np.iinfo(a_type).max:
+            return a_type
+    return "int64"
+
+
+def _shuffle( array ):
+    # byte k of every value together; smooth residuals => runs of 0x00/0xff
+    return array.view(np.uint8).reshape(-1, array.itemsize).T.tobytes()
+
+
+def _unshuffle( data, a_type, n ):
+    itemsize = np.dtype(a_type).itemsize
+    return np.frombuffer(data, dtype=np.uint8).reshape(itemsize, n).T.copy().view(a_type).ravel()
+
+
+def _encode_chunk( integers, order, level ):
+    residuals = integers.astype(np.int64)
+    for i in range(order):
+        residuals[1:] = residuals[1:] - residuals[:-1]
+    head = [ int(value) for value in residuals[:order] ]
+    a_type = _narrowest_type( residuals[order:] )
+    tail = residuals[order:].astype(a_type)
+    return head, a_type, zlib.compress( _shuffle(tail), level )
+
+
+def _decode_chunk( head, a_type, data, n, order ):
+    residuals = np.empty(n, dtype=np.int64)
+    residuals[:len(head)] = head
+    residuals[len(head):] = _unshuffle( zlib.decompress(data), a_type,
+                                        n - len(head) )
+    for i in range(order):
+        residuals = np.cumsum(residuals)
+    return residuals
+
+
+def encode_trace( values, max_error=None, dtype="float32",
+                  chunk_size=default_chunk_size, level=6 ):
+    """
+    Use case: header, blocks = encode_trace( vm, max_error=0.01 )
+    Returns the json-able header of the trace and the list of zlib blocks.
+    """
+    values = np.ravel( np.asarray(values, dtype=float) )
+    header = { "n": len(values), "dtype": np.dtype(dtype).name,
+               "chunk_size": int(chunk_size), "chunks": [] }
+    if max_error is None:
+        # lossless (for the given dtype): bit patterns, first differences
+        cast = values.astype(dtype)
+        integers = cast.view( "int%d" % (8 * cast.itemsize) )
+        header.update( {"mode": "lossless", "order": 1} )
+    else:
+        # leave room for the rounding of the decoded values to dtype
+        largest = np.max(np.abs(values)) if len(values) else 0.0
+        # python floats, numpy scalars (say, np.float32) are not json-able
+        max_error = float(max_error)
+        step = float( 2.0 * ( max_error - 2.0 * np.finfo(dtype).eps * largest ) )
+        if step <= 0.0:
+            raise ValueError("max_error %s too small for %s" % (max_error, dtype))
+        integers = np.round(values / step).astype(np.int64)
+        decoded = (integers * step).astype(dtype)
+        error = np.max( np.abs(decoded - values) ) if len(values) else 0.0
+        if error > max_error:
+            raise ValueError("max_error %s too small for %s" % (max_error, dtype))
+        header.update( {"mode": "quantized", "order": 2, "step": step,
+                        "max_error": max_error, "measured_error": float(error)} )
+    blocks = []
+    for start in range(0, len(values), chunk_size):
+        head, a_type, block = _encode_chunk( integers[start:start+chunk_size],
+                                             header["order"], level )
+        header["chunks"].append( {"head": head, "type": a_type,
+                                  "nbytes": len(block)} )
+        blocks.append(block)
+    return header, blocks
+
+
+def _decode( header, block, chunk_index ):
+    start = chunk_index * header["chunk_size"]
+    n = min(header["chunk_size"], header["n"] - start)
+    chunk = header["chunks"][chunk_index]
+    integers = _decode_chunk( chunk["head"], chunk["type"], block, n,
+                              header["order"] )
+    if header["mode"] == "lossless":
+        width = "int%d" % (8 * np.dtype(header["dtype"]).itemsize)
+        return integers.astype(width).view(header["dtype"])
+    return (integers * header["step"]).astype(header["dtype"])
+
+
+def save_traces( file_path, traces, max_error=None, dtype="float32",
+                 chunk_size=default_chunk_size, level=6 ):
+    """
+    Use case: save_traces( "vm.trc", {"time": time, "vm_soma": vm},
+                           max_error={"vm_soma": 0.01}, dtype="float32" )
+    max_error is None (all lossless), a number (all the traces) or a
+    dictionary (per trace; missing traces are lossless). dtype may also be
+    a dictionary, say, {"time": "float64", "vm_soma": "float32"}.
+    """
+    header = {"traces": {}, "order": list(traces)}
+    all_blocks = []
+    offset = 0
+    for name in traces:
+        if isinstance(max_error, dict):
+            trace_error = max_error.get(name)
+        else:
+            trace_error = max_error
+        trace_dtype = dtype.get(name, "float32") if isinstance(dtype, dict) else dtype
+        trace_header, blocks = encode_trace( traces[name], trace_error,
+                                             trace_dtype, chunk_size, level )
+        for chunk, block in zip(trace_header["chunks"], blocks):
+            chunk["offset"] = offset
+            offset += len(block)
+        header["traces"][name] = trace_header
+        all_blocks.extend(blocks)
+    header_bytes = json.dumps(header).encode("utf-8")
+    temporary_path = file_path + ".writing"
+    with open(temporary_path, "wb") as a_file:
+        a_file.write(magic)
+        a_file.write( struct.pack("<I", len(header_bytes)) )
+        a_file.write(header_bytes)
+        for block in all_blocks:
+            a_file.write(block)
+    os.rename(temporary_path, file_path)
+    return file_path
+
+
+def read_header( file_path ):
+    """
+    Use case: header = read_header( "vm.trc" )
+              header["traces"]["vm_soma"]["n"] # number of samples
+    """
+    with open(file_path, "rb") as a_file:
+        if a_file.read(4) != magic:
+            raise ValueError(file_path + " is not a trace file")
+        size = struct.unpack("<I", a_file.read(4))[0]
+        header = json.loads( a_file.read(size).decode("utf-8") )
+    header["data_offset"] = 8 + size
+    return header
+
+
+def _read_chunks( a_file, header, name, first, last ):
+    trace_header = header["traces"][name]
+    for chunk_index in range(first, last):
+        chunk = trace_header["chunks"][chunk_index]
+        a_file.seek( header["data_offset"] + chunk["offset"] )
+        yield _decode( trace_header, a_file.read(chunk["nbytes"]), chunk_index )
+
+
+def iter_chunks( file_path, name ):
+    """
+    Use case: for chunk in iter_chunks( "vm.trc", "vm_soma" ): ...
+    """
+    header = read_header(file_path)
+    with open(file_path, "rb") as a_file:
+        for chunk in _read_chunks( a_file, header, name, 0,
+                                   len(header["traces"][name]["chunks"]) ):
+            yield chunk
+
+
+def load_traces( file_path, names=None, start=0, stop=None ):
+    """
+    Use case: traces = load_traces( "vm.trc" )
+              load_traces( "vm.trc", ["vm_soma"], start=40000, stop=80000 )
+    """
+    header = read_header(file_path)
+    if names is None:
+        names = header["order"]
+    traces = {}
+    with open(file_path, "rb") as a_file:
+        for name in names:
+            trace_header = header["traces"][name]
+            chunk_size = trace_header["chunk_size"]
+            trace_stop = trace_header["n"] if stop is None else min(stop, trace_header["n"])
+            trace_start = min(start, trace_stop)
+            first = trace_start // chunk_size
+            last = -(-trace_stop // chunk_size) # ceiling
+            chunks = list( _read_chunks(a_file, header, name, first, last) )
+            if chunks:
+                values = np.concatenate(chunks)
+            else:
+                values = np.empty(0, dtype=trace_header["dtype"])
+            traces[name] = values[ trace_start - first * chunk_size :
+                                   trace_stop - first * chunk_size ]
+    return traces
+
+
+def convert_prediction_file( file_path, max_error=None, dtype="float32" ):
+    """
+    Use case: convert_prediction_file( "model-predictions/cells/PC2015Masoli/vm_soma.txt",
+                                       max_error=0.01 )
+    """
+    time, values = load_prediction_file(file_path)
+    name = os.path.splitext( os.path.basename(file_path) )[0]
+    new_path = os.path.splitext(file_path)[0] + ".trc"
+    return save_traces( new_path, {"time": time, name: values},
+                        max_error={name: max_error},
+                        dtype={"time": "float64", name: dtype} )
+#
+#
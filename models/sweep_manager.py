@@ -0,0 +1,199 @@
+# =============================================================================
+# sweep_manager.py
+#
+# created  19 October 2026 Lungsi
+#
+# This py-file contains the functions to run parallel sweeps whose results
+# are aggregated in shared memory instead of prediction text files,
+# initiated by
+#
+# from models import sweep_manager
+#
+# and individual sweep_manager initiated by:
+#
+# 1. store = sweep_manager.SweepResultStore.create ( n_jobs=1000,
+#                                    columns=["vm_soma", "vm_NOR3"],
+#                                    n_samples=40001 )
+#    note: This is a memory-mapped array of shape
+#          (n_jobs, len(columns), n_samples), one row per job and one
+#          column per cell region or feature (n_samples=1 for features).
+#          By default the file is in /dev/shm, that is, in shared memory.
+#          Unwritten entries are NaN. store.done[job] is 1 once the job is
+#          written.
+#
+# 2. store = sweep_manager.SweepResultStore.attach ( store.path )
+#    note: This maps the same array in another process (say, a worker)
+#          without copying.
+#
+# 3. sweep_manager.run_parallel_sweep ( job_function, jobs, store,
+#                                       model_factory=PurkinjeCell )
+#    note: A pool of worker processes each build ONE model by calling
+#          model_factory() and attach the store. For every job the worker
+#          calls job_function(model, store, job_index, job) which writes
+#          its recordings/features with store.write(). The parent reads
+#          the results in place, store.column("vm_soma") etc ...
+#          job_function and model_factory must be importable (module level).
+#          To run several sweeps on the same warm workers (say, the
+#          generations of an optimizer) create the pool once with
+#          pool = sweep_manager.make_sweep_pool ( store, model_factory )
+#          and pass pool=pool, first_job_index=... to run_parallel_sweep.
+#
+# 4. sweep_manager.write_recordings ( store, job_index, model )
+#    note: Writes the recordings of every model.cell_regions that is also
+#          a column of the store, for eg. inside job_function.
+#
+# =============================================================================
+
+import os
+import json
+import tempfile
+import multiprocessing
+
+import numpy as np
+
+
+class SweepResultStore(object):
+    '''
+    Use case: store = SweepResultStore.create( n_jobs=100,
+                                               columns=["rate", "cv"] )
+    store.write( 0, {"rate": 42.0, "cv": 0.1} )
+    store.column("rate") # zero-copy view of all the jobs
+    store.unlink()       # when done
+    '''
+    def __init__( self, path, mode="r+" ):
+        self.path = path
+        with open(path + ".json") as header_file:
+            header = json.load(header_file)
+        self.columns = header["columns"]
+        self.n_jobs = header["n_jobs"]
+        self.n_samples = header["n_samples"]
+        self.dtype = np.dtype(header["dtype"])
+        self.data = np.memmap( path, dtype=self.dtype, mode=mode,
+                               shape=(self.n_jobs, len(self.columns),
+                                      self.n_samples) )
+        self.done = np.memmap( path + ".done", dtype=np.int8, mode=mode,
+                               shape=(self.n_jobs,) )
+        self._column_index = dict( (name, i)
+                                   for i, name in enumerate(self.columns) )
+
+    @classmethod
+    def create( cls, n_jobs=1, columns=None, n_samples=1, path=None,
+                dtype="float64" ):
+        if path is None:
+            shm = "/dev/shm" if os.path.isdir("/dev/shm") else None
+            handle, path = tempfile.mkstemp(prefix="sweep_", suffix=".dat",
+                                            dir=shm)
+            os.close(handle)
+        header = { "columns": list(columns), "n_jobs": int(n_jobs),
+                   "n_samples": int(n_samples), "dtype": np.dtype(dtype).str }
+        with open(path + ".json", "w") as header_file:
+            json.dump(header, header_file)
+        store = cls(path, mode="w+")
+        store.data[...] = np.nan
+        return store
+
+    @classmethod
+    def attach( cls, path ):
+        return cls(path, mode="r+")
+
+    def column( self, name ):
+        """
+        Use case: store.column("vm_soma") # shape (n_jobs, n_samples)
+                  store.column("rate")    # shape (n_jobs,) if n_samples=1
+        """
+        view = self.data[:, self._column_index[name], :]
+        return view[:, 0] if self.n_samples == 1 else view
+
+    def write( self, job_index, values ):
+        """
+        Use case: store.write( job_index, {"vm_soma": array, ...} )
+        Arrays longer than n_samples are truncated.
+        """
+        for name, value in values.items():
+            value = np.ravel(value)[:self.n_samples]
+            self.data[job_index, self._column_index[name], :len(value)] = value
+        self.done[job_index] = 1
+
+    def flush( self ):
+        self.data.flush()
+        self.done.flush()
+
+    def unlink( self ):
+        """
+        Use case: store.unlink()
+        Removes the files; views already taken stay valid until released.
+        """
+        for path in (self.path, self.path + ".done", self.path + ".json"):
+            if os.path.exists(path):
+                os.remove(path)
+
+
+def write_recordings( store, job_index, model ):
+    """
+    Use case: write_recordings( store, job_index, pc )
+    where pc = PurkinjeCell() after a run.
+    """
+    from .simulation_manager import get_recordings
+    # views of the recordings; store.write copies them into the store
+    time, responses = get_recordings(model)
+    values = dict( (cell_region, response)
+                   for cell_region, response in responses.items()
+                   if cell_region in store.columns )
+    store.write(job_index, values)
+
+
+# state of each worker process of run_parallel_sweep
+worker_state = {}
+
+
+def _initialize_worker( store_path, model_factory, factory_args ):
+    worker_state["store"] = SweepResultStore.attach(store_path)
+    if model_factory is None:
+        worker_state["model"] = None
+    else:
+        worker_state["model"] = model_factory(*factory_args)
+        # one process per core, hence no threads within the process
+        from neuron import h
+        h.ParallelContext().nthread(1)
+
+
+def _run_job( arguments ):
+    job_function, job_index, job = arguments
+    job_function( worker_state["model"], worker_state["store"], job_index, job )
+    return job_index
+
+
+def make_sweep_pool( store, model_factory=None, factory_args=(),
+                     processes=None ):
+    """
+    Use case: pool = make_sweep_pool( store, model_factory=PurkinjeCell )
+    The caller closes the pool; pool.close(); pool.join()
+    """
+    return multiprocessing.Pool( processes, _initialize_worker,
+                                 (store.path, model_factory, factory_args) )
+
+
+def run_parallel_sweep( job_function, jobs, store, model_factory=None,
+                        factory_args=(), processes=None, pool=None,
+                        first_job_index=0 ):
+    """
+    Use case: run_parallel_sweep( job_function, jobs, store,
+                                  model_factory=PurkinjeCell )
+    where jobs is a list (of, say, parameter dictionaries) written in the
+    store rows first_job_index, first_job_index+1, ...
+    """
+    own_pool = pool is None
+    if own_pool:
+        pool = make_sweep_pool(store, model_factory, factory_args, processes)
+    try:
+        for job_index in pool.imap_unordered( _run_job,
+                                              [ (job_function, first_job_index + i, job)
+                                                for i, job in enumerate(jobs) ] ):
+            pass
+    finally:
+        if own_pool:
+            pool.close()
+            pool.join()
+    return store
+#
+#
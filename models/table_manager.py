@@ -0,0 +1,119 @@
+# =============================================================================
+# table_manager.py
+#
+# created  19 October 2026 Lungsi
+#
+# The rate functions of the channels below are TABLE-d in their mod-files
+# (PC2015Masoli/mod_files), that is, evaluated once per 0.025 mV between
+# -100 and 100 mV (for the temperature and parameters of the run) and
+# interpolated linearly afterwards, instead of calling exp() for every
+# compartment at every step. The table of a mechanism is used when the
+# NEURON global usetable_<suffix> is 1 (the default) and the rates are
+# computed every call when it is 0. This py-file switches the tables and
+# checks them against the untabulated rates, initiated by
+#
+# from models import table_manager
+#
+# and individual table_manager initiated by:
+#
+# 1. table_manager.set_tables ( enabled=True, mechanisms=None )
+#    note: Sets usetable_<suffix> for the mechanisms (by default all of
+#          tabulated_mechanisms) and returns the previous values
+#          {suffix: 0 or 1}, which set_tables(previous) restores.
+#
+# 2. table_manager.compare_tables ( model, protocol_names=None,
+#                                   tolerance=None )
+#    note: Runs every protocol (see protocol_manager; by default
+#          standard_protocols) with the tables off, the reference, and on,
+#          compares them as timestep_manager.compare_responses does and
+#          returns {protocol_name: {"passed", "metrics", "time_untabulated",
+#          "time_tabulated"}} (time in seconds). The tables are left as
+#          they were.
+#
+# =============================================================================
+
+import time
+import collections
+
+from neuron import h
+
+from .protocol_manager import load_protocol
+from .protocol_manager import run_protocol
+from .timestep_manager import compare_responses
+from .timestep_manager import is_within_tolerance
+
+
+# suffix of the mechanisms with TABLE-d rates
+tabulated_mechanisms = ( "Nav1_6", "Kv1_5", "Cav3_1", "Cav2_1", "HCN1",
+                         "Kca3_1", "Kir2_3", "Kv4_3" )
+
+standard_protocols = ( "02_spontaneous_fire", "03_positive_current_inj",
+                       "04_negative_current_inj", "05_calcium_sodium_bursts" )
+
+# tolerance of each metric; a metric set to None is not checked
+default_tolerance = { "spike_count": 0,    # spikes
+                      "spike_time": 0.1,   # ms
+                      "rate": 0.01,        # relative
+                      "vm_rms": 1.0 }      # mV
+
+
+def set_tables(enabled=True, mechanisms=None):
+    """
+    Use case: previous = set_tables( False ) # all rates computed every call
+              set_tables( previous )         # back as they were
+    enabled is True/False or {suffix: 0 or 1}.
+    """
+    if isinstance(enabled, dict):
+        states = enabled
+    else:
+        if mechanisms is None:
+            mechanisms = tabulated_mechanisms
+        states = dict( (suffix, 1 if enabled else 0) for suffix in mechanisms )
+    previous = {}
+    for suffix, state in states.items():
+        name = "usetable_" + suffix
+        previous[suffix] = int( getattr(h, name) )
+        setattr(h, name, state)
+    return previous
+
+
+def _timed_run(model, protocol):
+    start_time = time.time()
+    result = run_protocol(model, protocol)
+    elapsed = time.time() - start_time
+    # protocols with capabilities (knockouts) are undone for the next run
+    model.undo( len(protocol.get("capabilities", [])) )
+    return result, elapsed
+
+
+def compare_tables(model, protocol_names=None, tolerance=None):
+    """
+    Use case: report = compare_tables( pc )
+              report["02_spontaneous_fire"]["passed"]
+    """
+    if protocol_names is None:
+        protocol_names = standard_protocols
+    if tolerance is None:
+        tolerance = default_tolerance
+    previous = set_tables(True)
+    report = collections.OrderedDict()
+    try:
+        for protocol_name in protocol_names:
+            protocol = load_protocol( model_scale=model.model_scale,
+                                      model_name=model.model_name,
+                                      protocol_name=protocol_name )
+            set_tables(False)
+            reference, time_untabulated = _timed_run(model, protocol)
+            set_tables(True)
+            candidate, time_tabulated = _timed_run(model, protocol)
+            metrics = compare_responses(reference, candidate, model.cell_regions)
+            report[protocol_name] = collections.OrderedDict( [
+                ("passed", is_within_tolerance(metrics, tolerance)),
+                ("metrics", metrics),
+                ("time_untabulated", time_untabulated),
+                ("time_tabulated", time_tabulated) ] )
+    finally:
+        set_tables(previous)
+    return report
+#
+#
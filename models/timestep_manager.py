@@ -0,0 +1,183 @@
+# =============================================================================
+# timestep_manager.py
+#
+# created  19 October 2026 Lungsi
+#
+# The models run with fixed time-step only (CVode is disabled) and the
+# protocols use dt = 0.025 ms. This py-file contains the functions to find
+# the largest dt for which a protocol still gives the same answer, initiated by
+#
+# from models import timestep_manager
+#
+# and individual timestep_manager initiated by:
+#
+# 1. timestep_manager.run_dt_ladder ( model, protocol,
+#                                     dt_ladder=[0.025, 0.05, 0.1] )
+#    note: This reruns the protocol (see protocol_manager) for every dt in
+#          dt_ladder on the instantiated model and returns the dictionary
+#          {dt: (time, responses)} where responses are the voltages of
+#          each of the model.cell_regions.
+#
+# 2. timestep_manager.compare_responses ( reference, candidate,
+#                                         cell_regions )
+#    note: reference and candidate are (time, responses) tuples. For each
+#          cell region this returns the metrics
+#          "spike_count": difference in number of spikes,
+#          "spike_time": largest shift (ms) between matched spike times,
+#          "rate": relative difference of the firing rates,
+#          "vm_rms": root mean square difference (mV) of the voltages
+#                    evaluated on the time stamps of the candidate.
+#
+# 3. timestep_manager.recommend_timestep ( reference_dt, metrics, tolerance )
+#    note: metrics is {dt: compare_responses output}. This returns the
+#          largest dt such that it and every smaller dt in the ladder are
+#          within tolerance (the reference_dt if none are).
+#
+# 4. timestep_manager.check_dt_convergence ( model,
+#                                            protocol_name="02_spontaneous_fire",
+#                                            tolerance=None,
+#                                            store=True )
+#    note: This runs 1, 2 and 3 and, if store is True, saves the result as
+#          "dt_convergence" into the json-file of the protocol. The stored
+#          "recommended_dt" can then be used as
+#          apply_protocol(model, protocol,
+#                         dt=protocol["dt_convergence"]["recommended_dt"])
+#
+# =============================================================================
+
+import time
+import collections
+
+import numpy as np
+
+from .protocol_manager import load_protocol
+from .protocol_manager import save_protocol
+from .protocol_manager import run_protocol
+from .feature_manager import detect_spikes
+
+
+# tolerance of each metric; a metric set to None is not checked
+default_tolerance = { "spike_count": 0,    # spikes
+                      "spike_time": 0.5,   # ms
+                      "rate": 0.01,        # relative
+                      "vm_rms": 5.0 }      # mV
+
+
+def run_dt_ladder(model, protocol, dt_ladder=None):
+    """
+    Use case: run_dt_ladder( pc, protocol, dt_ladder=[0.0125, 0.025, 0.05] )
+    where pc = PurkinjeCell() and protocol is returned by load_protocol().
+    """
+    results = collections.OrderedDict()
+    for dt in sorted(dt_ladder):
+        results[dt] = run_protocol(model, protocol, dt=dt)
+    return results
+
+
+def compare_responses(reference, candidate, cell_regions):
+    """
+    Use case: compare_responses( (t_ref, responses_ref), (t, responses),
+                                 pc.cell_regions )
+    where cell_regions = {"vm_soma": 0.0, "vm_NOR3": -20.0} as in the model,
+    key => cell region; value => spike threshold.
+    """
+    t_ref, responses_ref = reference
+    t_cand, responses_cand = candidate
+    duration = t_ref[-1] - t_ref[0]
+    metrics = {}
+    for cell_region, with_thresh in cell_regions.items():
+        v_ref = responses_ref[cell_region]
+        v_cand = responses_cand[cell_region]
+        spikes_ref = detect_spikes(t_ref, v_ref, with_thresh)[2]
+        spikes_cand = detect_spikes(t_cand, v_cand, with_thresh)[2]
+        n = min(len(spikes_ref), len(spikes_cand))
+        if n == 0:
+            spike_time = 0.0
+        else:
+            spike_time = np.max( np.abs(spikes_ref[:n] - spikes_cand[:n]) )
+        rate_ref = len(spikes_ref) / duration
+        rate_cand = len(spikes_cand) / duration
+        if rate_ref == 0:
+            rate = 0.0 if rate_cand == 0 else np.inf
+        else:
+            rate = abs(rate_cand - rate_ref) / rate_ref
+        vm_rms = np.sqrt( np.mean( (v_cand - np.interp(t_cand, t_ref, v_ref))**2 ) )
+        metrics[cell_region] = { "spike_count": abs(len(spikes_cand) - len(spikes_ref)),
+                                 "spike_time": float(spike_time),
+                                 "rate": float(rate),
+                                 "vm_rms": float(vm_rms) }
+    return metrics
+
+
+def is_within_tolerance(region_metrics, tolerance):
+    """
+    Use case: is_within_tolerance( compare_responses(...), default_tolerance )
+    """
+    for a_metric in region_metrics.values():
+        for name, limit in tolerance.items():
+            if limit is not None and a_metric[name] > limit:
+                return False
+    return True
+
+
+def recommend_timestep(reference_dt, metrics, tolerance):
+    """
+    Use case: recommend_timestep( 0.0125, {0.025: ..., 0.05: ...},
+                                  default_tolerance )
+    """
+    recommended_dt = reference_dt
+    for dt in sorted(metrics):
+        if not is_within_tolerance(metrics[dt], tolerance):
+            break
+        recommended_dt = dt
+    return recommended_dt
+
+
+def check_dt_convergence( model, protocol_name="02_spontaneous_fire",
+                          tolerance=None, reference_dt=0.0125,
+                          dt_ladder=(0.025, 0.05, 0.075, 0.1, 0.2),
+                          store=True ):
+    """
+    Use case: check_dt_convergence( pc, protocol_name="03_positive_current_inj",
+                                    tolerance={"spike_count": 0,
+                                               "spike_time": 0.2,
+                                               "rate": 0.01,
+                                               "vm_rms": None} )
+    Returns the "dt_convergence" entry also saved in the protocol json-file.
+    ------------------------------------
+    NB: the reference is simulated at reference_dt which must be smaller
+        than all of the dt_ladder. Protocols with capabilities (knockouts)
+        leave the model knocked out.
+    """
+    if tolerance is None:
+        tolerance = default_tolerance
+    protocol = load_protocol( model_scale=model.model_scale,
+                              model_name=model.model_name,
+                              protocol_name=protocol_name )
+    if reference_dt >= min(dt_ladder):
+        raise ValueError("reference_dt must be smaller than all dt in dt_ladder")
+    start_time = time.time()
+    results = run_dt_ladder(model, protocol, [reference_dt] + list(dt_ladder))
+    reference = results.pop(reference_dt)
+    metrics = collections.OrderedDict()
+    for dt, candidate in results.items():
+        metrics[dt] = compare_responses(reference, candidate, model.cell_regions)
+    recommended_dt = recommend_timestep(reference_dt, metrics, tolerance)
+    dt_convergence = collections.OrderedDict( [
+        ("recommended_dt", recommended_dt),
+        ("reference_dt", reference_dt),
+        ("tolerance", tolerance),
+        ("ladder", [ collections.OrderedDict( [
+                          ("dt", dt),
+                          ("passed", is_within_tolerance(metrics[dt], tolerance)),
+                          ("metrics", metrics[dt]) ] )
+                     for dt in metrics ]),
+        ("date", time.strftime("%d %B %Y")) ] )
+    print ("--- dt ladder in %s seconds ---" % (time.time() - start_time))
+    if store:
+        protocol["dt_convergence"] = dt_convergence
+        save_protocol( protocol, model_scale=model.model_scale,
+                       model_name=model.model_name )
+    return dt_convergence
+#
+#
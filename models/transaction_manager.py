@@ -0,0 +1,148 @@
+# =============================================================================
+# transaction_manager.py
+#
+# created  19 October 2026 Lungsi
+#
+# This py-file contains reversible changes of a live NEURON cell, initiated by
+#
+# from models import transaction_manager
+#
+# and individual transaction_manager initiated by:
+#
+# 1. transaction = transaction_manager.Transaction ( name="ko_AIS_channels" )
+#    note: A transaction makes changes to the cell AND keeps what it needs to
+#          undo them:
+#          transaction.set_range( sections, "gbar_Nav1_6", 0 )
+#          => the values at every segment of the sections are kept
+#          transaction.disconnect( section )
+#          => the parent section, the connection point and the orientation
+#             are kept
+#          transaction.undo() puts everything back, last change first, so
+#          the cell is the same as before the transaction without building
+#          it again. A transaction undone is empty and may be used again.
+#          As a context manager the changes are undone at the end:
+#          with Transaction() as transaction:
+#              transaction.set_range( pc.cell.dend, "pcabar_Cav2_1", 0 )
+#              pc.produce_voltage_response()
+#
+# 2. transaction_manager.TransactionStack ( on_topology_change=None )
+#    note: The transactions of a model, latest last. stack.undo(n) undoes the
+#          latest n transactions and stack.undo_all() all of them.
+#          on_topology_change (say, activating the multisplit again) is
+#          called after any disconnection or reconnection.
+#
+# =============================================================================
+
+from neuron import h
+
+
+class Transaction(object):
+    '''
+    Use case: transaction = Transaction( name="ko_Cav2_1_channels" )
+    transaction.set_range( [pc.cell.soma], "pcabar_Cav2_1", 0 )
+    transaction.undo()
+    '''
+    def __init__( self, name=None, on_topology_change=None ):
+        self.name = name
+        self.on_topology_change = on_topology_change
+        self.changes = [] # (kind, section, kept values), in order
+
+    def __enter__( self ):
+        return self
+
+    def __exit__( self, exc_type, exc_value, traceback ):
+        self.undo()
+        return False
+
+    def __len__( self ):
+        return len(self.changes)
+
+    def set_range( self, sections, range_variable, value ):
+        """
+        Use case: transaction.set_range( pc.cell.dend, "pcabar_Cav2_1", 0 )
+        sections is a section or a list of sections.
+        """
+        if not isinstance(sections, (list, tuple)):
+            sections = [sections]
+        for sec in sections:
+            kept = [ getattr(seg, range_variable) for seg in sec ]
+            self.changes.append( ("range", sec, (range_variable, kept)) )
+            setattr(sec, range_variable, value)
+
+    def disconnect( self, section ):
+        """
+        Use case: transaction.disconnect( pc.cell.dend[0] )
+        Nothing is kept (nor done) if the section has no parent.
+        """
+        if not h.SectionRef(sec=section).has_parent():
+            return
+        parent = h.SectionRef(sec=section).parent
+        kept = ( parent, h.parent_connection(sec=section),
+                 h.section_orientation(sec=section) )
+        self.changes.append( ("connection", section, kept) )
+        h.disconnect(sec=section)
+        self._topology_changed()
+
+    def _topology_changed( self ):
+        if self.on_topology_change is not None:
+            self.on_topology_change()
+
+    def undo( self ):
+        """
+        Use case: transaction.undo()
+        """
+        reconnected = False
+        while self.changes:
+            kind, sec, kept = self.changes.pop()
+            if kind == "range":
+                range_variable, values = kept
+                for seg, value in zip(sec, values):
+                    setattr(seg, range_variable, value)
+            else:
+                parent, parent_x, orientation = kept
+                sec.connect(parent, parent_x, orientation)
+                reconnected = True
+        if reconnected:
+            self._topology_changed()
+
+
+class TransactionStack(object):
+    '''
+    Use case: stack = TransactionStack()
+    transaction = stack.begin( "ko_AIS_channels" )
+    transaction.set_range( ... )
+    stack.undo()
+    '''
+    def __init__( self, on_topology_change=None ):
+        self.on_topology_change = on_topology_change
+        self.transactions = []
+
+    def __len__( self ):
+        return len(self.transactions)
+
+    def begin( self, name=None ):
+        transaction = Transaction( name=name,
+                                   on_topology_change=self.on_topology_change )
+        self.transactions.append(transaction)
+        return transaction
+
+    def names( self ):
+        return [ transaction.name for transaction in self.transactions ]
+
+    def undo( self, n=1 ):
+        """
+        Use case: stack.undo()  # the latest transaction
+                  stack.undo(2) # the latest two
+        Returns the names of the transactions undone.
+        """
+        undone = []
+        for i in range( min(n, len(self.transactions)) ):
+            transaction = self.transactions.pop()
+            transaction.undo()
+            undone.append(transaction.name)
+        return undone
+
+    def undo_all( self ):
+        return self.undo( len(self.transactions) )
+#
+#
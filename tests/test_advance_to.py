@@ -0,0 +1,41 @@
+# =============================================================================
+# test_advance_to.py
+#
+# created  19 October 2026 Lungsi
+#
+# PurkinjeCell.advance_to with stop criteria made for a segment starting
+# mid-run (about 30 s of simulation on one core).
+#
+# =============================================================================
+
+import pytest
+from neuron import h
+
+from models.cells.PC2015Masoli_model import PurkinjeCell
+from models.simulation_manager import stop_on_silence
+from models.simulation_manager import deactivate_multisplit
+
+
+@pytest.fixture
+def pc():
+    pc = PurkinjeCell()
+    yield pc
+    # the sections of other tests are not in the multisplit of the cell
+    deactivate_multisplit(h)
+
+
+def test_firing_cell_is_not_silent_from_mid_run(pc):
+    pc.set_simulation_properties( {"dt": 0.025, "celsius": 37,
+                                   "tstop": 80.0, "v_init": -65} )
+    # spikes at 8.8, ..., 27.8, 36.3, 47.8 (after the step, ISI ~11 ms),
+    # 55.5, ... (~220 Hz during the second step)
+    pc.add_stimuli( {"current1": {"amp": 1.0, "dur": 30.0, "delay": 0.0},
+                     "current2": {"amp": 1.0, "dur": 1e9, "delay": 55.0}} )
+    pc.advance_to(37.0)
+    # the segment has no spike in its first 10 ms chunk, nor any pause
+    # as long as the window
+    t = pc.advance_to( 80.0, stop_criteria=[stop_on_silence(window=20.0)] )
+    assert pc.predictions["truncated"] is False
+    assert abs(t - 80.0) < h.dt
+#
+#
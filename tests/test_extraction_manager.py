@@ -0,0 +1,107 @@
+# =============================================================================
+# test_extraction_manager.py
+#
+# created  19 October 2026 Lungsi
+#
+# The manifest of run_batch_extraction: new files are processed, unchanged
+# ones skipped, touched ones hashed (only they), deleted ones removed and
+# everything processed again with other settings.
+#
+# =============================================================================
+
+import os
+
+import numpy as np
+import pytest
+
+import models.extraction_manager as em
+
+
+def _write_trace(path, n_spikes):
+    time = 0.025 * np.arange(4000)
+    vm = -65.0 * np.ones_like(time)
+    for i in range(n_spikes):
+        vm[(i + 1) * 500 : (i + 1) * 500 + 40] = 20.0
+    np.savetxt(path, np.column_stack([time, vm]))
+
+
+@pytest.fixture
+def root(tmpdir):
+    _write_trace( os.path.join(str(tmpdir), "vm_soma.txt"), 3 )
+    _write_trace( os.path.join(str(tmpdir), "vm_NOR3.txt"), 5 )
+    return str(tmpdir)
+
+
+@pytest.fixture
+def hashed(monkeypatch):
+    hashed = []
+    file_sha1 = em.file_sha1
+    def counting_sha1(file_path):
+        hashed.append( os.path.basename(file_path) )
+        return file_sha1(file_path)
+    monkeypatch.setattr(em, "file_sha1", counting_sha1)
+    return hashed
+
+
+def _touch(path):
+    status = os.stat(path)
+    os.utime( path, (status.st_atime, status.st_mtime + 10.0) )
+
+
+def test_processed_then_skipped(root):
+    summary = em.run_batch_extraction(root, processes=1)
+    assert sorted(summary["processed"]) == ["vm_NOR3.txt", "vm_soma.txt"]
+    results = em._load_results( os.path.join(root, em.results_file_name) )
+    assert len(results["files"]["vm_soma.txt"]["spike_times"]) == 3
+    assert len(results["files"]["vm_NOR3.txt"]["spike_times"]) == 5
+    summary = em.run_batch_extraction(root, processes=1)
+    assert summary["processed"] == []
+    assert sorted(summary["skipped"]) == ["vm_NOR3.txt", "vm_soma.txt"]
+
+
+def test_only_touched_files_are_hashed(root, hashed):
+    em.run_batch_extraction(root, processes=1, use_hash=True)
+    del hashed[:]
+    _touch( os.path.join(root, "vm_soma.txt") )
+    summary = em.run_batch_extraction(root, processes=1, use_hash=True)
+    assert hashed == ["vm_soma.txt"]
+    assert sorted(summary["skipped"]) == ["vm_NOR3.txt", "vm_soma.txt"]
+    # the new mtime is kept, so the file is not hashed again
+    del hashed[:]
+    em.run_batch_extraction(root, processes=1, use_hash=True)
+    assert hashed == []
+
+
+def test_touched_without_hash_or_changed_are_processed(root):
+    em.run_batch_extraction(root, processes=1, use_hash=True)
+    _touch( os.path.join(root, "vm_soma.txt") )
+    summary = em.run_batch_extraction(root, processes=1)
+    assert summary["processed"] == ["vm_soma.txt"]
+    _write_trace( os.path.join(root, "vm_NOR3.txt"), 4 )
+    _touch( os.path.join(root, "vm_NOR3.txt") )
+    summary = em.run_batch_extraction(root, processes=1, use_hash=True)
+    assert summary["processed"] == ["vm_NOR3.txt"]
+
+
+def test_removed(root):
+    em.run_batch_extraction(root, processes=1)
+    os.remove( os.path.join(root, "vm_NOR3.txt") )
+    summary = em.run_batch_extraction(root, processes=1)
+    assert summary["removed"] == ["vm_NOR3.txt"]
+    assert summary["skipped"] == ["vm_soma.txt"]
+    results = em._load_results( os.path.join(root, em.results_file_name) )
+    assert list(results["files"]) == ["vm_soma.txt"]
+
+
+def test_other_settings_are_processed(root):
+    em.run_batch_extraction(root, processes=1)
+    summary = em.run_batch_extraction( root, processes=1,
+                                       cell_regions={"vm_soma": -20.0,
+                                                     "vm_NOR3": 0.0} )
+    assert sorted(summary["processed"]) == ["vm_NOR3.txt", "vm_soma.txt"]
+    summary = em.run_batch_extraction( root, processes=1,
+                                       cell_regions={"vm_soma": -20.0,
+                                                     "vm_NOR3": 0.0} )
+    assert summary["processed"] == []
+#
+#
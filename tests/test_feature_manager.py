@@ -0,0 +1,91 @@
+# =============================================================================
+# test_feature_manager.py
+#
+# created  19 October 2026 Lungsi
+#
+# extract_features on synthetic traces: Gaussian spikes of known times on a
+# flat baseline and a hyperpolarizing step with a known sag.
+#
+# =============================================================================
+
+import numpy as np
+
+from models.feature_manager import detect_spikes
+from models.feature_manager import extract_features
+
+
+dt = 0.025
+time = np.arange(0.0, 200.0 + dt/2, dt)
+v_rest = -65.0
+v_peak = 30.0
+sigma = 0.3 # ms, the spike is a Gaussian of full width 2.355*sigma
+
+
+def spike_train(spike_times):
+    vm = np.full(len(time), v_rest)
+    for t_spike in spike_times:
+        vm += (v_peak - v_rest) * np.exp( -0.5 * ((time - t_spike) / sigma)**2 )
+    return vm
+
+
+def test_detect_spikes_interpolates_the_crossing():
+    trace_ids, indices, spike_times = detect_spikes(time, spike_train([50.0]))
+    # v(t) = 0 at t = 50 - sigma*sqrt(2 log(95/65))
+    expected = 50.0 - sigma * np.sqrt( 2.0 * np.log( (v_peak - v_rest) / -v_rest ) )
+    assert list(trace_ids) == [0]
+    assert abs(spike_times[0] - expected) < 0.01
+
+
+def test_spike_count_isi_and_cv():
+    volts = np.vstack([ spike_train([50.0, 70.0, 100.0]),
+                        spike_train([20.0, 40.0, 60.0, 80.0]) ])
+    features = extract_features(time, volts)
+    np.testing.assert_array_equal( features["spike_count"], [3, 4] )
+    np.testing.assert_allclose( features["rate"], [15.0, 20.0] )
+    np.testing.assert_allclose( features["mean_isi"], [25.0, 20.0], atol=1e-9 )
+    # ISIs 20 and 30 ms: std 5 ms, mean 25 ms
+    np.testing.assert_allclose( features["isi_cv"], [0.2, 0.0], atol=1e-6 )
+    np.testing.assert_array_equal( features["n_bursts"], [0, 0] )
+
+
+def test_action_potential_shape():
+    features = extract_features( time, spike_train([50.0, 100.0]) )
+    assert v_rest <= features["ap_threshold"][0] < v_rest + 5.0
+    assert abs( features["ap_amplitude"][0]
+                - (v_peak - features["ap_threshold"][0]) ) < 0.1
+    assert abs( features["ap_width"][0] - 2.355 * sigma ) < 0.05
+    assert abs( features["ahp_depth"][0] - (features["ap_threshold"][0] - v_rest) ) < 0.1
+
+
+def test_no_spike():
+    features = extract_features( time, np.full(len(time), v_rest) )
+    assert features["spike_count"][0] == 0
+    assert features["rate"][0] == 0.0
+    for name in ("mean_isi", "isi_cv", "ap_threshold", "ap_amplitude",
+                 "ap_width", "ahp_depth", "burst_fraction"):
+        assert np.isnan(features[name][0]), name
+
+
+def test_one_spike():
+    features = extract_features( time, spike_train([100.0]) )
+    assert features["spike_count"][0] == 1
+    assert np.isnan(features["mean_isi"][0])
+    assert np.isnan(features["isi_cv"][0])
+    assert abs( features["ap_amplitude"][0]
+                - (v_peak - features["ap_threshold"][0]) ) < 0.1
+
+
+def test_sag_of_a_hyperpolarizing_step():
+    # -65 mV, then from 100 to 180 ms down to -80 mV (at 120 ms) and back
+    # up to a steady -75 mV: sag_ratio = (-75 + 80) / (-65 + 80)
+    during = (time >= 100.0) & (time < 180.0)
+    vm = np.full(len(time), v_rest)
+    vm[during] = -75.0 - 5.0 * np.exp( -((time[during] - 120.0) / 5.0)**2 )
+    features = extract_features( time, vm, stimulus=(100.0, 180.0),
+                                 parameters={"sag_window": 20.0} )
+    np.testing.assert_allclose( features["v_baseline"], [-65.0] )
+    np.testing.assert_allclose( features["v_steady_state"], [-75.0], atol=1e-6 )
+    np.testing.assert_allclose( features["sag_ratio"], [1.0 / 3.0], atol=1e-6 )
+    assert features["spike_count"][0] == 0
+#
+#
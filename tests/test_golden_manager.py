@@ -0,0 +1,207 @@
+# =============================================================================
+# test_golden_manager.py
+#
+# created  19 October 2026 Lungsi
+#
+# The golden-trace check on synthetic goldens: record, load, compare and
+# report, with the runs of the model replaced by synthetic responses.
+#
+# =============================================================================
+
+import os
+
+import numpy as np
+import pytest
+
+from models import golden_manager as gm
+
+
+dt = 0.025
+tstop = 400.0
+time = np.arange(0.0, tstop + dt/2, dt)
+cell_regions = {"vm_soma": 0.0, "vm_NOR3": -20.0}
+protocol = { "name": "synthetic",
+             "setup_parameters": {"dt": dt, "celsius": 37, "tstop": tstop,
+                                  "v_init": -65},
+             "current_parameters": {
+                 "current1": {"amp": 0.5, "dur": 200, "delay": 100},
+                 "current2": {"amp": 1.0, "dur": 200, "delay": 300} },
+             "capabilities": [] }
+
+
+def spike_train(spike_times, v_rest=-65.0, v_peak=30.0, sigma=0.3):
+    vm = np.full(len(time), v_rest)
+    for t_spike in spike_times:
+        vm += (v_peak - v_rest) * np.exp( -0.5 * ((time - t_spike) / sigma)**2 )
+    return vm
+
+
+def responses_of(spike_times):
+    return { "vm_soma": spike_train(spike_times),
+             "vm_NOR3": spike_train(spike_times, v_peak=10.0) }
+
+
+golden_spikes = [120.0, 150.0, 180.0, 210.0, 240.0, 270.0]
+
+
+class SyntheticModel(object):
+    model_scale = "cells"
+    model_name = "synthetic"
+    def __init__(self, spike_times):
+        self.cell_regions = cell_regions
+        self.spike_times = spike_times
+    def undo(self, n):
+        pass
+
+
+@pytest.fixture
+def golden_dir(tmpdir, monkeypatch):
+    monkeypatch.setattr( gm, "get_golden_dir_path",
+                         lambda model_scale=None, model_name=None, suite=None:
+                             os.path.join(str(tmpdir), suite or "") )
+    monkeypatch.setattr( gm, "load_protocol",
+                         lambda model_scale=None, model_name=None,
+                                protocol_name=None: dict(protocol) )
+    monkeypatch.setattr( gm, "_run",
+                         lambda model, protocol: ( (time, responses_of(model.spike_times)),
+                                                   0.5 ) )
+    return str(tmpdir)
+
+
+def test_record_and_load(golden_dir):
+    recorded = gm.record_golden( SyntheticModel(golden_spikes), "synthetic" )
+    assert gm.get_available_goldens() == ["synthetic"]
+    golden = gm.load_golden(protocol_name="synthetic")
+    assert golden["protocol"] == protocol
+    np.testing.assert_allclose( golden["spike_times"]["vm_soma"],
+                                recorded["spike_times"]["vm_soma"] )
+    assert len(golden["spike_times"]["vm_soma"]) == 6
+    # decimated to 0.5 ms and within max_error mV
+    np.testing.assert_allclose( golden["traces"]["time"], time[::20] )
+    assert np.max( np.abs(golden["traces"]["vm_soma"]
+                          - responses_of(golden_spikes)["vm_soma"][::20]) ) <= 0.01
+    # the epoch of current2 ends after tstop
+    assert sorted(golden["features"]["vm_soma"]) == ["current1", "trace"]
+    assert golden["features"]["vm_soma"]["current1"]["rate"] == pytest.approx(30.0)
+
+
+def test_unchanged_responses_pass(golden_dir):
+    gm.record_golden( SyntheticModel(golden_spikes), "synthetic" )
+    golden = gm.load_golden(protocol_name="synthetic")
+    result = gm.compare_to_golden( golden, time, responses_of(golden_spikes),
+                                   cell_regions )
+    assert result["passed"] and result["failed"] == []
+    for cell_region in cell_regions:
+        metrics = result["metrics"][cell_region]
+        assert metrics["spike_count"] == 0
+        assert metrics["spike_time"] < 1e-9
+        assert metrics["vm_max"] <= 0.01
+        assert metrics["feature"] < 1e-9
+
+
+def test_shifted_spikes_fail(golden_dir):
+    gm.record_golden( SyntheticModel(golden_spikes), "synthetic" )
+    golden = gm.load_golden(protocol_name="synthetic")
+    shifted = [ t + 1.0 for t in golden_spikes ]
+    result = gm.compare_to_golden( golden, time, responses_of(shifted),
+                                   cell_regions )
+    assert not result["passed"]
+    assert "vm_soma spike_time" in result["failed"]
+    assert "vm_soma spike_count" not in result["failed"]
+    assert result["drift"]["vm_soma"]["spike_shift"] == pytest.approx(1.0)
+    # within a looser tolerance it passes
+    loose = dict(gm.default_tolerance, spike_time=1.5, vm_rms=20.0, feature=1.0)
+    assert gm.compare_to_golden( golden, time, responses_of(shifted),
+                                 cell_regions, loose )["passed"]
+
+
+def test_missing_spike_fails(golden_dir):
+    gm.record_golden( SyntheticModel(golden_spikes), "synthetic" )
+    golden = gm.load_golden(protocol_name="synthetic")
+    result = gm.compare_to_golden( golden, time, responses_of(golden_spikes[:-1]),
+                                   cell_regions )
+    assert "vm_soma spike_count" in result["failed"]
+    assert result["metrics"]["vm_soma"]["spike_count"] == 1
+    assert "vm_soma feature" in result["failed"]
+
+
+def test_silent_golden(golden_dir):
+    # undefined features (NaN) are stored as null and match each other
+    gm.record_golden( SyntheticModel([]), "synthetic" )
+    golden = gm.load_golden(protocol_name="synthetic")
+    assert golden["features"]["vm_soma"]["trace"]["isi_cv"] is None
+    assert gm.compare_to_golden( golden, time, responses_of([]),
+                                 cell_regions )["passed"]
+    result = gm.compare_to_golden( golden, time, responses_of([200.0]),
+                                   cell_regions )
+    assert result["metrics"]["vm_soma"]["feature"] == np.inf
+    assert "vm_soma spike_count" in result["failed"]
+
+
+def test_check_golden_and_report(golden_dir):
+    gm.record_golden( SyntheticModel(golden_spikes), "synthetic" )
+    report = gm.check_goldens( SyntheticModel(golden_spikes) )
+    assert report["synthetic"]["passed"]
+    assert not report["synthetic"]["protocol_changed"]
+    assert report["synthetic"]["time"] == 0.5
+    lines = gm.format_report(report).splitlines()
+    assert lines[0].split() == ["synthetic", "PASS", "(0.5", "s)"]
+    assert len(lines) == 3
+    report = gm.check_goldens( SyntheticModel(golden_spikes[:-1]) )
+    first_line = gm.format_report(report).splitlines()[0]
+    assert "FAIL" in first_line and "vm_soma spike_count" in first_line
+
+
+def test_protocol_changed(golden_dir, monkeypatch):
+    gm.record_golden( SyntheticModel(golden_spikes), "synthetic", tstop=300.0 )
+    changed = dict(protocol, capabilities=["ko_Cav2_1_channels"])
+    monkeypatch.setattr( gm, "load_protocol",
+                         lambda model_scale=None, model_name=None,
+                                protocol_name=None: changed )
+    report = gm.check_goldens( SyntheticModel(golden_spikes) )
+    assert report["synthetic"]["protocol_changed"]
+    assert "[protocol changed]" in gm.format_report(report)
+
+
+def test_tables_and_thresholds_of_the_golden(golden_dir, monkeypatch):
+    tables = {"Nav1_6": 1}
+    def set_tables(enabled):
+        previous = dict(tables)
+        tables.update(enabled)
+        return previous
+    monkeypatch.setattr(gm, "set_tables", set_tables)
+    monkeypatch.setattr( gm, "_table_states",
+                         lambda enabled: {"Nav1_6": 1 if enabled else 0} )
+    tables_of_runs = []
+    def run(model, protocol):
+        tables_of_runs.append( dict(tables) )
+        return (time, responses_of(model.spike_times)), 0.5
+    monkeypatch.setattr(gm, "_run", run)
+    gm.record_golden( SyntheticModel(golden_spikes), "synthetic" )
+    golden = gm.load_golden(protocol_name="synthetic")
+    assert golden["usetable"] == {"Nav1_6": 0} # the exact rates
+    assert golden["cell_regions"] == cell_regions
+    assert len(golden["spike_times"]["vm_NOR3"]) == 6
+    # the check runs with the tables and thresholds of the golden
+    model = SyntheticModel(golden_spikes)
+    model.cell_regions = {"vm_soma": 0.0, "vm_NOR3": 50.0}
+    assert gm.check_golden(model, "synthetic")["passed"]
+    assert tables_of_runs == [{"Nav1_6": 0}, {"Nav1_6": 0}]
+    assert tables == {"Nav1_6": 1}
+
+
+def test_suites(golden_dir):
+    gm.record_golden( SyntheticModel(golden_spikes), "synthetic", tstop=300.0,
+                      suite=gm.fast_suite )
+    assert gm.get_available_goldens() == []
+    assert gm.get_available_goldens(suite=gm.fast_suite) == ["synthetic"]
+    report = gm.check_goldens( SyntheticModel(golden_spikes), suite=gm.fast_suite )
+    assert report["synthetic"]["passed"]
+
+
+def test_tstop_only_cuts_short():
+    assert gm._protocol_as_run(protocol, 300.0)["setup_parameters"]["tstop"] == 300.0
+    assert gm._protocol_as_run(protocol, 900.0)["setup_parameters"]["tstop"] == tstop
+    assert protocol["setup_parameters"]["tstop"] == tstop
+#
+#
@@ -0,0 +1,49 @@
+# =============================================================================
+# test_implicit_time.py
+#
+# created  19 October 2026 Lungsi
+#
+# The implicit time axis keeps the dt of the initialization and refuses a
+# recording during which dt was changed.
+#
+# =============================================================================
+
+import numpy as np
+import pytest
+from neuron import h
+
+from models.cells.PC2015Masoli_model import PurkinjeCell
+from models.simulation_manager import get_time_axis
+from models.simulation_manager import get_recorded_time
+from models.simulation_manager import deactivate_multisplit
+
+
+@pytest.fixture
+def pc():
+    pc = PurkinjeCell()
+    pc.set_implicit_time()
+    pc.set_simulation_properties( {"dt": 0.025, "celsius": 37,
+                                   "tstop": 2.0, "v_init": -65} )
+    yield pc
+    pc.set_implicit_time(False)
+    # the sections of other tests are not in the multisplit of the cell
+    deactivate_multisplit(h)
+
+
+def test_dt_of_the_initialization(pc):
+    h.stdinit()
+    h.continuerun(2.0)
+    h.dt = 0.05 # after the run, not used by the recording
+    assert get_time_axis(pc) == {"t0": 0.0, "dt": 0.025, "n": 81}
+    np.testing.assert_allclose( get_recorded_time(pc), 0.025 * np.arange(81) )
+
+
+def test_dt_changed_mid_run(pc):
+    h.stdinit()
+    h.continuerun(1.0)
+    h.dt = 0.05
+    h.continuerun(2.0)
+    with pytest.raises(ValueError):
+        get_time_axis(pc)
+#
+#
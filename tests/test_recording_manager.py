@@ -0,0 +1,109 @@
+# =============================================================================
+# test_recording_manager.py
+#
+# created  19 October 2026 Lungsi
+#
+# SpatialRecorder keeps sampling when the run goes on past the h.tstop of
+# the initialization.
+#
+# =============================================================================
+
+import os
+import gc
+import weakref
+
+from neuron import h
+import numpy as np
+
+from models.recording_manager import SpatialRecorder
+from models.recording_manager import RegionRecorder
+
+
+def _sections():
+    h.load_file("stdrun.hoc")
+    sections = [ h.Section(name="test_recorder_%d" % i) for i in range(2) ]
+    sections[1].connect(sections[0], 1, 0)
+    sections[0].nseg = 3
+    for sec in sections:
+        sec.insert("pas")
+    clamp = h.IClamp(0.5, sec=sections[0])
+    clamp.delay = 1.0
+    clamp.dur = 100.0
+    clamp.amp = 0.1
+    return sections, clamp
+
+
+def _run_past_tstop(recorder, sections):
+    vm = h.Vector()
+    vm.record(sections[1](0.5)._ref_v, recorder.interval)
+    h.dt = 0.025
+    h.tstop = 5.0
+    h.stdinit()
+    h.continuerun(5.0)
+    h.continuerun(22.0) # past the buffer allocated for h.tstop
+    return np.array(vm)
+
+
+def test_buffer_grows_past_tstop():
+    sections, clamp = _sections()
+    recorder = SpatialRecorder(sections, interval=0.5)
+    vm = _run_past_tstop(recorder, sections)
+    assert recorder.n_recorded == 45
+    assert recorder.data.shape == (45, 4)
+    np.testing.assert_allclose( recorder.time, 0.5 * np.arange(45) )
+    np.testing.assert_allclose( recorder.data[:44, 3], vm[:44] )
+
+
+def test_memmap_buffer_grows_past_tstop(tmpdir):
+    sections, clamp = _sections()
+    path = os.path.join(str(tmpdir), "recording.dat")
+    recorder = SpatialRecorder(sections, interval=0.5, memmap_path=path)
+    vm = _run_past_tstop(recorder, sections)
+    assert recorder.n_recorded == 45
+    np.testing.assert_allclose( recorder.data[:44, 3], vm[:44] )
+    assert os.path.getsize(path) >= 45 * 4 * 8
+
+
+def test_closed_recorder_stops_sampling():
+    sections, clamp = _sections()
+    recorder = SpatialRecorder(sections, interval=0.5)
+    _run_past_tstop(recorder, sections)
+    recorder.close()
+    data = recorder.data.copy()
+    h.stdinit()
+    h.continuerun(10.0)
+    np.testing.assert_array_equal( recorder.data, data )
+    reference = weakref.ref(recorder)
+    del recorder
+    gc.collect()
+    assert reference() is None
+
+
+def test_closed_region_recorder_stops_sampling():
+    sections, clamp = _sections()
+    recorder = RegionRecorder(sections, [[0], [0, 1]], interval=0.5,
+                              names=["soma", "all"])
+    _run_past_tstop(recorder, sections)
+    assert recorder.data.shape == (45, 2)
+    recorder.close()
+    column = recorder.column("all").copy()
+    h.stdinit()
+    h.continuerun(10.0)
+    np.testing.assert_array_equal( recorder.column("all"), column )
+    reference = weakref.ref(recorder)
+    del recorder
+    gc.collect()
+    assert reference() is None
+
+
+def test_recorder_closed_mid_run():
+    sections, clamp = _sections()
+    recorder = SpatialRecorder(sections, interval=0.5)
+    h.tstop = 10.0
+    h.stdinit()
+    h.continuerun(5.0)
+    recorder.close() # the pending sampling event is dropped
+    h.continuerun(10.0)
+    assert recorder.n_recorded == 11
+#
+#
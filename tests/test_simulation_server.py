@@ -0,0 +1,85 @@
+# =============================================================================
+# test_simulation_server.py
+#
+# created  19 October 2026 Lungsi
+#
+# The server with a stand-in model: capabilities not kept as transactions
+# are refused, the capabilities of a failed run are undone and a worker
+# that dies is replaced while its request fails.
+#
+# =============================================================================
+
+import os
+
+import pytest
+
+from models.simulation_server import SimulationServer
+from models.simulation_server import RequestError
+from models.simulation_server import handle_request
+
+
+class FakeModel(object):
+    '''
+    Stand-in for PurkinjeCell; the stimulation always fails.
+    '''
+    model_scale = "cells"
+    model_name = "PC2015Masoli"
+
+    def __init__( self ):
+        self.transactions = []
+
+    def set_pc_param( self, parameters ):
+        if "crash" in parameters:
+            os._exit(3) # as a segmentation fault in NEURON would
+
+    def set_simulation_properties( self, setup_parameters ):
+        pass
+
+    def ko_AIS_channels( self ):
+        self.transactions.append("ko_AIS_channels")
+
+    def reset( self ):
+        pass
+
+    def set_stimulation_properties( self, current_parameters ):
+        raise RuntimeError("stimulation failed")
+
+    def undo( self, n=1 ):
+        return [ self.transactions.pop() for i in range(n) ]
+
+
+def _protocol( capabilities ):
+    return { "setup_parameters": {"dt": 0.025, "celsius": 37.0, "tstop": 10.0,
+                                  "v_init": -65.0},
+             "capabilities": capabilities,
+             "current_parameters": {} }
+
+
+def test_capability_not_allowed():
+    model = FakeModel()
+    with pytest.raises(RequestError):
+        handle_request( model, {"protocol": _protocol(["reset"])} )
+
+
+def test_failed_run_is_undone():
+    model = FakeModel()
+    model.transactions.append("kept") # applied before the request
+    with pytest.raises(RuntimeError):
+        handle_request( model, {"protocol": _protocol(["ko_AIS_channels"])} )
+    assert model.transactions == ["kept"]
+
+
+def test_dead_worker_is_replaced():
+    server = SimulationServer( n_workers=1, model_factory=FakeModel,
+                               poll_interval=0.1 )
+    try:
+        reply = server.submit( {"protocol": _protocol([]),
+                                "parameters": {"crash": 1}} )
+        assert "died" in reply["error"]
+        reply = server.submit( {"protocol": _protocol(["reset"])} )
+        assert "not allowed" in reply["error"]
+        assert server.status()["alive"] == 1
+    finally:
+        server.shutdown()
+#
+#
@@ -0,0 +1,101 @@
+# =============================================================================
+# test_stop_monitor.py
+#
+# created  19 October 2026 Lungsi
+#
+# A closed StopMonitor is collected and no longer stops later runs.
+#
+# =============================================================================
+
+import gc
+import weakref
+
+from neuron import h
+
+from models.simulation_manager import StopMonitor
+from models.simulation_manager import stop_after_n_spikes
+from models.simulation_manager import stop_on_silence
+from models.simulation_manager import stop_on_depolarization_block
+from models.simulation_manager import continue_with_stop_criteria
+from models.simulation_manager import initialize_and_run_NEURON_model as irNm
+
+
+def _spiking_section(amp=1.0, dur=100.0):
+    h.celsius = 6.3 # hh fires at 0.1 nA, whatever model ran before
+    section = h.Section(name="test_stop_monitor")
+    section.insert("hh")
+    section.L = section.diam = 10
+    clamp = h.IClamp(0.5, sec=section)
+    clamp.delay = 1.0
+    clamp.dur = dur
+    clamp.amp = amp
+    vm = h.Vector()
+    vm.record(section(0.5)._ref_v)
+    return section, clamp, vm
+
+
+def test_closed_monitor_releases_the_run():
+    h.load_file("stdrun.hoc")
+    section, clamp, vm = _spiking_section()
+    h.tstop = 50.0
+    monitor = StopMonitor(h, section, vm, [stop_after_n_spikes(1)])
+    try:
+        assert irNm(h, monitor=monitor) == "n_spikes"
+        assert h.t < h.tstop
+    finally:
+        monitor.close()
+    reference = weakref.ref(monitor)
+    del monitor
+    gc.collect()
+    assert reference() is None
+    irNm(h)
+    assert abs(h.t - h.tstop) < h.dt
+
+
+def _continue_with_late_monitor(section, vm, criterion, t_start, t_stop):
+    # the run goes on without a monitor up to t_start (> the window)
+    h.tstop = t_stop
+    h.stdinit()
+    h.continuerun(t_start)
+    monitor = StopMonitor(h, section, vm, [criterion])
+    try:
+        assert monitor.t_start == h.t
+        return continue_with_stop_criteria(h, monitor, t_stop)
+    finally:
+        monitor.close()
+
+
+def test_silence_counts_from_a_late_monitor():
+    h.load_file("stdrun.hoc")
+    # firing all along: a monitor made at 600 ms sees no silence
+    section, clamp, vm = _spiking_section(amp=0.1, dur=1e9)
+    reason = _continue_with_late_monitor( section, vm,
+                                          stop_on_silence(window=500.0),
+                                          600.0, 1200.0 )
+    assert reason is None
+    assert abs(h.t - 1200.0) < h.dt
+    # silent: the monitor waits a whole window from 600 ms
+    clamp.amp = 0.0
+    reason = _continue_with_late_monitor( section, vm,
+                                          stop_on_silence(window=500.0),
+                                          600.0, 1200.0 )
+    assert reason == "silence"
+    assert 1100.0 < h.t <= 1120.0
+
+
+def test_depolarization_block_counts_from_a_late_monitor():
+    h.load_file("stdrun.hoc")
+    section = h.Section(name="test_stop_monitor_block")
+    section.insert("pas")
+    section.e_pas = -30.0 # depolarized, no spikes
+    vm = h.Vector()
+    vm.record(section(0.5)._ref_v)
+    h.v_init = -30.0
+    reason = _continue_with_late_monitor( section, vm,
+                                          stop_on_depolarization_block(window=50.0),
+                                          600.0, 1200.0 )
+    h.v_init = -65.0
+    assert reason == "depolarization_block"
+    assert 650.0 <= h.t <= 670.0
+#
+#
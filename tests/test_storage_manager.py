@@ -0,0 +1,126 @@
+# =============================================================================
+# test_storage_manager.py
+#
+# created  19 October 2026 Lungsi
+#
+# Round trips of the trace codec: lossless float32/float64, the error bound
+# of the quantized traces, start:stop across chunks and empty traces.
+#
+# =============================================================================
+
+import os
+
+import numpy as np
+import pytest
+
+from models.storage_manager import save_traces
+from models.storage_manager import load_traces
+from models.storage_manager import iter_chunks
+from models.storage_manager import read_header
+
+
+chunk_size = 1000
+n_samples = 5500 # five full chunks and a partial one
+
+
+def _traces():
+    rng = np.random.RandomState(0)
+    time = 0.025 * np.arange(n_samples)
+    vm = ( -60.0 + 20.0 * np.sin(2.0 * np.pi * time / 25.0)
+           + rng.normal(0.0, 0.5, n_samples) )
+    noise = rng.normal(0.0, 1e6, n_samples) # full-width residuals
+    return {"time": time, "vm_soma": vm, "noise": noise}
+
+
+def test_lossless_float32(tmpdir):
+    traces = _traces()
+    path = save_traces( os.path.join(str(tmpdir), "a.trc"), traces,
+                        dtype="float32", chunk_size=chunk_size )
+    loaded = load_traces(path)
+    assert sorted(loaded) == sorted(traces)
+    for name, values in traces.items():
+        assert loaded[name].dtype == np.float32
+        np.testing.assert_array_equal( loaded[name], values.astype(np.float32) )
+
+
+def test_lossless_float64(tmpdir):
+    traces = _traces()
+    path = save_traces( os.path.join(str(tmpdir), "a.trc"), traces,
+                        dtype="float64", chunk_size=chunk_size )
+    loaded = load_traces(path)
+    for name, values in traces.items():
+        assert loaded[name].dtype == np.float64
+        np.testing.assert_array_equal( loaded[name], values )
+
+
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+@pytest.mark.parametrize("max_error", [0.1, 0.01, 0.001])
+def test_quantized_error_bound(tmpdir, dtype, max_error):
+    traces = _traces()
+    path = save_traces( os.path.join(str(tmpdir), "a.trc"), traces,
+                        max_error={"vm_soma": max_error},
+                        dtype={"time": "float64", "vm_soma": dtype},
+                        chunk_size=chunk_size )
+    loaded = load_traces(path, ["time", "vm_soma"])
+    np.testing.assert_array_equal( loaded["time"], traces["time"] )
+    error = np.max( np.abs(loaded["vm_soma"] - traces["vm_soma"]) )
+    assert error <= max_error
+    header = read_header(path)["traces"]["vm_soma"]
+    assert header["mode"] == "quantized"
+    assert abs(header["measured_error"] - error) <= 1e-12
+
+
+def test_quantized_max_error_too_small(tmpdir):
+    with pytest.raises(ValueError):
+        save_traces( os.path.join(str(tmpdir), "a.trc"),
+                     {"vm_soma": np.full(10, 1e6)}, max_error=1e-3 )
+
+
+def test_numpy_max_error(tmpdir):
+    # numpy scalars in the header would not be json-able
+    traces = _traces()
+    path = save_traces( os.path.join(str(tmpdir), "a.trc"), traces,
+                        max_error={"vm_soma": np.float32(0.01)},
+                        chunk_size=chunk_size )
+    header = read_header(path)["traces"]["vm_soma"]
+    assert isinstance(header["step"], float)
+    error = np.max( np.abs(load_traces(path)["vm_soma"] - traces["vm_soma"]) )
+    assert error <= header["max_error"]
+
+
+@pytest.mark.parametrize("start, stop", [ (0, None), (950, 3050),
+                                          (1000, 2000), (999, 1001),
+                                          (5400, None), (5000, 9000),
+                                          (3000, 3000), (6000, None) ])
+def test_slicing_across_chunks(tmpdir, start, stop):
+    traces = _traces()
+    path = save_traces( os.path.join(str(tmpdir), "a.trc"), traces,
+                        max_error={"vm_soma": 0.01}, dtype="float64",
+                        chunk_size=chunk_size )
+    everything = load_traces(path)
+    part = load_traces(path, start=start, stop=stop)
+    for name in traces:
+        np.testing.assert_array_equal( part[name], everything[name][start:stop] )
+
+
+def test_iter_chunks(tmpdir):
+    traces = _traces()
+    path = save_traces( os.path.join(str(tmpdir), "a.trc"), traces,
+                        chunk_size=chunk_size )
+    chunks = list( iter_chunks(path, "vm_soma") )
+    assert [ len(chunk) for chunk in chunks ] == [1000] * 5 + [500]
+    np.testing.assert_array_equal( np.concatenate(chunks),
+                                   load_traces(path)["vm_soma"] )
+
+
+@pytest.mark.parametrize("max_error", [None, 0.01])
+def test_empty_trace(tmpdir, max_error):
+    path = save_traces( os.path.join(str(tmpdir), "a.trc"),
+                        {"vm_soma": np.empty(0)}, max_error=max_error )
+    loaded = load_traces(path)
+    assert loaded["vm_soma"].shape == (0,)
+    assert loaded["vm_soma"].dtype == np.float32
+    assert load_traces(path, start=10, stop=20)["vm_soma"].shape == (0,)
+    assert list( iter_chunks(path, "vm_soma") ) == []
+#
+#